@@ -0,0 +1,35 @@
+# Generated by Django 6.0.2 on 2026-10-16 23:40
+
+from django.conf import settings
+from django.db import migrations
+
+INDEX_NAME = "accounts_user_email_lower_idx"
+
+
+def _user_table(apps):
+    return apps.get_model(*settings.AUTH_USER_MODEL.split("."))._meta.db_table
+
+
+def create_email_lower_index(apps, schema_editor):
+    quote = schema_editor.quote_name
+    schema_editor.execute(
+        f"CREATE INDEX {quote(INDEX_NAME)} ON {quote(_user_table(apps))} (LOWER({quote('email')}))"
+    )
+
+
+def drop_email_lower_index(apps, schema_editor):
+    schema_editor.execute(f"DROP INDEX {schema_editor.quote_name(INDEX_NAME)}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        # Last auth migration: on SQLite later AlterFields rebuild auth_user
+        # and would silently drop the expression index.
+        ('auth', '0012_alter_user_first_name_max_length'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(create_email_lower_index, drop_email_lower_index),
+    ]
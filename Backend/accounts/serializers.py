@@ -1,5 +1,8 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer as BaseTokenObtainPairSerializer
+
+from invitations.services import link_pending_invitations
 
 User = get_user_model()
 
@@ -20,4 +23,13 @@ class RegisterSerializer(serializers.ModelSerializer):
         read_only_fields = ("id",)
 
     def create(self, validated_data):
-        return User.objects.create_user(**validated_data)
+        user = User.objects.create_user(**validated_data)
+        link_pending_invitations(user)
+        return user
+
+
+class TokenObtainPairSerializer(BaseTokenObtainPairSerializer):
+    def validate(self, attrs):
+        data = super().validate(attrs)
+        link_pending_invitations(self.user)
+        return data
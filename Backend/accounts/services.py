@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from django.contrib.auth import get_user_model
+from django.db.models.functions import Lower
+
+User = get_user_model()
+
+
+def normalize_email(email: str | None) -> str:
+    """Canonical form used for every email-based lookup (matches the LOWER(email) index)."""
+    return (email or "").strip().lower()
+
+
+def user_ids_by_email(emails) -> dict[str, list[int]]:
+    result: dict[str, list[int]] = {}
+    emails = {normalize_email(email) for email in emails} - {""}
+    if not emails:
+        return result
+    rows = (
+        User.objects.annotate(email_lower=Lower("email"))
+        .filter(email_lower__in=emails)
+        .values_list("id", "email_lower")
+    )
+    for user_id, email in rows:
+        result.setdefault(email, []).append(user_id)
+    return result
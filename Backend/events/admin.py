@@ -8,6 +8,8 @@ from events.models import (
     Document,
     Event,
     EventImage,
+    EventMembership,
+    EventOccurrenceOverride,
     Participation,
     Reaction,
 )
@@ -28,6 +30,20 @@ class ParticipationAdmin(admin.ModelAdmin):
     raw_id_fields = ("event", "user")
 
 
+@admin.register(EventMembership)
+class EventMembershipAdmin(admin.ModelAdmin):
+    list_display = ("id", "event", "user", "access_kind", "valid_until", "updated_at")
+    list_filter = ("access_kind",)
+    raw_id_fields = ("event", "user")
+
+
+@admin.register(EventOccurrenceOverride)
+class EventOccurrenceOverrideAdmin(admin.ModelAdmin):
+    list_display = ("id", "event", "original_start", "cancelled", "starts_at", "updated_at")
+    list_filter = ("cancelled",)
+    raw_id_fields = ("event",)
+
+
 @admin.register(ContributionItem)
 class ContributionItemAdmin(admin.ModelAdmin):
     list_display = ("id", "event", "participation", "item_name", "quantity")
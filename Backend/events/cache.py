@@ -0,0 +1,100 @@
+"""
+Per-event cache helpers on top of the configured ``CACHES`` backend.
+
+Cached entries are stamped with a per-event namespace version; bumping the
+version invalidates every entry of that namespace for the event at once,
+which also covers keys we cannot enumerate (e.g. one per user).
+"""
+
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils import timezone
+
+ACCESS_NAMESPACE = "access"
+CUSTOM_FIELD_SUMMARY_NAMESPACE = "custom-field-summary"
+CONTRIBUTION_ROLLUP_NAMESPACE = "contribution-rollup"
+CUSTOM_FIELD_DEFINITIONS_NAMESPACE = "custom-field-definitions"
+
+# Cached access kind of a user without access to the event.
+NO_ACCESS = ""
+
+
+def _version_key(namespace: str, event_id: int) -> str:
+    return f"hive:event:{event_id}:{namespace}:version"
+
+
+def _entry_key(namespace: str, event_id: int, name: str) -> str:
+    return f"hive:event:{event_id}:{namespace}:{name}"
+
+
+def _access_key(event_id: int, user_id: int) -> str:
+    return f"hive:event:{event_id}:access-kind:{user_id}"
+
+
+def _new_version() -> int:
+    # Time-based so a version key evicted from the cache never comes back
+    # with a value that older entries were stamped with.
+    return time.time_ns()
+
+
+def get_event_cache_version(namespace: str, event_id: int) -> int:
+    key = _version_key(namespace, event_id)
+    version = cache.get(key)
+    if version is None:
+        version = _new_version()
+        if not cache.add(key, version, timeout=None):
+            version = cache.get(key, version)
+    return version
+
+
+def bump_event_cache_version(namespace: str, event_id: int) -> None:
+    """Invalidate a namespace now and again once the surrounding transaction commits."""
+
+    def bump():
+        cache.set(_version_key(namespace, event_id), _new_version(), timeout=None)
+
+    bump()
+    transaction.on_commit(bump)
+
+
+def get_cached_event_access(event_id: int, user_id: int) -> str | None:
+    """The cached EventAccessKind, ``NO_ACCESS`` when denied, or None on a miss."""
+    version_key = _version_key(ACCESS_NAMESPACE, event_id)
+    access_key = _access_key(event_id, user_id)
+    values = cache.get_many([version_key, access_key])
+    entry = values.get(access_key)
+    if entry is None or version_key not in values:
+        return None
+    version, access_kind = entry
+    if version != values[version_key]:
+        return None
+    return access_kind
+
+
+def store_event_access(event_id: int, user_id: int, access_kind: str, valid_until=None) -> None:
+    timeout = settings.EVENT_ACCESS_CACHE_TIMEOUT
+    if valid_until is not None:
+        timeout = min(timeout, int((valid_until - timezone.now()).total_seconds()))
+    if timeout <= 0:
+        return
+    version = get_event_cache_version(ACCESS_NAMESPACE, event_id)
+    cache.set(_access_key(event_id, user_id), (version, access_kind), timeout=timeout)
+
+
+def get_cached_event_value(namespace: str, event_id: int, name: str = "default"):
+    """Return the cached value, or None when it is missing or from an older version."""
+    version_key = _version_key(namespace, event_id)
+    entry_key = _entry_key(namespace, event_id, name)
+    values = cache.get_many([version_key, entry_key])
+    entry = values.get(entry_key)
+    if entry is None or version_key not in values or entry[0] != values[version_key]:
+        return None
+    return entry[1]
+
+
+def store_event_value(namespace: str, event_id: int, value, timeout: int, name: str = "default") -> None:
+    version = get_event_cache_version(namespace, event_id)
+    cache.set(_entry_key(namespace, event_id, name), (version, value), timeout=timeout)
@@ -0,0 +1,120 @@
+"""
+Compiled custom field schemas for answer validation.
+
+Validating a form needs every definition of the event. Definition rows are
+cached in the shared cache under ``Event.custom_fields_version`` and compiled
+into one validator per key once per process, so saving answers runs no
+definition query and enum checks are frozenset lookups. Definitions written
+without signals (``bulk_create``, raw SQL) must bump the version by hand.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from django.conf import settings
+from rest_framework.exceptions import ValidationError
+
+from events.cache import CUSTOM_FIELD_DEFINITIONS_NAMESPACE, get_cached_event_value, store_event_value
+from events.models import CustomFieldDefinition, CustomFieldType
+
+_DEFINITION_COLUMNS = ("id", "key", "field_type", "required", "options")
+_MAX_COMPILED_SCHEMAS = 1024
+_compiled: dict[tuple[int, int], dict[str, CompiledField]] = {}
+
+
+@dataclass(frozen=True)
+class CompiledField:
+    id: int
+    key: str
+    validate: Callable[[Any], Any]
+
+
+def _type_check(row: dict[str, Any]) -> Callable[[Any], str | None]:
+    """Return a callable giving the error message for a non-null value, if any."""
+    field_type = row["field_type"]
+    if field_type == CustomFieldType.TEXT:
+        required = row["required"]
+
+        def check(value):
+            if not isinstance(value, str):
+                return "Expected a string value."
+            if required and value.strip() == "":
+                return "This field is required."
+            return None
+
+    elif field_type == CustomFieldType.NUMBER:
+
+        def check(value):
+            if isinstance(value, bool) or not isinstance(value, (int, float)):
+                return "Expected a numeric value."
+            return None
+
+    elif field_type == CustomFieldType.BOOL:
+
+        def check(value):
+            return None if isinstance(value, bool) else "Expected a boolean value."
+
+    elif field_type == CustomFieldType.ENUM:
+        options = frozenset(option for option in row["options"] if isinstance(option, str))
+
+        def check(value):
+            if not isinstance(value, str):
+                return "Expected a string option value."
+            if value not in options:
+                return "Value is not in allowed options."
+            return None
+
+    else:
+
+        def check(value):
+            return "Unsupported custom field type."
+
+    return check
+
+
+def compile_field(row: dict[str, Any]) -> CompiledField:
+    key, required = row["key"], row["required"]
+    check = _type_check(row)
+
+    def validate(value):
+        if value is None:
+            if required:
+                raise ValidationError({key: "This field is required."})
+            return None
+        error = check(value)
+        if error is not None:
+            raise ValidationError({key: error})
+        return value
+
+    return CompiledField(row["id"], key, validate)
+
+
+def get_field_schema(event) -> dict[str, CompiledField]:
+    """The event's compiled fields by key, for its current definitions version."""
+    version = event.custom_fields_version
+    schema = _compiled.get((event.id, version))
+    if schema is not None:
+        return schema
+
+    cache_name = f"v{version}"
+    rows = get_cached_event_value(CUSTOM_FIELD_DEFINITIONS_NAMESPACE, event.id, cache_name)
+    if rows is None:
+        rows = list(CustomFieldDefinition.objects.filter(event_id=event.id).values(*_DEFINITION_COLUMNS))
+        store_event_value(
+            CUSTOM_FIELD_DEFINITIONS_NAMESPACE,
+            event.id,
+            rows,
+            settings.CUSTOM_FIELD_DEFINITIONS_CACHE_TIMEOUT,
+            cache_name,
+        )
+    schema = {row["key"]: compile_field(row) for row in rows}
+    if len(_compiled) >= _MAX_COMPILED_SCHEMAS:
+        _compiled.clear()
+    _compiled[(event.id, version)] = schema
+    return schema
+
+
+def clear_compiled_schemas() -> None:
+    _compiled.clear()
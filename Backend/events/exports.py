@@ -0,0 +1,104 @@
+"""
+Streaming participant exports.
+
+Rows are read with ``.iterator(chunk_size=...)`` (a server-side cursor on
+PostgreSQL) and rendered chunk by chunk, so memory stays flat and the first
+bytes leave before the last rows are read. Note that the generator runs after
+the view has returned, i.e. outside the ATOMIC_REQUESTS transaction.
+"""
+
+import csv
+import io
+import json
+from itertools import islice
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+
+from events.models import CustomFieldDefinition, Participation
+from events.serializers import participation_rows, participation_values
+
+CSV = "csv"
+NDJSON = "ndjson"
+CONTENT_TYPES = {
+    CSV: "text/csv; charset=utf-8",
+    NDJSON: "application/x-ndjson",
+}
+
+_FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+_BASE_COLUMNS = (
+    "participation_id",
+    "user_id",
+    "username",
+    "email",
+    "rsvp_status",
+    "plus_one_count",
+    "allergies",
+    "notes",
+    "contributions",
+)
+
+
+def _chunks(event):
+    queryset = participation_values(Participation.objects.filter(event=event).order_by("id"))
+    rows = queryset.iterator(chunk_size=settings.PARTICIPANT_EXPORT_CHUNK_SIZE)
+    while chunk := list(islice(rows, settings.PARTICIPANT_EXPORT_CHUNK_SIZE)):
+        yield participation_rows(chunk)
+
+
+def _csv_line(values) -> str:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerow(values)
+    return buffer.getvalue()
+
+
+def _iter_csv(event, definition_keys):
+    yield _csv_line([*_BASE_COLUMNS, *(_csv_cell(key) for key in definition_keys)])
+    for chunk in _chunks(event):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        for row in chunk:
+            answers = {answer["definition_key"]: answer["value"] for answer in row["custom_field_values"]}
+            contributions = "; ".join(
+                f"{item['quantity']} x {item['item_name']}" for item in row["contributions"]
+            )
+            cells = [
+                row["id"],
+                row["user"]["id"],
+                row["user"]["username"],
+                row["user"]["email"],
+                row["rsvp_status"],
+                row["plus_one_count"],
+                row["allergies"],
+                row["notes"],
+                contributions,
+                *(answers.get(key) for key in definition_keys),
+            ]
+            writer.writerow([_csv_cell(cell) for cell in cells])
+        yield buffer.getvalue()
+
+
+def _csv_cell(value):
+    if value is None:
+        return ""
+    if isinstance(value, (list, dict)):
+        return json.dumps(value)
+    if isinstance(value, str) and value.startswith(_FORMULA_PREFIXES):
+        # Guest-entered text must not run as a spreadsheet formula.
+        return "'" + value
+    return value
+
+
+def _iter_ndjson(event):
+    for chunk in _chunks(event):
+        yield "".join(json.dumps(row, cls=DjangoJSONEncoder) + "\n" for row in chunk)
+
+
+def iter_participant_export(event, output: str):
+    """Yield the export of ``event``'s participants as text chunks."""
+    if output == NDJSON:
+        return _iter_ndjson(event)
+    definition_keys = list(
+        CustomFieldDefinition.objects.filter(event=event).order_by("position", "id").values_list("key", flat=True)
+    )
+    return _iter_csv(event, definition_keys)
@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from events.models import Event
+from events.services import sync_event_memberships
+
+
+class Command(BaseCommand):
+    help = "Rebuild the EventMembership access table from owners, participations and invitations."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--event", type=int, action="append", dest="event_ids", help="Limit to event id(s).")
+
+    def handle(self, *args, **options):
+        events = Event.objects.only("id", "owner_id").order_by("id")
+        if options["event_ids"]:
+            events = events.filter(id__in=options["event_ids"])
+
+        processed = 0
+        for event in events.iterator(chunk_size=500):
+            sync_event_memberships(event)
+            processed += 1
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt memberships for {processed} event(s)."))
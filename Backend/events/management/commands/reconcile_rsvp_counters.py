@@ -0,0 +1,14 @@
+from django.core.management.base import BaseCommand
+
+from events.services import reconcile_rsvp_counters
+
+
+class Command(BaseCommand):
+    help = "Recompute the denormalized RSVP counters on Event from Participation rows."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--event", type=int, action="append", dest="event_ids", help="Limit to event id(s).")
+
+    def handle(self, *args, **options):
+        corrected = reconcile_rsvp_counters(options["event_ids"])
+        self.stdout.write(self.style.SUCCESS(f"Corrected RSVP counters for {corrected} event(s)."))
@@ -0,0 +1,85 @@
+# Generated by Django 6.0.2 on 2026-10-16 23:19
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models.functions import Lower
+from django.utils import timezone
+
+
+def backfill_memberships(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    Participation = apps.get_model("events", "Participation")
+    EventMembership = apps.get_model("events", "EventMembership")
+    Invitation = apps.get_model("invitations", "Invitation")
+    User = apps.get_model(*settings.AUTH_USER_MODEL.split("."))
+
+    rank = {"owner": 0, "participant": 1, "invitee": 2}
+    access = {}
+
+    def grant(event_id, user_id, kind, valid_until=None):
+        key = (event_id, user_id)
+        current = access.get(key)
+        if current is None or rank[kind] < rank[current[0]]:
+            access[key] = (kind, valid_until)
+        elif current[0] == kind and current[1] is not None:
+            access[key] = (kind, None if valid_until is None else max(current[1], valid_until))
+
+    for event_id, owner_id in Event.objects.values_list("id", "owner_id"):
+        grant(event_id, owner_id, "owner")
+    for event_id, user_id in Participation.objects.values_list("event_id", "user_id"):
+        grant(event_id, user_id, "participant")
+
+    now = timezone.now()
+    users_by_email = {}
+    for user_id, email in User.objects.annotate(email_lower=Lower("email")).values_list("id", "email_lower"):
+        if email:
+            users_by_email.setdefault(email, []).append(user_id)
+    invitations = Invitation.objects.filter(status__in=("accepted", "pending")).values_list(
+        "event_id", "invitee_user_id", "invitee_email", "status", "expires_at"
+    )
+    for event_id, invitee_user_id, invitee_email, status, expires_at in invitations:
+        if status == "pending" and expires_at < now:
+            continue
+        valid_until = None if status == "accepted" else expires_at
+        targets = set(users_by_email.get((invitee_email or "").lower(), []))
+        if invitee_user_id:
+            targets.add(invitee_user_id)
+        for user_id in targets:
+            grant(event_id, user_id, "invitee", valid_until)
+
+    EventMembership.objects.bulk_create(
+        [
+            EventMembership(event_id=event_id, user_id=user_id, access_kind=kind, valid_until=valid_until)
+            for (event_id, user_id), (kind, valid_until) in access.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0002_event_description_comment_document_eventimage_and_more'),
+        ('invitations', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EventMembership',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('access_kind', models.CharField(choices=[('owner', 'Owner'), ('participant', 'Participant'), ('invitee', 'Invitee')], max_length=16)),
+                ('valid_until', models.DateTimeField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('event', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='memberships', to='events.event')),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='event_memberships', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['user', 'valid_until', 'event'], name='events_even_user_id_1ccd07_idx')],
+                'constraints': [models.UniqueConstraint(fields=('event', 'user'), name='uniq_membership_event_user')],
+            },
+        ),
+        migrations.RunPython(backfill_memberships, migrations.RunPython.noop),
+    ]
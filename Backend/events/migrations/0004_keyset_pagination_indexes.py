@@ -0,0 +1,55 @@
+# Generated by Django 6.0.2 on 2026-10-16 23:52
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0003_eventmembership'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='comment',
+            name='events_comm_event_i_11cf88_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='document',
+            name='events_docu_event_i_ac2837_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='event',
+            name='events_even_starts__b01102_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='eventimage',
+            name='events_even_event_i_5f1573_idx',
+        ),
+        migrations.AddIndex(
+            model_name='comment',
+            index=models.Index(fields=['event', 'created_at', 'id'], name='events_comm_event_i_02aa09_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='contributionitem',
+            index=models.Index(fields=['event', 'id'], name='events_cont_event_i_5ad3c8_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='document',
+            index=models.Index(fields=['event', 'created_at', 'id'], name='events_docu_event_i_2b461c_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['starts_at', 'id'], name='events_even_starts__91f224_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='eventimage',
+            index=models.Index(fields=['event', 'created_at', 'id'], name='events_even_event_i_1018ef_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='participation',
+            index=models.Index(fields=['event', 'id'], name='events_part_event_i_c35d69_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# Generated by Django 6.0.2 on 2026-10-17 00:05
+
+from django.db import migrations
+
+# The column is maintained by PostgreSQL itself and is not declared on the
+# model; events.search.EventSearchFilter reads it. Other backends skip it and
+# use substring search instead.
+ADD_SEARCH_VECTOR = """
+ALTER TABLE events_event ADD COLUMN search_vector tsvector GENERATED ALWAYS AS (
+    setweight(to_tsvector('simple'::regconfig, coalesce(title, '')), 'A')
+    || setweight(to_tsvector('simple'::regconfig, coalesce(location, '')), 'B')
+    || setweight(to_tsvector('simple'::regconfig, coalesce(description, '')), 'C')
+) STORED;
+CREATE INDEX events_event_search_vector_gin ON events_event USING gin (search_vector);
+"""
+
+DROP_SEARCH_VECTOR = """
+DROP INDEX IF EXISTS events_event_search_vector_gin;
+ALTER TABLE events_event DROP COLUMN IF EXISTS search_vector;
+"""
+
+
+def add_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(ADD_SEARCH_VECTOR)
+
+
+def drop_search_vector(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_SEARCH_VECTOR)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0004_keyset_pagination_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(add_search_vector, drop_search_vector),
+    ]
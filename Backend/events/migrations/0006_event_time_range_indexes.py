@@ -0,0 +1,37 @@
+# Generated by Django 6.0.2 on 2026-10-17 00:40
+
+from django.db import migrations, models
+
+# events.services.events_in_range filters on exactly this expression, so the
+# two must change together. Other backends use the (starts_at, ends_at) btree.
+ADD_TIME_RANGE_INDEX = """
+CREATE INDEX events_event_time_range_gist ON events_event
+USING gist (tstzrange(starts_at, COALESCE(ends_at, starts_at), '[]'));
+"""
+
+DROP_TIME_RANGE_INDEX = "DROP INDEX IF EXISTS events_event_time_range_gist;"
+
+
+def add_time_range_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(ADD_TIME_RANGE_INDEX)
+
+
+def drop_time_range_index(apps, schema_editor):
+    if schema_editor.connection.vendor == "postgresql":
+        schema_editor.execute(DROP_TIME_RANGE_INDEX)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0005_event_search_vector'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='event',
+            index=models.Index(fields=['starts_at', 'ends_at'], name='events_even_starts__3365d7_idx'),
+        ),
+        migrations.RunPython(add_time_range_index, drop_time_range_index),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 6.0.2 on 2026-10-17 01:10
+
+from django.db import migrations, models
+from django.db.models import Count, OuterRef, Q, Subquery, Sum, Value
+from django.db.models.functions import Coalesce
+
+
+def backfill_rsvp_counters(apps, schema_editor):
+    Event = apps.get_model("events", "Event")
+    Participation = apps.get_model("events", "Participation")
+
+    def aggregate(expression):
+        rows = (
+            Participation.objects.filter(event=OuterRef("pk"))
+            .order_by()
+            .values("event")
+            .annotate(total=expression)
+            .values("total")
+        )
+        return Coalesce(Subquery(rows), Value(0))
+
+    Event.objects.update(
+        accepted_count=aggregate(Count("id", filter=Q(rsvp_status="accepted"))),
+        pending_count=aggregate(Count("id", filter=Q(rsvp_status="pending"))),
+        declined_count=aggregate(Count("id", filter=Q(rsvp_status="declined"))),
+        plus_one_total=aggregate(Sum("plus_one_count", filter=Q(rsvp_status="accepted"))),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0006_event_time_range_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='accepted_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='declined_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='pending_count',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name='event',
+            name='plus_one_total',
+            field=models.PositiveIntegerField(default=0, editable=False, help_text='Sum of plus_one_count over accepted participations.'),
+        ),
+        migrations.RunPython(backfill_rsvp_counters, migrations.RunPython.noop),
+    ]
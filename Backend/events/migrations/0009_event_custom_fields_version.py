@@ -0,0 +1,18 @@
+# Generated by Django 6.0.2 on 2026-10-17 03:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('events', '0008_event_recurrence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='event',
+            name='custom_fields_version',
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+    ]
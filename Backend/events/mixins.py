@@ -0,0 +1,34 @@
+from django.http import Http404
+
+from events.services import ensure_event_access, ensure_event_owner, resolve_event_for_user
+
+
+# Resolves the ``/events/<pk>/...`` event and the caller's access kind once
+# per request and memoizes them as ``request.hive_event`` and
+# ``request.hive_event_role``. Kept as a comment rather than a docstring so it
+# does not leak into the OpenAPI description of every view using the mixin.
+class EventContextMixin:
+    event_url_kwarg = "pk"
+
+    def get_event(self):
+        request = self.request
+        event = getattr(request, "hive_event", None)
+        if event is None:
+            event = resolve_event_for_user(self.kwargs[self.event_url_kwarg], request.user)
+            if event is None:
+                raise Http404("No Event matches the given query.")
+            # Stored on the underlying HttpRequest; DRF's Request proxies reads to it.
+            http_request = getattr(request, "_request", request)
+            http_request.hive_event = event
+            http_request.hive_event_role = event.access_kind
+        return event
+
+    def get_member_event(self):
+        event = self.get_event()
+        ensure_event_access(event, self.request.user)
+        return event
+
+    def get_owned_event(self):
+        event = self.get_event()
+        ensure_event_owner(event, self.request.user)
+        return event
@@ -3,6 +3,14 @@ from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import F, Q
 
+from events import recurrence
+
+
+class RecurrenceFrequency(models.TextChoices):
+    DAILY = recurrence.DAILY, "Daily"
+    WEEKLY = recurrence.WEEKLY, "Weekly"
+    MONTHLY = recurrence.MONTHLY, "Monthly"
+
 
 class Event(models.Model):
     owner = models.ForeignKey(
@@ -17,6 +25,29 @@ class Event(models.Model):
     ends_at = models.DateTimeField(blank=True, null=True)
     dresscode = models.CharField(max_length=255, blank=True)
     metadata = models.JSONField(default=dict, blank=True)
+    recurrence_frequency = models.CharField(
+        max_length=16,
+        choices=RecurrenceFrequency.choices,
+        blank=True,
+        help_text="Leave blank for a one-off event.",
+    )
+    recurrence_interval = models.PositiveSmallIntegerField(default=1)
+    recurrence_until = models.DateTimeField(blank=True, null=True)
+    recurrence_count = models.PositiveIntegerField(blank=True, null=True)
+    # End of the last occurrence (NULL for open-ended series); kept by save().
+    recurrence_ends_at = models.DateTimeField(blank=True, null=True, editable=False)
+    # Denormalized from Participation: events.signals counts created and deleted
+    # rows, events.services.adjust_rsvp_counters applies status changes.
+    accepted_count = models.PositiveIntegerField(default=0, editable=False)
+    pending_count = models.PositiveIntegerField(default=0, editable=False)
+    declined_count = models.PositiveIntegerField(default=0, editable=False)
+    plus_one_total = models.PositiveIntegerField(
+        default=0,
+        editable=False,
+        help_text="Sum of plus_one_count over accepted participations.",
+    )
+    # Bumped by events.signals whenever a CustomFieldDefinition changes.
+    custom_fields_version = models.PositiveIntegerField(default=0, editable=False)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
@@ -30,13 +61,65 @@ class Event(models.Model):
         ]
         indexes = [
             models.Index(fields=("owner",)),
-            models.Index(fields=("starts_at",)),
+            models.Index(fields=("starts_at", "id")),
+            models.Index(fields=("starts_at", "ends_at")),
+            models.Index(
+                fields=("recurrence_ends_at", "starts_at"),
+                condition=~Q(recurrence_frequency=""),
+                name="events_event_recurring_idx",
+            ),
         ]
 
+    # Maintained with F() updates elsewhere; a full save() of an instance
+    # loaded earlier must not write back stale values.
+    DENORMALIZED_FIELDS = (
+        "accepted_count",
+        "pending_count",
+        "declined_count",
+        "plus_one_total",
+        "custom_fields_version",
+    )
+
+    def save(self, *args, **kwargs):
+        self.recurrence_ends_at = recurrence.series_ends_at(self)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "recurrence_ends_at"}
+        elif not self._state.adding and not kwargs.get("force_insert"):
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in self.DENORMALIZED_FIELDS
+            ]
+        super().save(*args, **kwargs)
+
     def __str__(self):
         return self.title or f"Event @ {self.location} ({self.starts_at.isoformat()})"
 
 
+class EventOccurrenceOverride(models.Model):
+    """A single changed or cancelled occurrence of a recurring event."""
+
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="occurrence_overrides")
+    original_start = models.DateTimeField()
+    cancelled = models.BooleanField(default=False)
+    starts_at = models.DateTimeField(blank=True, null=True)
+    ends_at = models.DateTimeField(blank=True, null=True)
+    title = models.CharField(max_length=255, blank=True)
+    location = models.CharField(max_length=255, blank=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        ordering = ("event_id", "original_start")
+        constraints = [
+            models.UniqueConstraint(fields=("event", "original_start"), name="uniq_occurrence_override"),
+        ]
+
+    def __str__(self):
+        return f"Override({self.event_id}, {self.original_start.isoformat()})"
+
+
 class RSVPStatus(models.TextChoices):
     PENDING = "pending", "Pending"
     ACCEPTED = "accepted", "Accepted"
@@ -69,6 +152,7 @@ class Participation(models.Model):
         ]
         indexes = [
             models.Index(fields=("event", "rsvp_status")),
+            models.Index(fields=("event", "id")),
             models.Index(fields=("user",)),
         ]
 
@@ -76,6 +160,39 @@ class Participation(models.Model):
         return f"{self.user_id}:{self.event_id}:{self.rsvp_status}"
 
 
+class EventAccessKind(models.TextChoices):
+    OWNER = "owner", "Owner"
+    PARTICIPANT = "participant", "Participant"
+    INVITEE = "invitee", "Invitee"
+
+
+class EventMembership(models.Model):
+    """
+    Denormalized (event, user) access row used by the event list.
+    Holds the strongest access kind per user; valid_until is only set for
+    memberships backed solely by a pending invitation.
+    """
+
+    event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="memberships")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name="event_memberships",
+    )
+    access_kind = models.CharField(max_length=16, choices=EventAccessKind.choices)
+    valid_until = models.DateTimeField(blank=True, null=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=("event", "user"), name="uniq_membership_event_user")
+        ]
+        indexes = [models.Index(fields=("user", "valid_until", "event"))]
+
+    def __str__(self):
+        return f"{self.user_id}:{self.event_id}:{self.access_kind}"
+
+
 class ContributionItem(models.Model):
     event = models.ForeignKey(Event, on_delete=models.CASCADE, related_name="contributions")
     participation = models.ForeignKey(
@@ -91,7 +208,10 @@ class ContributionItem(models.Model):
 
     class Meta:
         ordering = ("event_id", "item_name")
-        indexes = [models.Index(fields=("event", "participation"))]
+        indexes = [
+            models.Index(fields=("event", "participation")),
+            models.Index(fields=("event", "id")),
+        ]
         constraints = [
             models.CheckConstraint(name="contribution_positive_quantity", condition=Q(quantity__gt=0))
         ]
@@ -219,7 +339,7 @@ class Comment(models.Model):
     class Meta:
         ordering = ("created_at",)
         indexes = [
-            models.Index(fields=("event",)),
+            models.Index(fields=("event", "created_at", "id")),
             models.Index(fields=("event", "parent")),
         ]
 
@@ -277,7 +397,7 @@ class Document(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
-        indexes = [models.Index(fields=("event",))]
+        indexes = [models.Index(fields=("event", "created_at", "id"))]
 
     def __str__(self):
         return self.title or self.file.name
@@ -307,7 +427,7 @@ class EventImage(models.Model):
 
     class Meta:
         ordering = ("-created_at",)
-        indexes = [models.Index(fields=("event",))]
+        indexes = [models.Index(fields=("event", "created_at", "id"))]
 
     def __str__(self):
         return self.caption or self.image.name
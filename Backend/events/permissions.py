@@ -24,5 +24,7 @@ class IsEventMemberOrOwner(BasePermission):
 
     def has_object_permission(self, request, view, obj):
         if isinstance(obj, Event):
+            if getattr(request, "hive_event", None) is obj:
+                return request.hive_event_role is not None
             return can_user_access_event(obj, request.user)
         return False
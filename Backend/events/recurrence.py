@@ -0,0 +1,191 @@
+"""
+Lazy expansion of recurring events.
+
+A recurring series is stored as one Event row plus optional
+EventOccurrenceOverride rows; occurrences only exist while a window is being
+expanded. Rules repeat on the wall clock of ``settings.TIME_ZONE`` so a
+weekly 19:00 meetup stays at 19:00 across DST changes. Monthly rules keep the
+day of month and clamp it to the last day of shorter months.
+"""
+
+from __future__ import annotations
+
+import calendar
+import heapq
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Iterable, Iterator
+
+from django.utils import timezone
+
+DAILY = "daily"
+WEEKLY = "weekly"
+MONTHLY = "monthly"
+
+# Keeps a single step well inside datetime's range; series_ends_at raises
+# ValueError/OverflowError for series that still run past the year 9999.
+MAX_INTERVAL = 999
+
+# Upper bound of one step per unit of interval, DST shifts included. Used to
+# jump close to a window without walking the series from its first occurrence.
+_MAX_STEP = {
+    DAILY: timedelta(days=1, hours=1),
+    WEEKLY: timedelta(days=7, hours=1),
+    MONTHLY: timedelta(days=31, hours=1),
+}
+
+
+@dataclass(frozen=True)
+class Occurrence:
+    event: object
+    original_start: datetime | None
+    starts_at: datetime
+    ends_at: datetime | None
+    title: str
+    location: str
+
+    @property
+    def id(self):
+        return self.event.id
+
+
+def is_recurring(event) -> bool:
+    return bool(event.recurrence_frequency)
+
+
+def _duration(event) -> timedelta | None:
+    return event.ends_at - event.starts_at if event.ends_at else None
+
+
+def _max_step(event) -> timedelta:
+    return _MAX_STEP[event.recurrence_frequency] * event.recurrence_interval
+
+
+def nth_start(event, index: int) -> datetime:
+    """Start of the ``index``-th occurrence, ignoring count/until limits."""
+    tz = timezone.get_default_timezone()
+    local = timezone.localtime(event.starts_at, tz).replace(tzinfo=None)
+    steps = index * event.recurrence_interval
+    if event.recurrence_frequency == DAILY:
+        naive = local + timedelta(days=steps)
+    elif event.recurrence_frequency == WEEKLY:
+        naive = local + timedelta(weeks=steps)
+    else:
+        months = local.month - 1 + steps
+        year, month = local.year + months // 12, months % 12 + 1
+        naive = local.replace(year=year, month=month, day=min(local.day, calendar.monthrange(year, month)[1]))
+    return timezone.make_aware(naive, tz)
+
+
+def iter_starts(event, since: datetime | None = None) -> Iterator[datetime]:
+    """
+    Occurrence starts in order, honouring ``recurrence_count`` and
+    ``recurrence_until``. With ``since``, expansion begins just before it
+    instead of at the first occurrence. Unbounded series never stop.
+    """
+    index = 0
+    if since is not None and since > event.starts_at:
+        index = int((since - event.starts_at) / _max_step(event))
+    while event.recurrence_count is None or index < event.recurrence_count:
+        start = nth_start(event, index)
+        if event.recurrence_until is not None and start > event.recurrence_until:
+            return
+        yield start
+        index += 1
+
+
+def is_occurrence_start(event, moment: datetime) -> bool:
+    if not is_recurring(event):
+        return moment == event.starts_at
+    for start in iter_starts(event, since=moment):
+        if start >= moment:
+            return start == moment
+    return False
+
+
+def series_ends_at(event) -> datetime | None:
+    """End of the last occurrence, or None for a series without an end."""
+    if not is_recurring(event):
+        return None
+    duration = _duration(event) or timedelta(0)
+    if event.recurrence_count is not None:
+        return nth_start(event, max(event.recurrence_count - 1, 0)) + duration
+    if event.recurrence_until is None:
+        return None
+    last = event.starts_at
+    for start in iter_starts(event, since=event.recurrence_until - _max_step(event)):
+        last = start
+    return last + duration
+
+
+def _overlaps(occurrence: Occurrence, start: datetime, end: datetime | None) -> bool:
+    if end is not None and occurrence.starts_at >= end:
+        return False
+    return (occurrence.ends_at or occurrence.starts_at) >= start
+
+
+def _build(event, original_start, override, duration) -> Occurrence:
+    starts_at = original_start
+    ends_at = original_start + duration if duration is not None else None
+    title, location = event.title, event.location
+    if override is not None:
+        if override.starts_at is not None:
+            starts_at = override.starts_at
+            ends_at = starts_at + duration if duration is not None else None
+        if override.ends_at is not None:
+            ends_at = override.ends_at
+        title = override.title or title
+        location = override.location or location
+    return Occurrence(event, original_start, starts_at, ends_at, title, location)
+
+
+def iter_occurrences(event, start: datetime, end: datetime | None = None, overrides: Iterable = ()) -> Iterator[Occurrence]:
+    """
+    Occurrences of ``event`` overlapping [start, end), ordered by start and
+    generated lazily; ``end=None`` walks an unbounded series indefinitely.
+    ``overrides`` are the event's EventOccurrenceOverride rows: cancelled
+    occurrences are skipped and moved ones appear at their new time.
+    """
+    if not is_recurring(event):
+        single = Occurrence(event, None, event.starts_at, event.ends_at, event.title, event.location)
+        if _overlaps(single, start, end):
+            yield single
+        return
+
+    duration = _duration(event)
+    by_original = {override.original_start: override for override in overrides}
+    moved = []
+    for override in by_original.values():
+        if override.cancelled or override.starts_at is None:
+            continue
+        if not is_occurrence_start(event, override.original_start):
+            continue
+        occurrence = _build(event, override.original_start, override, duration)
+        if _overlaps(occurrence, start, end):
+            moved.append((occurrence.starts_at, occurrence.original_start, occurrence))
+    heapq.heapify(moved)
+
+    for original_start in iter_starts(event, since=start - (duration or timedelta(0))):
+        if end is not None and original_start >= end:
+            break
+        while moved and moved[0][0] <= original_start:
+            yield heapq.heappop(moved)[-1]
+        override = by_original.get(original_start)
+        if override is not None and (override.cancelled or override.starts_at is not None):
+            continue
+        occurrence = _build(event, original_start, override, duration)
+        if _overlaps(occurrence, start, end):
+            yield occurrence
+    while moved:
+        yield heapq.heappop(moved)[-1]
+
+
+def next_occurrence(event, after: datetime, overrides: Iterable = ()) -> Occurrence | None:
+    """The first occurrence still running at or starting after ``after``."""
+    return next(iter_occurrences(event, after, overrides=overrides), None)
+
+
+def next_start(event, after: datetime, overrides: Iterable = ()) -> datetime | None:
+    """Start of ``next_occurrence``, or None once the event or series is over."""
+    occurrence = next_occurrence(event, after, overrides)
+    return occurrence.starts_at if occurrence else None
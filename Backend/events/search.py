@@ -0,0 +1,50 @@
+from django.db import connections
+from django.db.models import F
+from django.db.models.expressions import RawSQL
+from rest_framework.filters import OrderingFilter, SearchFilter
+
+# Must match the configuration baked into the generated search_vector column
+# (see migration 0005_event_search_vector).
+SEARCH_CONFIG = "simple"
+
+
+class EventSearchFilter(SearchFilter):
+    """
+    Ranked full-text search over the weighted ``search_vector`` column on
+    PostgreSQL (title A, location B, description C, GIN indexed). Other
+    backends fall back to DRF's substring search over ``search_fields``.
+    """
+
+    ranked_ordering = ("-search_rank", "starts_at", "id")
+
+    def is_ranked(self, request, queryset) -> bool:
+        return (
+            connections[queryset.db].vendor == "postgresql"
+            and bool(self.get_search_terms(request))
+            and not request.query_params.get(OrderingFilter.ordering_param)
+        )
+
+    def get_cursor_ordering(self, request, queryset, view):
+        # Keyset pages keep the rank order instead of the view's cursor_ordering.
+        return self.ranked_ordering if self.is_ranked(request, queryset) else None
+
+    def filter_queryset(self, request, queryset, view):
+        if connections[queryset.db].vendor != "postgresql":
+            return super().filter_queryset(request, queryset, view)
+
+        terms = " ".join(self.get_search_terms(request))
+        if not terms:
+            return queryset
+
+        from django.contrib.postgres.search import SearchQuery, SearchRank, SearchVectorField
+
+        query = SearchQuery(terms, config=SEARCH_CONFIG, search_type="websearch")
+        vector = RawSQL(
+            f'{connections[queryset.db].ops.quote_name(queryset.model._meta.db_table)}."search_vector"',
+            [],
+            output_field=SearchVectorField(),
+        )
+        queryset = queryset.alias(search_vector=vector).filter(search_vector=query)
+        if not self.is_ranked(request, queryset):
+            return queryset
+        return queryset.annotate(search_rank=SearchRank(F("search_vector"), query)).order_by(*self.ranked_ordering)
@@ -1,8 +1,17 @@
 from __future__ import annotations
 
+from collections import defaultdict
+from datetime import timedelta
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+from drf_spectacular.utils import extend_schema_field
 from rest_framework import serializers
 
+from events import recurrence
 from events.models import (
     Comment,
     ContributionItem,
@@ -12,10 +21,22 @@ from events.models import (
     Document,
     Event,
     EventImage,
+    EventOccurrenceOverride,
     Participation,
     Reaction,
 )
-from events.services import create_event, replace_contributions, save_custom_field_answers
+from events.services import (
+    RECURRENCE_FIELDS,
+    adjust_rsvp_counters,
+    create_event,
+    replace_contributions,
+    rsvp_state,
+    save_custom_field_answers,
+)
+from hive.api.fields import SparseFieldsetSerializerMixin
+from invitations.models import Invitation
+from polls.models import Poll
+from polls.serializers import PollOptionSerializer
 
 User = get_user_model()
 
@@ -26,8 +47,22 @@ class EventOwnerSerializer(serializers.ModelSerializer):
         fields = ("id", "username", "email")
 
 
-class EventSerializer(serializers.ModelSerializer):
+class EventSerializer(SparseFieldsetSerializerMixin, serializers.ModelSerializer):
     owner = EventOwnerSerializer(read_only=True)
+    next_occurrence = serializers.SerializerMethodField()
+
+    sparse_field_sources = {
+        "next_occurrence": (
+            "starts_at",
+            "ends_at",
+            "title",
+            "location",
+            "recurrence_frequency",
+            "recurrence_interval",
+            "recurrence_until",
+            "recurrence_count",
+        ),
+    }
 
     class Meta:
         model = Event
@@ -41,10 +76,29 @@ class EventSerializer(serializers.ModelSerializer):
             "ends_at",
             "dresscode",
             "metadata",
+            "recurrence_frequency",
+            "recurrence_interval",
+            "recurrence_until",
+            "recurrence_count",
+            "next_occurrence",
+            "accepted_count",
+            "pending_count",
+            "declined_count",
+            "plus_one_total",
+            "created_at",
+            "updated_at",
+        )
+        extra_kwargs = {"recurrence_interval": {"min_value": 1, "max_value": recurrence.MAX_INTERVAL}}
+        read_only_fields = (
+            "id",
+            "owner",
+            "accepted_count",
+            "pending_count",
+            "declined_count",
+            "plus_one_total",
             "created_at",
             "updated_at",
         )
-        read_only_fields = ("id", "owner", "created_at", "updated_at")
 
     def validate(self, attrs):
         starts_at = attrs.get("starts_at", getattr(self.instance, "starts_at", None))
@@ -53,13 +107,153 @@ class EventSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError({"starts_at": "This field is required."})
         if ends_at and ends_at < starts_at:
             raise serializers.ValidationError({"ends_at": "End time must not be before start time."})
+
+        def current(field):
+            return attrs.get(field, getattr(self.instance, field, None))
+
+        if current("recurrence_until") and current("recurrence_count"):
+            raise serializers.ValidationError(
+                {"recurrence_count": "Set either recurrence_until or recurrence_count, not both."}
+            )
+        if current("recurrence_until") and current("recurrence_until") < starts_at:
+            raise serializers.ValidationError({"recurrence_until": "Recurrence must not end before the event starts."})
+        series = Event(**{field: current(field) for field in ("starts_at", "ends_at", *RECURRENCE_FIELDS)})
+        series.recurrence_interval = series.recurrence_interval or 1
+        try:
+            recurrence.series_ends_at(series)
+        except (ValueError, OverflowError):
+            field = "recurrence_count" if series.recurrence_count else "recurrence_interval"
+            raise serializers.ValidationError({field: "The series would run past the supported date range."})
         return attrs
 
+    @extend_schema_field(serializers.DateTimeField(allow_null=True))
+    def get_next_occurrence(self, obj):
+        next_start = recurrence.next_start(obj, timezone.now(), obj.occurrence_overrides.all())
+        return serializers.DateTimeField().to_representation(next_start) if next_start else None
+
     def create(self, validated_data):
         owner = self.context["request"].user
         return create_event(owner=owner, **validated_data)
 
 
+class EventBatchRequestSerializer(serializers.Serializer):
+    ids = serializers.ListField(child=serializers.IntegerField(min_value=1), allow_empty=False)
+
+    def validate_ids(self, value):
+        max_ids = settings.EVENT_BATCH_MAX_IDS
+        if len(value) > max_ids:
+            raise serializers.ValidationError(f"Request at most {max_ids} events at once.")
+        return list(dict.fromkeys(value))
+
+
+class EventBatchResponseSerializer(serializers.Serializer):
+    results = serializers.DictField(child=EventSerializer(), read_only=True)
+    missing = serializers.ListField(child=serializers.IntegerField(), read_only=True)
+
+
+class EventCalendarSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Event
+        fields = ("id", "title", "location", "starts_at", "ends_at")
+        read_only_fields = fields
+
+
+class EventOccurrenceSerializer(serializers.Serializer):
+    """One calendar entry; ``original_start`` identifies occurrences of a series."""
+
+    id = serializers.IntegerField(read_only=True)
+    title = serializers.CharField(read_only=True)
+    location = serializers.CharField(read_only=True)
+    starts_at = serializers.DateTimeField(read_only=True)
+    ends_at = serializers.DateTimeField(read_only=True, allow_null=True)
+    original_start = serializers.DateTimeField(read_only=True, allow_null=True)
+
+
+class EventOccurrenceOverrideSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = EventOccurrenceOverride
+        fields = (
+            "id",
+            "original_start",
+            "cancelled",
+            "starts_at",
+            "ends_at",
+            "title",
+            "location",
+            "created_at",
+            "updated_at",
+        )
+        read_only_fields = ("id", "created_at", "updated_at")
+
+    def validate(self, attrs):
+        starts_at, ends_at = attrs.get("starts_at"), attrs.get("ends_at")
+        if starts_at and ends_at and ends_at < starts_at:
+            raise serializers.ValidationError({"ends_at": "End time must not be before start time."})
+        return attrs
+
+
+class EventCalendarRangeSerializer(serializers.Serializer):
+    # "from" is a keyword, so the fields are declared in get_fields().
+    def get_fields(self):
+        return {"from": serializers.DateTimeField(), "to": serializers.DateTimeField()}
+
+    def validate(self, attrs):
+        if attrs["to"] <= attrs["from"]:
+            raise serializers.ValidationError({"to": "End of range must be after its start."})
+        max_days = settings.EVENT_CALENDAR_MAX_DAYS
+        if attrs["to"] - attrs["from"] > timedelta(days=max_days):
+            raise serializers.ValidationError({"to": f"Range must not exceed {max_days} days."})
+        return attrs
+
+
+class HomeEventSerializer(serializers.ModelSerializer):
+    next_occurrence = serializers.DateTimeField(read_only=True)
+    my_rsvp_status = serializers.CharField(read_only=True, allow_null=True)
+
+    class Meta:
+        model = Event
+        fields = (
+            "id",
+            "title",
+            "location",
+            "starts_at",
+            "ends_at",
+            "recurrence_frequency",
+            "next_occurrence",
+            "accepted_count",
+            "pending_count",
+            "declined_count",
+            "plus_one_total",
+            "my_rsvp_status",
+        )
+        read_only_fields = fields
+
+
+class HomeInvitationSerializer(serializers.ModelSerializer):
+    event = EventCalendarSerializer(read_only=True)
+
+    class Meta:
+        model = Invitation
+        fields = ("id", "event", "expires_at")
+        read_only_fields = fields
+
+
+class HomePollSerializer(serializers.ModelSerializer):
+    event_title = serializers.CharField(source="event.title", read_only=True)
+    options = PollOptionSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = Poll
+        fields = ("id", "event", "event_title", "question", "allows_multiple", "closes_at", "options")
+        read_only_fields = fields
+
+
+class HomeDashboardSerializer(serializers.Serializer):
+    upcoming_events = HomeEventSerializer(many=True, read_only=True)
+    pending_invitations = HomeInvitationSerializer(many=True, read_only=True)
+    open_polls = HomePollSerializer(many=True, read_only=True)
+
+
 class ParticipationUserSerializer(serializers.ModelSerializer):
     class Meta:
         model = User
@@ -76,6 +270,22 @@ class ContributionItemSerializer(serializers.ModelSerializer):
         }
 
 
+class ContributionRollupContributorSerializer(serializers.Serializer):
+    participation_id = serializers.IntegerField()
+    user_id = serializers.IntegerField()
+    username = serializers.CharField()
+    quantity = serializers.IntegerField()
+
+
+class ContributionRollupSerializer(serializers.Serializer):
+    name_key = serializers.CharField()
+    item_name = serializers.CharField(source="display_name")
+    total_quantity = serializers.IntegerField()
+    item_count = serializers.IntegerField()
+    contributor_count = serializers.IntegerField()
+    contributors = ContributionRollupContributorSerializer(many=True)
+
+
 class ContributionItemInputSerializer(serializers.Serializer):
     item_name = serializers.CharField(max_length=255)
     quantity = serializers.IntegerField(min_value=1, default=1)
@@ -112,6 +322,42 @@ class CustomFieldDefinitionSerializer(serializers.ModelSerializer):
         return attrs
 
 
+class CustomFieldNumericSummarySerializer(serializers.Serializer):
+    min = serializers.FloatField()
+    max = serializers.FloatField()
+    mean = serializers.FloatField()
+    median = serializers.FloatField()
+    p25 = serializers.FloatField()
+    p75 = serializers.FloatField()
+    p90 = serializers.FloatField()
+
+
+class CustomFieldSummaryFieldSerializer(serializers.Serializer):
+    key = serializers.CharField()
+    label = serializers.CharField()
+    field_type = serializers.CharField()
+    answered = serializers.IntegerField()
+    counts = serializers.DictField(child=serializers.IntegerField(), allow_null=True)
+    true_ratio = serializers.FloatField(allow_null=True)
+    numeric = CustomFieldNumericSummarySerializer(allow_null=True)
+
+
+class AllergyCountSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    count = serializers.IntegerField()
+
+
+class AllergySummarySerializer(serializers.Serializer):
+    participants_with_allergies = serializers.IntegerField()
+    items = AllergyCountSerializer(many=True)
+
+
+class CustomFieldSummarySerializer(serializers.Serializer):
+    participant_count = serializers.IntegerField()
+    fields = CustomFieldSummaryFieldSerializer(many=True)
+    allergies = AllergySummarySerializer()
+
+
 class CustomFieldValueSerializer(serializers.ModelSerializer):
     definition_key = serializers.CharField(source="definition.key", read_only=True)
 
@@ -153,6 +399,83 @@ class ParticipationSerializer(serializers.ModelSerializer):
         )
 
 
+# ---------------------------------------------------------------------------
+# Fast read path for large participant lists. Produces exactly what
+# ParticipationSerializer(many=True) would, from values() rows.
+# ---------------------------------------------------------------------------
+
+_PARTICIPATION_COLUMNS = (
+    "id",
+    "event",
+    "rsvp_status",
+    "plus_one_count",
+    "allergies",
+    "notes",
+    "dresscode_visible",
+    "created_at",
+    "updated_at",
+)
+_CONTRIBUTION_COLUMNS = ("id", "event", "participation", "item_name", "quantity", "notes", "created_at", "updated_at")
+_datetime = serializers.DateTimeField()
+
+
+def participation_values(queryset):
+    """Narrow a Participation queryset to the columns participation_rows() needs."""
+    return queryset.values(
+        *_PARTICIPATION_COLUMNS,
+        user_ref=F("user_id"),
+        user_username=F("user__username"),
+        user_email=F("user__email"),
+    )
+
+
+def participation_rows(rows) -> list[dict]:
+    """
+    Render ``participation_values()`` rows in ParticipationSerializer's output
+    format. Contributions and custom field answers for all rows come from one
+    query each.
+    """
+    rows = list(rows)
+    ids = [row["id"] for row in rows]
+    contributions = defaultdict(list)
+    for item in ContributionItem.objects.filter(participation_id__in=ids).values(*_CONTRIBUTION_COLUMNS):
+        item["created_at"] = _datetime.to_representation(item["created_at"])
+        item["updated_at"] = _datetime.to_representation(item["updated_at"])
+        contributions[item["participation"]].append(item)
+    answers = defaultdict(list)
+    for answer in (
+        CustomFieldValue.objects.filter(participation_id__in=ids)
+        .order_by("id")
+        .values("id", "participation", "definition", "definition__key", "value")
+    ):
+        answers[answer["participation"]].append(
+            {
+                "id": answer["id"],
+                "definition": answer["definition"],
+                "definition_key": answer["definition__key"],
+                "value": answer["value"],
+            }
+        )
+
+    return [
+        {
+            "id": row["id"],
+            "event": row["event"],
+            "user": {"id": row["user_ref"], "username": row["user_username"], "email": row["user_email"]},
+            "rsvp_status": row["rsvp_status"],
+            "plus_one_count": row["plus_one_count"],
+            "allergies": row["allergies"],
+            "notes": row["notes"],
+            "dresscode_visible": row["dresscode_visible"],
+            "contributions": contributions[row["id"]],
+            "custom_field_values": answers[row["id"]],
+            "created_at": _datetime.to_representation(row["created_at"]),
+            "updated_at": _datetime.to_representation(row["updated_at"]),
+        }
+        for row in rows
+    ]
+
+
 class ParticipationSelfUpdateSerializer(serializers.ModelSerializer):
     contributions = ContributionItemInputSerializer(many=True, required=False)
     custom_field_answers = serializers.DictField(required=False)
@@ -176,13 +499,26 @@ class ParticipationSelfUpdateSerializer(serializers.ModelSerializer):
             "dresscode_visible": {"required": False},
         }
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         contributions = validated_data.pop("contributions", None)
         custom_field_answers = validated_data.pop("custom_field_answers", None)
 
+        before = None
+        if "rsvp_status" in validated_data or "plus_one_count" in validated_data:
+            # Read the stored state under a row lock so concurrent updates
+            # cannot apply the same counter delta twice.
+            before = (
+                Participation.objects.select_for_update()
+                .values_list("rsvp_status", "plus_one_count")
+                .get(pk=instance.pk)
+            )
+
         for attr, value in validated_data.items():
             setattr(instance, attr, value)
         instance.save()
+        if before is not None:
+            adjust_rsvp_counters(instance.event_id, before, rsvp_state(instance))
 
         if contributions is not None:
             replace_contributions(instance.event, instance, contributions)
@@ -192,6 +528,41 @@ class ParticipationSelfUpdateSerializer(serializers.ModelSerializer):
         return instance
 
 
+class ParticipationBulkUpdateItemSerializer(serializers.ModelSerializer):
+    id = serializers.IntegerField(min_value=1)
+
+    class Meta:
+        model = Participation
+        fields = ("id", "rsvp_status", "plus_one_count", "notes")
+        extra_kwargs = {
+            "rsvp_status": {"required": False},
+            "plus_one_count": {"required": False},
+            "notes": {"required": False},
+        }
+
+
+class ParticipationBulkUpdateSerializer(serializers.Serializer):
+    updates = ParticipationBulkUpdateItemSerializer(many=True, allow_empty=False)
+
+    def validate_updates(self, value):
+        max_rows = settings.PARTICIPANT_BULK_UPDATE_MAX_ROWS
+        if len(value) > max_rows:
+            raise serializers.ValidationError(f"Update at most {max_rows} participations at once.")
+        ids = [update["id"] for update in value]
+        if len(set(ids)) != len(ids):
+            raise serializers.ValidationError("Each participation may only appear once.")
+        return value
+
+
+class ParticipationBulkUpdateResultSerializer(serializers.Serializer):
+    id = serializers.IntegerField()
+    status = serializers.CharField()
+
+
+class ParticipationBulkUpdateResponseSerializer(serializers.Serializer):
+    results = ParticipationBulkUpdateResultSerializer(many=True)
+
+
 # ---------------------------------------------------------------------------
 # Priority 3 serializers — Comments, Reactions, Documents, Gallery
 # ---------------------------------------------------------------------------
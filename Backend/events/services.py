@@ -1,44 +1,418 @@
 from __future__ import annotations
 
+import re
+import statistics
+from collections import Counter, defaultdict
+from datetime import timedelta
 from typing import Any
 
-from django.db import transaction
-from django.db.models import Q
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import connections, transaction
+from django.db.models import BooleanField, Count, Exists, F, Min, OuterRef, Prefetch, Q, Subquery, Sum
+from django.db.models.expressions import RawSQL
+from django.db.models.functions import Lower, Trim
 from django.utils import timezone
 from rest_framework.exceptions import PermissionDenied, ValidationError
 
+from accounts.services import normalize_email, user_ids_by_email
+from events import recurrence
+from events.cache import (
+    CUSTOM_FIELD_SUMMARY_NAMESPACE,
+    NO_ACCESS,
+    bump_event_cache_version,
+    get_cached_event_access,
+    get_cached_event_value,
+    store_event_access,
+    store_event_value,
+)
+from events.custom_fields import get_field_schema
 from events.models import (
     ContributionItem,
     CustomFieldDefinition,
     CustomFieldType,
     CustomFieldValue,
     Event,
+    EventAccessKind,
+    EventMembership,
+    EventOccurrenceOverride,
     Participation,
     RSVPStatus,
 )
 from invitations.models import Invitation, InvitationStatus
+from polls.models import Poll, PollOption, VoteSubmission
+
+User = get_user_model()
+
+RECURRENCE_FIELDS = (
+    "recurrence_frequency",
+    "recurrence_interval",
+    "recurrence_until",
+    "recurrence_count",
+    "recurrence_ends_at",
+)
+RSVP_COUNTER_FIELDS = ("accepted_count", "pending_count", "declined_count", "plus_one_total")
+_RSVP_COUNTER_BY_STATUS = {
+    RSVPStatus.ACCEPTED: "accepted_count",
+    RSVPStatus.PENDING: "pending_count",
+    RSVPStatus.DECLINED: "declined_count",
+}
+
+_ACCESS_RANK = {
+    EventAccessKind.OWNER: 0,
+    EventAccessKind.PARTICIPANT: 1,
+    EventAccessKind.INVITEE: 2,
+}
 
 
 def events_visible_to_user(user):
     if not user or not user.is_authenticated:
         return Event.objects.none()
 
+    # Both conditions live in one filter() call so they apply to the same
+    # membership row; (event, user) is unique, so no DISTINCT is needed.
+    return Event.objects.filter(
+        Q(memberships__valid_until__isnull=True) | Q(memberships__valid_until__gte=timezone.now()),
+        memberships__user=user,
+    ).select_related("owner")
+
+
+def sync_event_memberships(event: Event, user_ids=None) -> None:
+    """
+    Recompute EventMembership rows for an event from its owner, participations
+    and live invitations. Restricted to ``user_ids`` when given, otherwise every
+    membership of the event is rebuilt.
+    """
     now = timezone.now()
-    email = (user.email or "").strip()
-    invitation_filter = Q(invitations__invitee_user=user)
-    if email:
-        invitation_filter |= Q(invitations__invitee_email__iexact=email)
-    invitation_filter &= Q(
-        Q(invitations__status=InvitationStatus.ACCEPTED)
-        | Q(invitations__status=InvitationStatus.PENDING, invitations__expires_at__gte=now)
+    access: dict[int, tuple[str, Any]] = {}
+
+    def grant(user_id, kind, valid_until=None):
+        current = access.get(user_id)
+        if current is None or _ACCESS_RANK[kind] < _ACCESS_RANK[current[0]]:
+            access[user_id] = (kind, valid_until)
+        elif current[0] == kind and current[1] is not None:
+            access[user_id] = (kind, None if valid_until is None else max(current[1], valid_until))
+
+    participations = Participation.objects.filter(event=event)
+    invitations = Invitation.objects.filter(event=event).filter(
+        Q(status=InvitationStatus.ACCEPTED)
+        | Q(status=InvitationStatus.PENDING, expires_at__gte=now)
     )
+    if user_ids is not None:
+        user_ids = set(user_ids)
+        emails = {
+            normalize_email(email)
+            for email in User.objects.filter(id__in=user_ids).values_list("email", flat=True)
+        } - {""}
+        participations = participations.filter(user_id__in=user_ids)
+        invitations = invitations.filter(
+            Q(invitee_user_id__in=user_ids) | Q(invitee_email_normalized__in=emails)
+        )
 
+    if user_ids is None or event.owner_id in user_ids:
+        grant(event.owner_id, EventAccessKind.OWNER)
+    for user_id in participations.values_list("user_id", flat=True):
+        grant(user_id, EventAccessKind.PARTICIPANT)
+
+    invitation_rows = list(
+        invitations.values_list("invitee_user_id", "invitee_email_normalized", "status", "expires_at")
+    )
+    email_user_ids = user_ids_by_email({email for _, email, _, _ in invitation_rows if email})
+    for invitee_user_id, invitee_email, status, expires_at in invitation_rows:
+        valid_until = None if status == InvitationStatus.ACCEPTED else expires_at
+        targets = set(email_user_ids.get(invitee_email, []))
+        if invitee_user_id:
+            targets.add(invitee_user_id)
+        for user_id in targets:
+            if user_ids is None or user_id in user_ids:
+                grant(user_id, EventAccessKind.INVITEE, valid_until)
+
+    stale = EventMembership.objects.filter(event=event).exclude(user_id__in=access.keys())
+    if user_ids is not None:
+        stale = stale.filter(user_id__in=user_ids)
+    stale.delete()
+    if access:
+        EventMembership.objects.bulk_create(
+            [
+                EventMembership(event=event, user_id=user_id, access_kind=kind, valid_until=valid_until)
+                for user_id, (kind, valid_until) in access.items()
+            ],
+            update_conflicts=True,
+            unique_fields=("event", "user"),
+            update_fields=("access_kind", "valid_until", "updated_at"),
+        )
+
+
+def rsvp_state(participation: Participation) -> tuple[str, int]:
+    return participation.rsvp_status, participation.plus_one_count
+
+
+def adjust_rsvp_counters(event_id, before=None, after=None) -> None:
+    """
+    Move an event's RSVP counters from one participation state to another with
+    a single F() UPDATE. ``before``/``after`` are ``rsvp_state()`` tuples, or
+    None for a participation that is being created or deleted.
+    """
+    apply_rsvp_transitions(event_id, [(before, after)])
+
+
+def apply_rsvp_transitions(event_id, transitions) -> None:
+    """Net out several ``(before, after)`` state changes into one counter UPDATE."""
+    deltas: Counter[str] = Counter()
+    for before, after in transitions:
+        for state, sign in ((before, -1), (after, 1)):
+            if state is None:
+                continue
+            status, plus_ones = state
+            deltas[_RSVP_COUNTER_BY_STATUS[status]] += sign
+            if status == RSVPStatus.ACCEPTED:
+                deltas["plus_one_total"] += sign * plus_ones
+    updates = {field: F(field) + delta for field, delta in deltas.items() if delta}
+    if updates:
+        Event.objects.filter(pk=event_id).update(**updates)
+
+
+def reconcile_rsvp_counters(event_ids=None) -> int:
+    """
+    Recompute RSVP counters from Participation rows and fix any that drifted.
+    Returns the number of events corrected.
+    """
+    accepted = Q(participations__rsvp_status=RSVPStatus.ACCEPTED)
+    events = Event.objects.annotate(
+        actual_accepted=Count("participations", filter=accepted),
+        actual_pending=Count("participations", filter=Q(participations__rsvp_status=RSVPStatus.PENDING)),
+        actual_declined=Count("participations", filter=Q(participations__rsvp_status=RSVPStatus.DECLINED)),
+        actual_plus_ones=Sum("participations__plus_one_count", filter=accepted, default=0),
+    ).only("id", *RSVP_COUNTER_FIELDS)
+    if event_ids is not None:
+        events = events.filter(id__in=event_ids)
+
+    drifted = []
+    for event in events.order_by("id").iterator(chunk_size=500):
+        actual = (event.actual_accepted, event.actual_pending, event.actual_declined, event.actual_plus_ones)
+        if actual != tuple(getattr(event, field) for field in RSVP_COUNTER_FIELDS):
+            for field, value in zip(RSVP_COUNTER_FIELDS, actual):
+                setattr(event, field, value)
+            drifted.append(event)
+    Event.objects.bulk_update(drifted, RSVP_COUNTER_FIELDS, batch_size=500)
+    return len(drifted)
+
+
+def _recurring_series_q(start, end=None, prefix="") -> Q:
+    """Recurring events whose series span overlaps [start, end)."""
+    series = ~Q(**{f"{prefix}recurrence_frequency": ""}) & (
+        Q(**{f"{prefix}recurrence_ends_at__isnull": True}) | Q(**{f"{prefix}recurrence_ends_at__gte": start})
+    )
+    return series & Q(**{f"{prefix}starts_at__lt": end}) if end is not None else series
+
+
+def events_in_range(user, start, end):
+    """
+    Visible events overlapping the half-open window [start, end), plus every
+    recurring series whose span overlaps it. On PostgreSQL one-off events
+    match the GiST index over tstzrange(starts_at, ends_at); series use the
+    partial recurring index.
+    """
+    queryset = events_visible_to_user(user)
+    if connections[queryset.db].vendor == "postgresql":
+        # Expression must stay identical to events_event_time_range_gist.
+        overlap = Q(
+            RawSQL(
+                "tstzrange(starts_at, COALESCE(ends_at, starts_at), '[]') && tstzrange(%s, %s, '[)')",
+                [start, end],
+                output_field=BooleanField(),
+            )
+        )
+    else:
+        overlap = Q(Q(ends_at__gte=start) | Q(ends_at__isnull=True, starts_at__gte=start), starts_at__lt=end)
     return (
-        Event.objects.filter(Q(owner=user) | Q(participations__user=user) | invitation_filter)
-        .select_related("owner")
-        .distinct()
+        queryset.filter(overlap | _recurring_series_q(start, end))
+        .select_related(None)
+        .only("id", "title", "location", "starts_at", "ends_at", *RECURRENCE_FIELDS)
+        .order_by("starts_at", "id")
+    )
+
+
+def occurrences_in_range(user, start, end) -> list[recurrence.Occurrence]:
+    """
+    Expand ``events_in_range`` into individual occurrences ordered by start.
+    Overrides for all recurring series in the window come from one query.
+    """
+    events = list(events_in_range(user, start, end))
+    recurring = [event for event in events if recurrence.is_recurring(event)]
+    overrides = defaultdict(list)
+    if recurring:
+        longest = max((event.ends_at - event.starts_at for event in recurring if event.ends_at), default=timedelta(0))
+        moved_into_window = Q(starts_at__lt=end) & (Q(ends_at__gte=start) | Q(starts_at__gte=start - longest))
+        for override in EventOccurrenceOverride.objects.filter(event__in=recurring).filter(
+            Q(original_start__gte=start - longest, original_start__lt=end) | moved_into_window
+        ):
+            overrides[override.event_id].append(override)
+
+    occurrences = [
+        occurrence
+        for event in events
+        for occurrence in recurrence.iter_occurrences(event, start, end, overrides[event.id])
+    ]
+    return sorted(occurrences, key=lambda occurrence: (occurrence.starts_at, occurrence.id))
+
+
+@transaction.atomic
+def save_occurrence_override(event: Event, original_start, **fields) -> tuple[EventOccurrenceOverride, bool]:
+    if not recurrence.is_recurring(event):
+        raise ValidationError({"original_start": "Only recurring events have occurrences."})
+    if not recurrence.is_occurrence_start(event, original_start):
+        raise ValidationError({"original_start": "No occurrence of this event starts at this time."})
+    override, created = EventOccurrenceOverride.objects.update_or_create(
+        event=event,
+        original_start=original_start,
+        defaults=fields,
+    )
+    # Overrides change the event's representation (next_occurrence).
+    Event.objects.filter(pk=event.pk).update(updated_at=timezone.now())
+    return override, created
+
+
+def home_dashboard(user) -> dict[str, Any]:
+    """
+    Everything the app shows on launch, in five queries (six with recurring
+    series): upcoming events with the caller's RSVP, pending invitations
+    addressed to the caller, and open polls on visible events the caller has
+    not voted in yet.
+
+    Upcoming events are ordered by their next occurrence, which SQL cannot
+    compute for a series: the earliest one-off events come from one query,
+    live series and their overrides from another, and both are merged here.
+    """
+    now = timezone.now()
+    limit = settings.HOME_DASHBOARD_LIMIT
+    visible = events_visible_to_user(user)
+
+    upcoming = (
+        visible.select_related(None)
+        .annotate(
+            my_rsvp_status=Subquery(
+                Participation.objects.filter(event=OuterRef("pk"), user=user).values("rsvp_status")[:1]
+            )
+        )
+        .only("id", "title", "location", "starts_at", "ends_at", *RECURRENCE_FIELDS, *RSVP_COUNTER_FIELDS)
+    )
+    one_off = upcoming.filter(Q(starts_at__gte=now) | Q(ends_at__gte=now), recurrence_frequency="")
+    series = upcoming.filter(_recurring_series_q(now)).prefetch_related("occurrence_overrides")
+    upcoming_events = []
+    for event in [*one_off.order_by("starts_at", "id")[:limit], *series]:
+        overrides = event.occurrence_overrides.all() if recurrence.is_recurring(event) else ()
+        event.next_occurrence = recurrence.next_start(event, now, overrides)
+        # A series whose remaining occurrences are all cancelled is not upcoming.
+        if event.next_occurrence is not None:
+            upcoming_events.append(event)
+    upcoming_events.sort(key=lambda event: (event.next_occurrence, event.id))
+
+    invitation_filter = _live_invitation_q(user) & Q(status=InvitationStatus.PENDING)
+    pending_invitations = (
+        Invitation.objects.filter(invitation_filter)
+        .filter(Q(event__starts_at__gte=now) | _recurring_series_q(now, prefix="event__"))
+        .select_related("event")
+        .only(
+            "id",
+            "expires_at",
+            "event__id",
+            "event__title",
+            "event__location",
+            "event__starts_at",
+            "event__ends_at",
+        )
+        .order_by("expires_at", "id")[:limit]
     )
 
+    open_polls = (
+        Poll.objects.filter(event__in=visible.values("id"))
+        .filter(Q(opens_at__isnull=True) | Q(opens_at__lte=now))
+        .filter(Q(closes_at__isnull=True) | Q(closes_at__gt=now))
+        .exclude(Exists(VoteSubmission.objects.filter(poll=OuterRef("pk"), user=user)))
+        .select_related("event")
+        .only("id", "question", "allows_multiple", "closes_at", "event__id", "event__title")
+        .prefetch_related(Prefetch("options", queryset=PollOption.objects.order_by("position", "id")))
+        .order_by(F("closes_at").asc(nulls_last=True), "id")[:limit]
+    )
+
+    return {
+        "upcoming_events": upcoming_events[:limit],
+        "pending_invitations": list(pending_invitations),
+        "open_polls": list(open_polls),
+    }
+
+
+def _live_invitation_q(user) -> Q:
+    email = normalize_email(user.email)
+    invitation_filter = Q(invitee_user=user)
+    if email:
+        invitation_filter |= Q(invitee_email_normalized=email)
+    return invitation_filter & Q(
+        Q(status=InvitationStatus.ACCEPTED)
+        | Q(status=InvitationStatus.PENDING, expires_at__gte=timezone.now())
+    )
+
+
+def events_accessible_by_ids(user, event_ids):
+    """
+    Set-based ``can_user_access_event``: the events among ``event_ids`` the
+    user may open, with owner, participation and live invitation checked in
+    the same query.
+    """
+    if not user or not user.is_authenticated:
+        return Event.objects.none()
+    return Event.objects.filter(
+        Q(owner=user)
+        | Exists(Participation.objects.filter(event=OuterRef("pk"), user=user))
+        | Exists(Invitation.objects.filter(_live_invitation_q(user), event=OuterRef("pk"))),
+        pk__in=event_ids,
+    ).select_related("owner").prefetch_related("occurrence_overrides")
+
+
+def resolve_event_for_user(event_id, user) -> Event | None:
+    """
+    Load an event together with the caller's access kind in one query.
+    The kind comes from the access cache when possible; on a miss the
+    participation and invitation checks are annotated onto the same query and
+    the answer is cached. The result is stamped with
+    ``access_kind``/``access_user_id`` so later access checks for the same
+    user need no further queries.
+    """
+    cached = get_cached_event_access(event_id, user.id)
+    events = Event.objects.select_related("owner").filter(pk=event_id)
+    if cached is None:
+        live_invitations = Invitation.objects.filter(_live_invitation_q(user), event=OuterRef("pk"))
+        pending_until = live_invitations.filter(status=InvitationStatus.PENDING).order_by("-expires_at")
+        events = events.annotate(
+            _is_participant=Exists(Participation.objects.filter(event=OuterRef("pk"), user=user)),
+            _has_accepted_invite=Exists(live_invitations.filter(status=InvitationStatus.ACCEPTED)),
+            _pending_invite_until=Subquery(pending_until.values("expires_at")[:1]),
+        )
+    event = events.first()
+    if event is None:
+        return None
+
+    valid_until = None
+    if event.owner_id == user.id:
+        access_kind = EventAccessKind.OWNER
+    elif cached is not None:
+        access_kind = cached
+    elif event._is_participant:
+        access_kind = EventAccessKind.PARTICIPANT
+    elif event._has_accepted_invite:
+        access_kind = EventAccessKind.INVITEE
+    elif event._pending_invite_until is not None:
+        # Access only lasts as long as the pending invitation.
+        access_kind, valid_until = EventAccessKind.INVITEE, event._pending_invite_until
+    else:
+        access_kind = NO_ACCESS
+    if cached is None:
+        store_event_access(event.id, user.id, access_kind, valid_until)
+    event.access_kind = access_kind or None
+    event.access_user_id = user.id
+    return event
+
 
 def can_user_access_event(event: Event, user) -> bool:
     if not user or not user.is_authenticated:
@@ -46,17 +420,26 @@ def can_user_access_event(event: Event, user) -> bool:
 
     if event.owner_id == user.id:
         return True
-    if Participation.objects.filter(event=event, user=user).exists():
-        return True
-    email = (user.email or "").strip()
-    invitation_filter = Q(event=event, invitee_user=user)
-    if email:
-        invitation_filter |= Q(event=event, invitee_email__iexact=email)
-    invitation_filter &= Q(
-        Q(status=InvitationStatus.ACCEPTED)
-        | Q(status=InvitationStatus.PENDING, expires_at__gte=timezone.now())
-    )
-    return Invitation.objects.filter(invitation_filter).exists()
+    if getattr(event, "access_user_id", None) == user.id:
+        return event.access_kind is not None
+
+    cached = get_cached_event_access(event.id, user.id)
+    if cached is not None:
+        return cached != NO_ACCESS
+
+    access_kind, valid_until = EventAccessKind.PARTICIPANT, None
+    if not Participation.objects.filter(event=event, user=user).exists():
+        invitations = Invitation.objects.filter(_live_invitation_q(user), event=event)
+        statuses = list(invitations.values_list("status", "expires_at"))
+        if not statuses:
+            access_kind = NO_ACCESS
+        else:
+            access_kind = EventAccessKind.INVITEE
+            if all(status == InvitationStatus.PENDING for status, _ in statuses):
+                # Access only lasts as long as the pending invitation.
+                valid_until = max(expires_at for _, expires_at in statuses)
+    store_event_access(event.id, user.id, access_kind, valid_until)
+    return access_kind != NO_ACCESS
 
 
 def can_user_manage_event(event: Event, user) -> bool:
@@ -76,11 +459,13 @@ def ensure_event_owner(event: Event, user) -> None:
 @transaction.atomic
 def create_event(owner, **validated_data) -> Event:
     event = Event.objects.create(owner=owner, **validated_data)
-    Participation.objects.create(
+    participation = Participation.objects.create(
         event=event,
         user=owner,
         rsvp_status=RSVPStatus.ACCEPTED,
     )
+    # Counted, and the owner's membership written, by post_save signals.
+    event.refresh_from_db(fields=RSVP_COUNTER_FIELDS)
     return event
 
 
@@ -92,75 +477,158 @@ def get_or_create_participation_for_user(event: Event, user) -> Participation:
             defaults={"rsvp_status": RSVPStatus.ACCEPTED},
         )
         if participation.rsvp_status != RSVPStatus.ACCEPTED:
+            before = rsvp_state(participation)
             participation.rsvp_status = RSVPStatus.ACCEPTED
             participation.save(update_fields=["rsvp_status", "updated_at"])
+            adjust_rsvp_counters(event.id, before, rsvp_state(participation))
         return participation
 
     participation = Participation.objects.filter(event=event, user=user).first()
     if participation:
         return participation
 
-    email = (user.email or "").strip()
-    invitation_filter = Q(event=event, invitee_user=user)
-    if email:
-        invitation_filter |= Q(event=event, invitee_email__iexact=email)
-    invitation_filter &= Q(
-        Q(status=InvitationStatus.ACCEPTED)
-        | Q(status=InvitationStatus.PENDING, expires_at__gte=timezone.now())
-    )
-    if not Invitation.objects.filter(invitation_filter).exists():
+    if not Invitation.objects.filter(_live_invitation_q(user), event=event).exists():
         raise PermissionDenied("You are not invited to this event.")
     return Participation.objects.create(event=event, user=user, rsvp_status=RSVPStatus.PENDING)
 
 
-@transaction.atomic
-def replace_contributions(event: Event, participation: Participation, contributions: list[dict[str, Any]]) -> None:
-    ContributionItem.objects.filter(event=event, participation=participation).delete()
-    items = [
-        ContributionItem(
-            event=event,
-            participation=participation,
-            item_name=item["item_name"],
-            quantity=item.get("quantity", 1),
-            notes=item.get("notes", ""),
-        )
-        for item in contributions
-    ]
-    if items:
-        ContributionItem.objects.bulk_create(items)
+PARTICIPATION_BULK_FIELDS = ("rsvp_status", "plus_one_count", "notes")
 
 
-def _validate_field_value(definition: CustomFieldDefinition, value: Any) -> Any:
-    if value is None:
-        if definition.required:
-            raise ValidationError({definition.key: "This field is required."})
-        return None
+@transaction.atomic
+def bulk_update_participations(event: Event, updates: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """
+    Apply owner edits to many participations of ``event`` at once: one locked
+    read, one bulk_update and one counter UPDATE. Returns a result per update
+    with status ``updated``, ``unchanged`` or ``not_found``.
+    """
+    participations = (
+        Participation.objects.select_for_update()
+        .filter(event=event)
+        .only("id", "event_id", *PARTICIPATION_BULK_FIELDS)
+        .in_bulk([update["id"] for update in updates])
+    )
+    now = timezone.now()
+    results, changed, transitions = [], [], []
+    changed_fields: set[str] = set()
+    for update in updates:
+        participation = participations.get(update["id"])
+        if participation is None:
+            results.append({"id": update["id"], "status": "not_found"})
+            continue
+        fields = {
+            name: value
+            for name, value in update.items()
+            if name in PARTICIPATION_BULK_FIELDS and getattr(participation, name) != value
+        }
+        if not fields:
+            results.append({"id": participation.id, "status": "unchanged"})
+            continue
+        before = rsvp_state(participation)
+        for name, value in fields.items():
+            setattr(participation, name, value)
+        participation.updated_at = now
+        changed.append(participation)
+        changed_fields.update(fields)
+        transitions.append((before, rsvp_state(participation)))
+        results.append({"id": participation.id, "status": "updated"})
+
+    if changed:
+        Participation.objects.bulk_update(changed, (*sorted(changed_fields), "updated_at"))
+        apply_rsvp_transitions(event.id, transitions)
+    return results
+
+
+def _contribution_key(item_name: str) -> str:
+    return item_name.strip().lower()
 
-    if definition.field_type == CustomFieldType.TEXT:
-        if not isinstance(value, str):
-            raise ValidationError({definition.key: "Expected a string value."})
-        if definition.required and value.strip() == "":
-            raise ValidationError({definition.key: "This field is required."})
-        return value
 
-    if definition.field_type == CustomFieldType.NUMBER:
-        if isinstance(value, bool) or not isinstance(value, (int, float)):
-            raise ValidationError({definition.key: "Expected a numeric value."})
-        return value
+@transaction.atomic
+def replace_contributions(event: Event, participation: Participation, contributions: list[dict[str, Any]]) -> None:
+    """
+    Make the participation's contributions match ``contributions``. Rows are
+    matched to incoming items by normalized name and only the difference is
+    written, so saving an unchanged list issues no writes and ids stay stable.
+    """
+    existing = defaultdict(list)
+    for item in ContributionItem.objects.filter(event=event, participation=participation).order_by("id"):
+        existing[_contribution_key(item.item_name)].append(item)
 
-    if definition.field_type == CustomFieldType.BOOL:
-        if not isinstance(value, bool):
-            raise ValidationError({definition.key: "Expected a boolean value."})
-        return value
+    now = timezone.now()
+    to_create, to_update = [], []
+    for data in contributions:
+        fields = {
+            "item_name": data["item_name"],
+            "quantity": data.get("quantity", 1),
+            "notes": data.get("notes", ""),
+        }
+        matches = existing.get(_contribution_key(fields["item_name"]))
+        if not matches:
+            to_create.append(ContributionItem(event=event, participation=participation, **fields))
+            continue
+        # Prefer an identical row so duplicate names do not swap contents.
+        item = next(
+            (match for match in matches if all(getattr(match, name) == value for name, value in fields.items())),
+            matches[0],
+        )
+        matches.remove(item)
+        if any(getattr(item, name) != value for name, value in fields.items()):
+            for name, value in fields.items():
+                setattr(item, name, value)
+            # bulk_update() skips auto_now, which the rollup cache relies on.
+            item.updated_at = now
+            to_update.append(item)
+
+    stale = [item.id for items in existing.values() for item in items]
+    if stale:
+        ContributionItem.objects.filter(id__in=stale).delete()
+    if to_update:
+        ContributionItem.objects.bulk_update(to_update, ("item_name", "quantity", "notes", "updated_at"))
+    if to_create:
+        ContributionItem.objects.bulk_create(to_create)
+
+
+def contribution_rollup(event: Event):
+    """
+    One row per normalized ``item_name`` (trimmed, case-folded) with summed
+    quantities, as a single GROUP BY. ``name_key`` is unique per row, so it
+    doubles as the keyset pagination ordering.
+    """
+    return (
+        ContributionItem.objects.filter(event=event)
+        .annotate(name_key=Lower(Trim("item_name")))
+        .values("name_key")
+        .annotate(
+            display_name=Min("item_name"),
+            total_quantity=Sum("quantity"),
+            item_count=Count("id"),
+            contributor_count=Count("participation", distinct=True),
+        )
+        .order_by("name_key")
+    )
 
-    if definition.field_type == CustomFieldType.ENUM:
-        if not isinstance(value, str):
-            raise ValidationError({definition.key: "Expected a string option value."})
-        if value not in definition.options:
-            raise ValidationError({definition.key: "Value is not in allowed options."})
-        return value
 
-    raise ValidationError({definition.key: "Unsupported custom field type."})
+def attach_rollup_contributors(event: Event, rows: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Add each row's contributors, loaded for the whole page in one query."""
+    contributors = defaultdict(dict)
+    items = (
+        ContributionItem.objects.filter(event=event)
+        .annotate(name_key=Lower(Trim("item_name")))
+        .filter(name_key__in=[row["name_key"] for row in rows])
+        .order_by("participation_id")
+        .values_list(
+            "name_key", "participation_id", "participation__user_id", "participation__user__username", "quantity"
+        )
+    )
+    for name_key, participation_id, user_id, username, quantity in items:
+        entry = contributors[name_key].setdefault(
+            participation_id,
+            {"participation_id": participation_id, "user_id": user_id, "username": username, "quantity": 0},
+        )
+        entry["quantity"] += quantity
+    for row in rows:
+        row["contributors"] = list(contributors[row["name_key"]].values())
+    return rows
 
 
 @transaction.atomic
@@ -169,21 +637,131 @@ def save_custom_field_answers(
     participation: Participation,
     answers: dict[str, Any],
 ) -> None:
-    definitions = {
-        definition.key: definition
-        for definition in CustomFieldDefinition.objects.filter(event=event)
-    }
+    schema = get_field_schema(event)
 
     for key in answers:
-        if key not in definitions:
+        if key not in schema:
             raise ValidationError({key: "Unknown custom field key."})
 
-    for key, raw_value in answers.items():
-        definition = definitions[key]
-        normalized = _validate_field_value(definition, raw_value)
-        CustomFieldValue.objects.update_or_create(
+    values = [
+        CustomFieldValue(
             event=event,
             participation=participation,
-            definition=definition,
-            defaults={"value": normalized},
+            definition_id=schema[key].id,
+            value=schema[key].validate(raw_value),
         )
+        for key, raw_value in answers.items()
+    ]
+    if not values:
+        return
+    # One INSERT ... ON CONFLICT DO UPDATE for the whole form.
+    CustomFieldValue.objects.bulk_create(
+        values,
+        update_conflicts=True,
+        unique_fields=("definition", "participation"),
+        update_fields=("value", "updated_at"),
+    )
+    bump_event_cache_version(CUSTOM_FIELD_SUMMARY_NAMESPACE, event.id)
+
+
+_ALLERGY_SEPARATORS = re.compile(r"[,;/\n]+")
+
+
+def _numeric_stats(values: list[float]) -> dict[str, float] | None:
+    if not values:
+        return None
+    stats = {
+        "min": min(values),
+        "max": max(values),
+        "mean": statistics.fmean(values),
+        "median": statistics.median(values),
+    }
+    if len(values) > 1:
+        percentiles = statistics.quantiles(values, n=100, method="inclusive")
+        stats.update(p25=percentiles[24], p75=percentiles[74], p90=percentiles[89])
+    else:
+        stats.update(p25=values[0], p75=values[0], p90=values[0])
+    return stats
+
+
+def custom_field_summary(event: Event) -> dict[str, Any]:
+    """
+    Distributions of an event's custom field answers and allergies, cached
+    per event until answers, definitions or allergies change. Enum, boolean
+    and allergy counts are grouped in SQL; numeric statistics are computed
+    from one list of values per field.
+    """
+    # The participant count comes from the RSVP counters, which change
+    # without touching the cached answers.
+    participant_count = event.accepted_count + event.pending_count + event.declined_count
+    cached = get_cached_event_value(CUSTOM_FIELD_SUMMARY_NAMESPACE, event.id)
+    if cached is not None:
+        return {"participant_count": participant_count, **cached}
+
+    definitions = list(CustomFieldDefinition.objects.filter(event=event).order_by("position", "id"))
+    answers = CustomFieldValue.objects.filter(event=event).order_by()
+    answered = dict(answers.values("definition_id").annotate(total=Count("id")).values_list("definition_id", "total"))
+    grouped = defaultdict(dict)
+    for definition_id, value, total in (
+        answers.filter(definition__field_type__in=(CustomFieldType.ENUM, CustomFieldType.BOOL))
+        .values("definition_id", "value")
+        .annotate(total=Count("id"))
+        .values_list("definition_id", "value", "total")
+    ):
+        grouped[definition_id][value] = total
+    numbers = defaultdict(list)
+    for definition_id, value in answers.filter(definition__field_type=CustomFieldType.NUMBER).values_list(
+        "definition_id", "value"
+    ):
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            numbers[definition_id].append(value)
+
+    fields = []
+    for definition in definitions:
+        counts = grouped.get(definition.id, {})
+        entry = {
+            "key": definition.key,
+            "label": definition.label,
+            "field_type": definition.field_type,
+            "answered": answered.get(definition.id, 0),
+            "counts": None,
+            "true_ratio": None,
+            "numeric": None,
+        }
+        if definition.field_type == CustomFieldType.ENUM:
+            entry["counts"] = {option: counts.get(option, 0) for option in definition.options}
+        elif definition.field_type == CustomFieldType.BOOL:
+            yes, no = counts.get(True, 0), counts.get(False, 0)
+            entry["counts"] = {"true": yes, "false": no}
+            entry["true_ratio"] = yes / (yes + no) if yes + no else None
+        elif definition.field_type == CustomFieldType.NUMBER:
+            entry["numeric"] = _numeric_stats(numbers.get(definition.id, []))
+        fields.append(entry)
+
+    allergy_counts: Counter[str] = Counter()
+    with_allergies = 0
+    for allergies, total in (
+        Participation.objects.filter(event=event)
+        .exclude(allergies="")
+        .order_by()
+        .values("allergies")
+        .annotate(total=Count("id"))
+        .values_list("allergies", "total")
+    ):
+        items = {item.strip().lower() for item in _ALLERGY_SEPARATORS.split(allergies) if item.strip()}
+        if items:
+            with_allergies += total
+        for item in items:
+            allergy_counts[item] += total
+
+    summary = {
+        "fields": fields,
+        "allergies": {
+            "participants_with_allergies": with_allergies,
+            "items": [{"name": name, "count": count} for name, count in allergy_counts.most_common()],
+        },
+    }
+    store_event_value(
+        CUSTOM_FIELD_SUMMARY_NAMESPACE, event.id, summary, settings.CUSTOM_FIELD_SUMMARY_CACHE_TIMEOUT
+    )
+    return {"participant_count": participant_count, **summary}
@@ -0,0 +1,104 @@
+from django.db.models import F
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from accounts.services import user_ids_by_email
+from events.cache import ACCESS_NAMESPACE, CUSTOM_FIELD_SUMMARY_NAMESPACE, bump_event_cache_version
+from events.models import CustomFieldDefinition, Event, Participation
+from events.services import adjust_rsvp_counters, rsvp_state, sync_event_memberships
+from invitations.models import Invitation
+
+
+@receiver(post_save, sender=Event)
+def invalidate_access_on_owner_change(sender, instance, created, update_fields=None, **kwargs):
+    # Cached access kinds include "owner", which must not outlive a new owner.
+    if not created and (update_fields is None or "owner" in update_fields):
+        bump_event_cache_version(ACCESS_NAMESPACE, instance.id)
+
+
+@receiver(post_save, sender=Participation)
+def invalidate_access_on_participation_save(sender, instance, created, **kwargs):
+    # Any participation grants access, so only new rows change the answer.
+    if created:
+        bump_event_cache_version(ACCESS_NAMESPACE, instance.event_id)
+
+
+@receiver(post_save, sender=Participation)
+def claim_rsvp_counters(sender, instance, created, raw=False, **kwargs):
+    # Status changes are applied by the services, which know the previous
+    # state. loaddata (raw) restores the stored counters along with the rows.
+    if created and not raw:
+        adjust_rsvp_counters(instance.event_id, after=rsvp_state(instance))
+
+
+@receiver(post_delete, sender=Participation)
+def release_rsvp_counters(sender, instance, **kwargs):
+    adjust_rsvp_counters(instance.event_id, before=rsvp_state(instance))
+
+
+@receiver(post_delete, sender=Participation)
+@receiver(post_save, sender=Invitation)
+@receiver(post_delete, sender=Invitation)
+def invalidate_access(sender, instance, **kwargs):
+    bump_event_cache_version(ACCESS_NAMESPACE, instance.event_id)
+
+
+def _membership_user_ids(sender, instance) -> set[int]:
+    if sender is Participation:
+        return {instance.user_id}
+    matches = user_ids_by_email([instance.invitee_email_normalized]).values()
+    user_ids = {user_id for ids in matches for user_id in ids}
+    if instance.invitee_user_id:
+        user_ids.add(instance.invitee_user_id)
+    return user_ids
+
+
+@receiver(post_save, sender=Event)
+def sync_owner_membership(sender, instance, created, raw=False, **kwargs):
+    if created and not raw:
+        sync_event_memberships(instance, [instance.owner_id])
+
+
+@receiver(post_save, sender=Participation)
+@receiver(post_save, sender=Invitation)
+def sync_memberships_on_save(sender, instance, created, raw=False, **kwargs):
+    # Any participation grants access, so only new rows matter; an invitation's
+    # status and expiry decide whether and until when it grants access.
+    # Bulk writes skip this and sync the memberships themselves.
+    if raw or (sender is Participation and not created):
+        return
+    user_ids = _membership_user_ids(sender, instance)
+    if user_ids:
+        sync_event_memberships(instance.event, user_ids)
+
+
+@receiver(post_delete, sender=Participation)
+@receiver(post_delete, sender=Invitation)
+def sync_memberships_on_delete(sender, instance, origin=None, **kwargs):
+    # Only for rows deleted on their own (admin, queryset.delete()). When the
+    # event or user is being deleted, its membership rows go in the same
+    # cascade and must not be recreated.
+    origin_model = getattr(origin, "model", type(origin))
+    if origin_model is not sender:
+        return
+    event = Event.objects.filter(pk=instance.event_id).first()
+    if event is None:
+        return
+    user_ids = _membership_user_ids(sender, instance)
+    if user_ids:
+        sync_event_memberships(event, user_ids)
+
+
+@receiver(post_save, sender=Participation)
+@receiver(post_delete, sender=Participation)
+@receiver(post_save, sender=CustomFieldDefinition)
+@receiver(post_delete, sender=CustomFieldDefinition)
+def invalidate_custom_field_summary(sender, instance, **kwargs):
+    # Participations carry the allergies; deleting either model cascades to answers.
+    bump_event_cache_version(CUSTOM_FIELD_SUMMARY_NAMESPACE, instance.event_id)
+
+
+@receiver(post_save, sender=CustomFieldDefinition)
+@receiver(post_delete, sender=CustomFieldDefinition)
+def bump_custom_fields_version(sender, instance, **kwargs):
+    Event.objects.filter(pk=instance.event_id).update(custom_fields_version=F("custom_fields_version") + 1)
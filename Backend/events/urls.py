@@ -2,24 +2,54 @@ from django.urls import path
 
 from events.views import (
     CommentReactionCreateView,
+    EventBatchView,
+    EventCalendarView,
     EventCommentListCreateView,
     EventContributionListCreateView,
+    EventContributionRollupView,
     EventCustomFieldListCreateView,
+    EventCustomFieldSummaryView,
     EventDetailView,
     EventDocumentListCreateView,
     EventGalleryListCreateView,
     EventListCreateView,
     EventMeView,
+    EventOccurrenceOverrideListCreateView,
+    EventParticipantsExportView,
     EventParticipantsView,
+    HomeDashboardView,
 )
 
 urlpatterns = [
+    path("me/home", HomeDashboardView.as_view(), name="me-home"),
     path("events", EventListCreateView.as_view(), name="event-list-create"),
+    path("events/batch", EventBatchView.as_view(), name="event-batch"),
+    path("events/calendar", EventCalendarView.as_view(), name="event-calendar"),
     path("events/<int:pk>", EventDetailView.as_view(), name="event-detail"),
     path("events/<int:pk>/participants", EventParticipantsView.as_view(), name="event-participants"),
+    path(
+        "events/<int:pk>/participants/export",
+        EventParticipantsExportView.as_view(),
+        name="event-participants-export",
+    ),
     path("events/<int:pk>/me", EventMeView.as_view(), name="event-me"),
     path("events/<int:pk>/contributions", EventContributionListCreateView.as_view(), name="event-contributions"),
+    path(
+        "events/<int:pk>/contributions/rollup",
+        EventContributionRollupView.as_view(),
+        name="event-contribution-rollup",
+    ),
+    path(
+        "events/<int:pk>/occurrence-overrides",
+        EventOccurrenceOverrideListCreateView.as_view(),
+        name="event-occurrence-overrides",
+    ),
     path("events/<int:pk>/custom-fields", EventCustomFieldListCreateView.as_view(), name="event-custom-fields"),
+    path(
+        "events/<int:pk>/custom-fields/summary",
+        EventCustomFieldSummaryView.as_view(),
+        name="event-custom-field-summary",
+    ),
     # Priority 3 endpoints
     path("events/<int:pk>/comments", EventCommentListCreateView.as_view(), name="event-comments"),
     path("comments/<int:pk>/reactions", CommentReactionCreateView.as_view(), name="comment-reactions"),
@@ -1,79 +1,183 @@
+import hashlib
+
 from django.conf import settings
-from django.db.models import Count
+from django.db.models import Count, prefetch_related_objects
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django_filters.rest_framework import DjangoFilterBackend
+from drf_spectacular.types import OpenApiTypes
+from drf_spectacular.utils import OpenApiParameter, extend_schema
 from rest_framework import generics, permissions, status
+from rest_framework.filters import OrderingFilter
 from rest_framework.exceptions import PermissionDenied, ValidationError
 from rest_framework.response import Response
 
+from events import exports, recurrence
+from events.cache import CONTRIBUTION_ROLLUP_NAMESPACE, get_cached_event_value, store_event_value
 from events.models import (
     Comment,
     ContributionItem,
     CustomFieldDefinition,
+    CustomFieldValue,
     Document,
     Event,
     EventImage,
+    EventOccurrenceOverride,
     Participation,
     Reaction,
 )
+from events.mixins import EventContextMixin
+from events.search import EventSearchFilter
 from events.serializers import (
     CommentCreateSerializer,
     CommentSerializer,
     ContributionItemSerializer,
+    ContributionRollupSerializer,
     CustomFieldDefinitionSerializer,
+    CustomFieldSummarySerializer,
     DocumentSerializer,
+    EventBatchRequestSerializer,
+    EventBatchResponseSerializer,
+    EventCalendarRangeSerializer,
     EventImageSerializer,
+    EventOccurrenceOverrideSerializer,
+    EventOccurrenceSerializer,
     EventSerializer,
+    HomeDashboardSerializer,
+    ParticipationBulkUpdateResponseSerializer,
+    ParticipationBulkUpdateSerializer,
     ParticipationSerializer,
     ParticipationSelfUpdateSerializer,
     ReactionSerializer,
+    participation_rows,
+    participation_values,
 )
 from events.services import (
+    RSVP_COUNTER_FIELDS,
+    attach_rollup_contributors,
+    bulk_update_participations,
+    contribution_rollup,
+    custom_field_summary,
     ensure_event_access,
-    ensure_event_owner,
+    events_accessible_by_ids,
     events_visible_to_user,
     get_or_create_participation_for_user,
+    home_dashboard,
+    occurrences_in_range,
+    save_occurrence_override,
 )
+from hive.api.conditional import ConditionalGetMixin, collection_state
+from hive.api.fields import SparseFieldsetFilter
 
 
 class EventListCreateView(generics.ListCreateAPIView):
     serializer_class = EventSerializer
     permission_classes = [permissions.IsAuthenticated]
     queryset = Event.objects.none()
+    filter_backends = (DjangoFilterBackend, OrderingFilter, EventSearchFilter, SparseFieldsetFilter)
     filterset_fields = ("starts_at", "location")
-    search_fields = ("title", "location")
+    search_fields = ("title", "location", "description")
     ordering_fields = ("starts_at", "created_at")
+    cursor_ordering = ("starts_at", "id")
 
     def get_queryset(self):
-        return events_visible_to_user(self.request.user)
+        return events_visible_to_user(self.request.user).prefetch_related("occurrence_overrides")
+
+
+class EventBatchView(generics.GenericAPIView):
+    """
+    Fetch several events by id in one request. Results are keyed by id; ids
+    that do not exist or are not accessible are listed under ``missing``.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = EventBatchRequestSerializer
+
+    @extend_schema(request=EventBatchRequestSerializer, responses={200: EventBatchResponseSerializer})
+    def post(self, request):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        ids = serializer.validated_data["ids"]
+
+        events = {event.id: event for event in events_accessible_by_ids(request.user, ids)}
+        output = EventSerializer(context=self.get_serializer_context())
+        payload = {
+            "results": {str(event_id): output.to_representation(event) for event_id, event in events.items()},
+            "missing": [event_id for event_id in ids if event_id not in events],
+        }
+        return Response(payload)
+
+
+class EventCalendarView(generics.GenericAPIView):
+    """
+    Compact, unpaginated list of visible event occurrences overlapping
+    ``?from=&to=``. Recurring events are expanded into one entry per occurrence.
+    """
+
+    serializer_class = EventOccurrenceSerializer
+    permission_classes = [permissions.IsAuthenticated]
+    queryset = Event.objects.none()
+
+    @extend_schema(parameters=[EventCalendarRangeSerializer], responses={200: EventOccurrenceSerializer(many=True)})
+    def get(self, request):
+        params = EventCalendarRangeSerializer(data=request.query_params)
+        params.is_valid(raise_exception=True)
+        occurrences = occurrences_in_range(request.user, params.validated_data["from"], params.validated_data["to"])
+        return Response(self.get_serializer(occurrences, many=True).data)
+
+
+class HomeDashboardView(generics.GenericAPIView):
+    """Upcoming events, pending invitations and unanswered polls for the app's home screen."""
+
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = HomeDashboardSerializer
+
+    def get(self, request):
+        return Response(self.get_serializer(home_dashboard(request.user)).data)
 
 
-class EventDetailView(generics.RetrieveUpdateAPIView):
+class EventDetailView(ConditionalGetMixin, EventContextMixin, generics.RetrieveUpdateAPIView):
     serializer_class = EventSerializer
     permission_classes = [permissions.IsAuthenticated]
     queryset = Event.objects.none()
     http_method_names = ["get", "patch"]
 
+    def get_conditional_state(self):
+        event = self.get_member_event()
+        if recurrence.is_recurring(event):
+            # Shared with the serializer, so a 200 does not load them twice.
+            prefetch_related_objects([event], "occurrence_overrides")
+        # next_occurrence moves with the clock, not with updated_at.
+        next_start = recurrence.next_start(event, timezone.now(), event.occurrence_overrides.all())
+        return (event.updated_at, next_start, *(getattr(event, field) for field in RSVP_COUNTER_FIELDS))
+
     def get_object(self):
-        event = get_object_or_404(Event.objects.select_related("owner"), pk=self.kwargs["pk"])
         if self.request.method == "GET":
-            ensure_event_access(event, self.request.user)
-        else:
-            ensure_event_owner(event, self.request.user)
-        return event
+            return self.get_member_event()
+        return self.get_owned_event()
 
 
-class EventParticipantsView(generics.ListAPIView):
+class EventParticipantsView(ConditionalGetMixin, EventContextMixin, generics.ListAPIView):
     serializer_class = ParticipationSerializer
     permission_classes = [permissions.IsAuthenticated]
     filterset_fields = ("rsvp_status",)
     queryset = Participation.objects.none()
+    cursor_ordering = ("id",)
+
+    def get_conditional_state(self):
+        event = self.get_member_event()
+        return (
+            collection_state(Participation.objects.filter(event=event)),
+            collection_state(ContributionItem.objects.filter(event=event)),
+            collection_state(CustomFieldValue.objects.filter(event=event)),
+        )
 
     def get_queryset(self):
         event_id = self.kwargs.get("pk")
         if event_id is None:
             return Participation.objects.none()
-        event = get_object_or_404(Event, pk=event_id)
-        ensure_event_access(event, self.request.user)
+        event = self.get_member_event()
         return (
             Participation.objects.filter(event=event)
             .select_related("user", "event")
@@ -81,14 +185,64 @@ class EventParticipantsView(generics.ListAPIView):
             .order_by("id")
         )
 
+    def list(self, request, *args, **kwargs):
+        # Render through participation_rows() instead of the serializer; large
+        # guest lists otherwise spend most of their time in field machinery.
+        event = self.get_member_event()
+        queryset = self.filter_queryset(Participation.objects.filter(event=event).order_by("id"))
+        page = self.paginate_queryset(participation_values(queryset))
+        if page is not None:
+            return self.get_paginated_response(participation_rows(page))
+        return Response(participation_rows(participation_values(queryset)))
+
+    @extend_schema(
+        request=ParticipationBulkUpdateSerializer,
+        responses={200: ParticipationBulkUpdateResponseSerializer},
+    )
+    def patch(self, request, pk):
+        """Owner-only bulk update of rsvp_status, plus_one_count and notes."""
+        event = self.get_owned_event()
+        serializer = ParticipationBulkUpdateSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        results = bulk_update_participations(event, serializer.validated_data["updates"])
+        return Response(ParticipationBulkUpdateResponseSerializer({"results": results}).data)
 
-class EventMeView(generics.GenericAPIView):
+
+class EventParticipantsExportView(EventContextMixin, generics.GenericAPIView):
+    """
+    Owner-only streaming export of all participants, with one column per
+    custom field. ``?output=csv`` (default) or ``?output=ndjson``.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    queryset = Participation.objects.none()
+    serializer_class = ParticipationSerializer
+
+    @extend_schema(
+        parameters=[
+            OpenApiParameter("output", str, enum=[exports.CSV, exports.NDJSON], default=exports.CSV),
+        ],
+        responses={(200, "text/csv"): OpenApiTypes.STR, (200, "application/x-ndjson"): OpenApiTypes.STR},
+    )
+    def get(self, request, pk):
+        event = self.get_owned_event()
+        output = request.query_params.get("output", exports.CSV)
+        if output not in exports.CONTENT_TYPES:
+            raise ValidationError({"output": f"Expected one of: {', '.join(exports.CONTENT_TYPES)}."})
+        response = StreamingHttpResponse(
+            exports.iter_participant_export(event, output),
+            content_type=exports.CONTENT_TYPES[output],
+        )
+        response["Content-Disposition"] = f'attachment; filename="event-{event.id}-participants.{output}"'
+        return response
+
+
+class EventMeView(EventContextMixin, generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = ParticipationSelfUpdateSerializer
 
     def patch(self, request, pk):
-        event = get_object_or_404(Event, pk=pk)
-        ensure_event_access(event, request.user)
+        event = self.get_member_event()
         participation = get_or_create_participation_for_user(event, request.user)
 
         serializer = self.get_serializer(participation, data=request.data, partial=True)
@@ -102,20 +256,17 @@ class EventMeView(generics.GenericAPIView):
         return Response(output.data)
 
 
-class EventContributionListCreateView(generics.ListCreateAPIView):
+class EventContributionListCreateView(EventContextMixin, generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = ContributionItemSerializer
     queryset = ContributionItem.objects.none()
-
-    def get_event(self):
-        return get_object_or_404(Event, pk=self.kwargs["pk"])
+    cursor_ordering = ("id",)
 
     def get_queryset(self):
         event_id = self.kwargs.get("pk")
         if event_id is None:
             return ContributionItem.objects.none()
-        event = self.get_event()
-        ensure_event_access(event, self.request.user)
+        event = self.get_member_event()
         return (
             ContributionItem.objects.filter(event=event)
             .select_related("participation", "participation__user")
@@ -123,8 +274,7 @@ class EventContributionListCreateView(generics.ListCreateAPIView):
         )
 
     def perform_create(self, serializer):
-        event = self.get_event()
-        ensure_event_access(event, self.request.user)
+        event = self.get_member_event()
         participation = self._resolve_participation(event, self.request.user, serializer.validated_data)
         serializer.save(event=event, participation=participation)
 
@@ -141,28 +291,116 @@ class EventContributionListCreateView(generics.ListCreateAPIView):
         return participation
 
 
-class EventCustomFieldListCreateView(generics.ListCreateAPIView):
+class EventContributionRollupView(ConditionalGetMixin, EventContextMixin, generics.ListAPIView):
+    """
+    "Who brings what": contributions grouped by normalized item name with
+    summed quantities and their contributors. Cursor-paginated by default;
+    pages are cached until the event's contributions change.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = ContributionRollupSerializer
+    queryset = ContributionItem.objects.none()
+    filter_backends = []
+    pagination_mode = "cursor"
+    cursor_ordering = ("name_key",)
+
+    def get_conditional_state(self):
+        if not hasattr(self, "_contribution_state"):
+            event = self.get_member_event()
+            self._contribution_state = collection_state(ContributionItem.objects.filter(event=event))
+        return self._contribution_state
+
+    def get_queryset(self):
+        if self.kwargs.get("pk") is None:
+            return ContributionItem.objects.none()
+        return contribution_rollup(self.get_member_event())
+
+    def list(self, request, *args, **kwargs):
+        event = self.get_member_event()
+        # Count and newest updated_at move on every insert, edit and delete,
+        # so they key the cache without any explicit invalidation.
+        fingerprint = "|".join(map(str, (*self.get_conditional_state(), request.build_absolute_uri())))
+        cache_name = hashlib.sha1(fingerprint.encode()).hexdigest()
+        data = get_cached_event_value(CONTRIBUTION_ROLLUP_NAMESPACE, event.id, cache_name)
+        if data is not None:
+            return Response(data)
+
+        queryset = self.get_queryset()
+        page = self.paginate_queryset(queryset)
+        rows = attach_rollup_contributors(event, list(queryset if page is None else page))
+        serializer = self.get_serializer(rows, many=True)
+        response = Response(serializer.data) if page is None else self.get_paginated_response(serializer.data)
+        store_event_value(
+            CONTRIBUTION_ROLLUP_NAMESPACE,
+            event.id,
+            response.data,
+            settings.CONTRIBUTION_ROLLUP_CACHE_TIMEOUT,
+            cache_name,
+        )
+        return response
+
+
+class EventCustomFieldListCreateView(EventContextMixin, generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = CustomFieldDefinitionSerializer
     queryset = CustomFieldDefinition.objects.none()
 
-    def get_event(self):
-        return get_object_or_404(Event, pk=self.kwargs["pk"])
-
     def get_queryset(self):
         event_id = self.kwargs.get("pk")
         if event_id is None:
             return CustomFieldDefinition.objects.none()
-        event = self.get_event()
-        ensure_event_access(event, self.request.user)
+        event = self.get_member_event()
         return event.custom_field_definitions.all().order_by("position", "id")
 
     def perform_create(self, serializer):
-        event = self.get_event()
-        ensure_event_owner(event, self.request.user)
+        event = self.get_owned_event()
         serializer.save(event=event)
 
 
+class EventCustomFieldSummaryView(EventContextMixin, generics.GenericAPIView):
+    """
+    Owner-only aggregate of custom field answers and allergies: counts per
+    enum option, yes/no ratios, numeric distributions and normalized allergy
+    counts.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = CustomFieldSummarySerializer
+    queryset = CustomFieldDefinition.objects.none()
+
+    def get(self, request, pk):
+        event = self.get_owned_event()
+        return Response(self.get_serializer(custom_field_summary(event)).data)
+
+
+class EventOccurrenceOverrideListCreateView(EventContextMixin, generics.ListCreateAPIView):
+    """
+    Changed or cancelled occurrences of a recurring event. Posting for an
+    ``original_start`` that already has an override replaces it.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = EventOccurrenceOverrideSerializer
+    queryset = EventOccurrenceOverride.objects.none()
+    cursor_ordering = ("original_start", "id")
+
+    def get_queryset(self):
+        event = self.get_member_event()
+        return EventOccurrenceOverride.objects.filter(event=event).order_by("original_start", "id")
+
+    def create(self, request, *args, **kwargs):
+        event = self.get_owned_event()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        fields = serializer.validated_data.copy()
+        override, created = save_occurrence_override(event, fields.pop("original_start"), **fields)
+        return Response(
+            self.get_serializer(override).data,
+            status=status.HTTP_201_CREATED if created else status.HTTP_200_OK,
+        )
+
+
 # ---------------------------------------------------------------------------
 # Priority 3 views — Comments, Reactions, Documents, Gallery
 # All views check the corresponding feature flag before allowing access.
@@ -177,34 +415,38 @@ def _check_feature(flag_name: str, feature_label: str) -> None:
         raise NotFound(f"{feature_label} feature is not enabled.")
 
 
-class EventCommentListCreateView(generics.ListCreateAPIView):
+class EventCommentListCreateView(ConditionalGetMixin, EventContextMixin, generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
     queryset = Comment.objects.none()
+    cursor_ordering = ("created_at", "id")
+
+    def get_conditional_state(self):
+        _check_feature("FEATURE_COMMENTS_ENABLED", "Comments")
+        event = self.get_member_event()
+        return (
+            collection_state(Comment.objects.filter(event=event)),
+            collection_state(Reaction.objects.filter(comment__event=event), "created_at"),
+        )
 
     def get_serializer_class(self):
         if self.request.method == "POST":
             return CommentCreateSerializer
         return CommentSerializer
 
-    def get_event(self):
-        return get_object_or_404(Event, pk=self.kwargs["pk"])
-
     def get_queryset(self):
         _check_feature("FEATURE_COMMENTS_ENABLED", "Comments")
-        event = self.get_event()
-        ensure_event_access(event, self.request.user)
+        event = self.get_member_event()
         return (
             Comment.objects.filter(event=event, parent__isnull=True)
             .select_related("user")
             .prefetch_related("reactions__user", "replies")
             .annotate(_reply_count=Count("replies"))
-            .order_by("created_at")
+            .order_by("created_at", "id")
         )
 
     def perform_create(self, serializer):
         _check_feature("FEATURE_COMMENTS_ENABLED", "Comments")
-        event = self.get_event()
-        ensure_event_access(event, self.request.user)
+        event = self.get_member_event()
         parent = serializer.validated_data.get("parent")
         if parent and parent.event_id != event.id:
             raise ValidationError({"parent": "Parent comment must belong to this event."})
@@ -242,7 +484,7 @@ class CommentReactionCreateView(generics.GenericAPIView):
         return Response(ReactionSerializer(reaction).data, status=status.HTTP_201_CREATED)
 
 
-class EventDocumentListCreateView(generics.ListCreateAPIView):
+class EventDocumentListCreateView(EventContextMixin, generics.ListCreateAPIView):
     """
     List and upload documents for an event.
     DEV_ONLY: Files stored under MEDIA_ROOT
@@ -252,24 +494,20 @@ class EventDocumentListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = DocumentSerializer
     queryset = Document.objects.none()
-
-    def get_event(self):
-        return get_object_or_404(Event, pk=self.kwargs["pk"])
+    cursor_ordering = ("-created_at", "-id")
 
     def get_queryset(self):
         _check_feature("FEATURE_DOCUMENTS_ENABLED", "Documents")
-        event = self.get_event()
-        ensure_event_access(event, self.request.user)
-        return Document.objects.filter(event=event).select_related("uploaded_by").order_by("-created_at")
+        event = self.get_member_event()
+        return Document.objects.filter(event=event).select_related("uploaded_by").order_by("-created_at", "-id")
 
     def perform_create(self, serializer):
         _check_feature("FEATURE_DOCUMENTS_ENABLED", "Documents")
-        event = self.get_event()
-        ensure_event_access(event, self.request.user)
+        event = self.get_member_event()
         serializer.save(event=event, uploaded_by=self.request.user)
 
 
-class EventGalleryListCreateView(generics.ListCreateAPIView):
+class EventGalleryListCreateView(EventContextMixin, generics.ListCreateAPIView):
     """
     List and upload images to the event gallery.
     DEV_ONLY: Images stored under MEDIA_ROOT
@@ -279,18 +517,14 @@ class EventGalleryListCreateView(generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = EventImageSerializer
     queryset = EventImage.objects.none()
-
-    def get_event(self):
-        return get_object_or_404(Event, pk=self.kwargs["pk"])
+    cursor_ordering = ("-created_at", "-id")
 
     def get_queryset(self):
         _check_feature("FEATURE_GALLERY_ENABLED", "Gallery")
-        event = self.get_event()
-        ensure_event_access(event, self.request.user)
-        return EventImage.objects.filter(event=event).select_related("uploaded_by").order_by("-created_at")
+        event = self.get_member_event()
+        return EventImage.objects.filter(event=event).select_related("uploaded_by").order_by("-created_at", "-id")
 
     def perform_create(self, serializer):
         _check_feature("FEATURE_GALLERY_ENABLED", "Gallery")
-        event = self.get_event()
-        ensure_event_access(event, self.request.user)
+        event = self.get_member_event()
         serializer.save(event=event, uploaded_by=self.request.user)
@@ -0,0 +1,57 @@
+import hashlib
+from datetime import datetime
+
+from django.db.models import Count, Max
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+def collection_state(queryset, timestamp_field="updated_at") -> tuple:
+    """Row count and newest timestamp of ``queryset`` in one aggregate query."""
+    state = queryset.order_by().aggregate(count=Count("pk"), latest=Max(timestamp_field))
+    return state["count"], state["latest"]
+
+
+class ConditionalGetMixin:
+    """
+    ETag / Last-Modified support for GET, evaluated before any serialization.
+
+    Views implement ``get_conditional_state()`` and return a tuple of values
+    that change whenever the representation does: timestamps, counters and
+    ``collection_state()`` results. The ETag hashes that state together with
+    the full path, the user and the negotiated media type, so every page,
+    filter and per-user response is tagged separately.
+
+    Only If-None-Match produces a 304. Deletions and F() counter updates do not
+    move ``updated_at``, so Last-Modified is sent for information only.
+    """
+
+    def get_conditional_state(self) -> tuple:
+        raise NotImplementedError
+
+    def get(self, request, *args, **kwargs):
+        state = self.get_conditional_state()
+        fingerprint = "|".join(
+            map(str, (*state, request.get_full_path(), request.user.pk, request.accepted_media_type))
+        )
+        etag = quote_etag(hashlib.sha1(fingerprint.encode()).hexdigest())
+
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().get(request, *args, **kwargs)
+        if response.status_code in (200, 304):
+            response["ETag"] = etag
+            timestamps = [value for value in _flatten(state) if isinstance(value, datetime)]
+            if timestamps:
+                response["Last-Modified"] = http_date(max(timestamps).timestamp())
+            patch_cache_control(response, private=True, no_cache=True)
+            patch_vary_headers(response, ("Authorization", "Cookie"))
+        return response
+
+
+def _flatten(values):
+    for value in values:
+        if isinstance(value, tuple):
+            yield from _flatten(value)
+        else:
+            yield value
@@ -0,0 +1,111 @@
+from rest_framework.exceptions import ValidationError
+from rest_framework.filters import BaseFilterBackend
+from rest_framework.permissions import SAFE_METHODS
+from rest_framework.serializers import ListSerializer
+
+FIELDS_QUERY_PARAM = "fields"
+OMIT_QUERY_PARAM = "omit"
+
+
+def _param_names(request, param) -> list[str]:
+    raw = request.query_params.get(param, "")
+    return [name.strip() for name in raw.split(",") if name.strip()]
+
+
+def wants_sparse_fieldset(request) -> bool:
+    return (
+        request is not None
+        and request.method in SAFE_METHODS
+        and bool(request.query_params.get(FIELDS_QUERY_PARAM) or request.query_params.get(OMIT_QUERY_PARAM))
+    )
+
+
+def sparse_field_names(request, available) -> set[str] | None:
+    """
+    The subset of ``available`` field names selected by ``?fields=`` and
+    ``?omit=``, or None when the request does not ask for a sparse fieldset.
+    """
+    if not wants_sparse_fieldset(request):
+        return None
+    include = _param_names(request, FIELDS_QUERY_PARAM)
+    omit = _param_names(request, OMIT_QUERY_PARAM)
+
+    unknown = sorted(set(include + omit) - set(available))
+    if unknown:
+        raise ValidationError({FIELDS_QUERY_PARAM: f"Unknown field(s): {', '.join(unknown)}."})
+    selected = set(include) if include else set(available)
+    return selected - set(omit)
+
+
+class SparseFieldsetSerializerMixin:
+    """
+    Lets read requests trim the top-level representation with ``?fields=`` or
+    ``?omit=``. Nested serializers and write requests are not affected.
+    ``sparse_field_sources`` maps method fields (source ``"*"``) to the model
+    fields they read, so SparseFieldsetFilter can still defer the rest.
+    """
+
+    sparse_field_sources: dict[str, tuple[str, ...]] = {}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        parent = self.parent
+        if isinstance(parent, ListSerializer):
+            parent = parent.parent
+        if parent is not None:
+            return fields
+
+        selected = sparse_field_names(self.context.get("request"), fields)
+        if selected is None:
+            return fields
+        return {name: field for name, field in fields.items() if name in selected}
+
+
+class SparseFieldsetFilter(BaseFilterBackend):
+    """
+    Defers the model columns a sparse fieldset leaves out, so omitted TEXT and
+    JSON columns are never read. Requires a SparseFieldsetSerializerMixin
+    serializer; relation columns and the view's cursor ordering stay loaded.
+    """
+
+    def filter_queryset(self, request, queryset, view):
+        if not wants_sparse_fieldset(request):
+            return queryset
+        serializer = view.get_serializer()
+        if not isinstance(serializer, SparseFieldsetSerializerMixin):
+            return queryset
+
+        declared = serializer.sparse_field_sources
+        sources = set()
+        for name, field in serializer.fields.items():
+            sources.update(declared.get(name, (field.source.split(".")[0],)))
+        if "*" in sources:
+            # Undeclared method fields may read anything from the instance.
+            return queryset
+        # Keyset pagination reads the ordering columns back off the instances.
+        ordering = [*queryset.query.order_by, *getattr(view, "cursor_ordering", ())]
+        sources |= {name.lstrip("-") for name in ordering if isinstance(name, str)}
+        deferred = [
+            field.name
+            for field in queryset.model._meta.concrete_fields
+            if not field.primary_key and not field.is_relation and field.name not in sources
+        ]
+        return queryset.defer(*deferred) if deferred else queryset
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": FIELDS_QUERY_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "Comma-separated fields to include in each result.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": OMIT_QUERY_PARAM,
+                "required": False,
+                "in": "query",
+                "description": "Comma-separated fields to leave out of each result.",
+                "schema": {"type": "string"},
+            },
+        ]
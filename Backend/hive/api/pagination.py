@@ -0,0 +1,78 @@
+from rest_framework.pagination import CursorPagination, PageNumberPagination
+
+
+class HiveCursorPagination(CursorPagination):
+    def __init__(self, ordering):
+        self.ordering = ordering
+
+
+class HivePagination(PageNumberPagination):
+    """
+    Page-number pagination by default, keyset (cursor) pagination on demand.
+
+    Cursor mode is used when the view sets ``pagination_mode = "cursor"``, the
+    client sends ``?pagination=cursor`` or follows a ``cursor`` link. It orders
+    by the view's ``cursor_ordering`` (or an explicit ``?ordering=``) and runs
+    no COUNT query, so deep pages cost the same as the first one. A filter
+    backend that orders results itself, such as ranked search, can supply the
+    keyset ordering through ``get_cursor_ordering(request, queryset, view)``.
+    """
+
+    mode_query_param = "pagination"
+    cursor_query_param = "cursor"
+    default_cursor_ordering = ("id",)
+
+    def __init__(self):
+        self.cursor_paginator = None
+
+    def use_cursor(self, request, view) -> bool:
+        if self.cursor_query_param in request.query_params:
+            return True
+        mode = request.query_params.get(self.mode_query_param) or getattr(view, "pagination_mode", "page")
+        return mode == "cursor"
+
+    def get_cursor_ordering(self, request, queryset, view):
+        for backend in getattr(view, "filter_backends", ()):
+            if hasattr(backend, "get_cursor_ordering"):
+                ordering = backend().get_cursor_ordering(request, queryset, view)
+                if ordering:
+                    return ordering
+        return getattr(view, "cursor_ordering", self.default_cursor_ordering)
+
+    def paginate_queryset(self, queryset, request, view=None):
+        if self.use_cursor(request, view):
+            ordering = self.get_cursor_ordering(request, queryset, view)
+            self.cursor_paginator = HiveCursorPagination(ordering)
+            return self.cursor_paginator.paginate_queryset(queryset, request, view)
+        self.cursor_paginator = None
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.get_paginated_response(data)
+        return super().get_paginated_response(data)
+
+    def to_html(self):
+        if self.cursor_paginator is not None:
+            return self.cursor_paginator.to_html()
+        return super().to_html()
+
+    def get_schema_operation_parameters(self, view):
+        parameters = super().get_schema_operation_parameters(view)
+        parameters += [
+            {
+                "name": self.mode_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Set to 'cursor' for keyset pagination without a total count.",
+                "schema": {"type": "string", "enum": ["page", "cursor"]},
+            },
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "The pagination cursor value.",
+                "schema": {"type": "string"},
+            },
+        ]
+        return parameters
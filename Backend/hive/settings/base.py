@@ -167,7 +167,7 @@ REST_FRAMEWORK = {
         "rest_framework.filters.OrderingFilter",
         "rest_framework.filters.SearchFilter",
     ),
-    "DEFAULT_PAGINATION_CLASS": "rest_framework.pagination.PageNumberPagination",
+    "DEFAULT_PAGINATION_CLASS": "hive.api.pagination.HivePagination",
     "PAGE_SIZE": env_int("DRF_PAGE_SIZE", 20),
     "EXCEPTION_HANDLER": "hive.api.exceptions.api_exception_handler",
 }
@@ -178,6 +178,7 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": env_bool("JWT_ROTATE_REFRESH_TOKENS", False),
     "BLACKLIST_AFTER_ROTATION": env_bool("JWT_BLACKLIST_AFTER_ROTATION", True),
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_OBTAIN_SERIALIZER": "accounts.serializers.TokenObtainPairSerializer",
 }
 
 SPECTACULAR_SETTINGS = {
@@ -204,6 +205,14 @@ CORS_ALLOW_ALL_ORIGINS = env_bool("CORS_ALLOW_ALL_ORIGINS", False)
 CORS_ALLOWED_ORIGINS = env_list("CORS_ALLOWED_ORIGINS")
 
 INVITATION_TTL_HOURS = env_int("INVITATION_TTL_HOURS", 168)
+EVENT_CALENDAR_MAX_DAYS = env_int("EVENT_CALENDAR_MAX_DAYS", 92)
+HOME_DASHBOARD_LIMIT = env_int("HOME_DASHBOARD_LIMIT", 20)
+EVENT_BATCH_MAX_IDS = env_int("EVENT_BATCH_MAX_IDS", 100)
+PARTICIPANT_EXPORT_CHUNK_SIZE = env_int("PARTICIPANT_EXPORT_CHUNK_SIZE", 1000)
+PARTICIPANT_BULK_UPDATE_MAX_ROWS = env_int("PARTICIPANT_BULK_UPDATE_MAX_ROWS", 1000)
+INVITE_IMPORT_CHUNK_SIZE = env_int("INVITE_IMPORT_CHUNK_SIZE", 1000)
+INVITE_IMPORT_MAX_ERRORS = env_int("INVITE_IMPORT_MAX_ERRORS", 1000)
+INVITE_IMPORT_SEND_QUEUE_CHUNKS = env_int("INVITE_IMPORT_SEND_QUEUE_CHUNKS", 4)
 
 # ---------------------------------------------------------------------------
 # Email
@@ -222,6 +231,13 @@ EMAIL_HOST_USER = env("EMAIL_HOST_USER", "")
 EMAIL_HOST_PASSWORD = env("EMAIL_HOST_PASSWORD", "")
 EMAIL_USE_TLS = env_bool("EMAIL_USE_TLS", False)  # DOCKER_TARGET: True for production SMTP
 DEFAULT_FROM_EMAIL = env("DEFAULT_FROM_EMAIL", "noreply@hive.local")
+# Invitation emails (invitations.delivery): "thread" sends after the response,
+# "sync" sends inline once the transaction commits.
+INVITATION_URL_TEMPLATE = env("INVITATION_URL_TEMPLATE", "http://localhost:3000/invites/{token}")
+INVITATION_EMAIL_DELIVERY = env("INVITATION_EMAIL_DELIVERY", "thread")
+INVITATION_EMAIL_BATCH_SIZE = env_int("INVITATION_EMAIL_BATCH_SIZE", 100)
+INVITATION_EMAIL_MAX_ATTEMPTS = env_int("INVITATION_EMAIL_MAX_ATTEMPTS", 3)
+INVITATION_EMAIL_RETRY_DELAY = env_int("INVITATION_EMAIL_RETRY_DELAY", 2)  # seconds, doubled per attempt
 
 # ---------------------------------------------------------------------------
 # Cache
@@ -240,6 +256,13 @@ CACHES = {
     }
 }
 
+# Upper bound for cached event access decisions; entries backed by a pending
+# invitation expire no later than the invitation itself.
+EVENT_ACCESS_CACHE_TIMEOUT = env_int("EVENT_ACCESS_CACHE_TIMEOUT", 300)
+CUSTOM_FIELD_SUMMARY_CACHE_TIMEOUT = env_int("CUSTOM_FIELD_SUMMARY_CACHE_TIMEOUT", 3600)
+CUSTOM_FIELD_DEFINITIONS_CACHE_TIMEOUT = env_int("CUSTOM_FIELD_DEFINITIONS_CACHE_TIMEOUT", 86400)
+CONTRIBUTION_ROLLUP_CACHE_TIMEOUT = env_int("CONTRIBUTION_ROLLUP_CACHE_TIMEOUT", 600)
+
 # ---------------------------------------------------------------------------
 # Celery / Background jobs
 # DEV_ONLY: CELERY_TASK_ALWAYS_EAGER=True runs tasks synchronously in-process
@@ -0,0 +1,203 @@
+"""
+Invitation email delivery.
+
+Raw tokens only exist while ``create_invitations()`` runs, so messages are
+rendered right away and handed to ``transaction.on_commit``. With
+``INVITATION_EMAIL_DELIVERY = "thread"`` they are sent from a background
+thread after the response; ``"sync"`` sends them inline. An
+InvitationEmailSender can be fed many outboxes (the chunks of an import) and
+sends them all from one thread over one connection. Messages go out
+one at a time over one reused backend connection, in batches that share the
+retry rounds and status UPDATEs: only the messages of a batch that were not
+accepted are retried, with exponential backoff, so a dropped connection
+never re-sends delivered mail and one refused recipient does not fail its
+neighbours. The outcome is recorded on each Invitation, and
+``manage.py resend_invitation_emails`` re-issues invitations whose delivery
+failed or never finished.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections import defaultdict
+from itertools import islice
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import connections, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from invitations.models import Invitation, InvitationDeliveryStatus
+
+logger = logging.getLogger(__name__)
+
+SYNC = "sync"
+THREAD = "thread"
+
+
+def render_invitation_email(invitation, token: str) -> EmailMessage:
+    event = invitation.event
+    name = event.title or event.location
+    inviter = invitation.created_by.username if invitation.created_by else "Someone"
+    body = (
+        f"{inviter} invited you to {name}.\n\n"
+        f"When: {timezone.localtime(event.starts_at):%Y-%m-%d %H:%M}\n"
+        f"Where: {event.location}\n\n"
+        f"Respond here: {settings.INVITATION_URL_TEMPLATE.format(token=token)}\n\n"
+        f"This invitation expires on {timezone.localtime(invitation.expires_at):%Y-%m-%d %H:%M}.\n"
+    )
+    return EmailMessage(subject=f"You're invited: {name}", body=body, to=[invitation.invitee_email])
+
+
+def render_outbox(entries: list[dict]) -> list[tuple[int, EmailMessage]]:
+    """``(invitation_id, message)`` pairs for ``create_invitations()`` results addressed to an email."""
+    return [
+        (entry["invitation"].id, render_invitation_email(entry["invitation"], entry["token"]))
+        for entry in entries
+        if entry["invitation"].invitee_email
+    ]
+
+
+def queue_invitation_emails(entries: list[dict]) -> int:
+    """
+    Render emails for ``create_invitations()`` results and send them once the
+    current transaction commits. Returns the number of queued messages.
+    """
+    outbox = render_outbox(entries)
+    if outbox:
+        transaction.on_commit(lambda: dispatch_invitation_emails(outbox))
+    return len(outbox)
+
+
+def dispatch_invitation_emails(outbox) -> None:
+    """Send ``outbox`` now, or from a background thread, per ``INVITATION_EMAIL_DELIVERY``."""
+    sender = InvitationEmailSender()
+    try:
+        sender.send(outbox)
+    finally:
+        sender.close()
+
+
+class InvitationEmailSender:
+    """
+    One sender for a series of outboxes. In ``"thread"`` mode a single
+    background thread drains them from a queue of at most ``max_pending``
+    outboxes, so a producer that outruns delivery blocks instead of buffering
+    every message; ``"sync"`` sends each outbox inline. Either way all
+    messages share one backend connection. Call ``close()`` once done.
+    """
+
+    def __init__(self, max_pending: int = 1):
+        self._max_pending = max(max_pending, 1)
+        self._queue = None
+        self._connection = None
+
+    def send(self, outbox) -> None:
+        if not outbox:
+            return
+        if settings.INVITATION_EMAIL_DELIVERY != THREAD:
+            if self._connection is None:
+                self._connection = get_connection()
+            send_invitation_emails(outbox, connection=self._connection)
+            return
+        if self._queue is None:
+            self._queue = queue.Queue(maxsize=self._max_pending)
+            threading.Thread(target=self._drain, name="invitation-email", daemon=True).start()
+        self._queue.put(outbox)
+
+    def close(self) -> None:
+        if self._queue is not None:
+            self._queue.put(None)
+        if self._connection is not None:
+            self._connection.close()
+
+    def _drain(self) -> None:
+        connection = get_connection()
+        try:
+            while (outbox := self._queue.get()) is not None:
+                try:
+                    send_invitation_emails(outbox, connection=connection)
+                except Exception:
+                    logger.exception("Invitation email delivery crashed; rows stay queued for resend_invitation_emails.")
+        finally:
+            connection.close()
+            # Database connections are per thread and would otherwise leak.
+            connections.close_all()
+
+
+def send_invitation_emails(outbox, connection=None) -> tuple[int, int]:
+    """
+    Send ``(invitation_id, message)`` pairs in batches of
+    ``INVITATION_EMAIL_BATCH_SIZE`` and record the outcome per invitation.
+    A passed ``connection`` is reused and left to the caller to close.
+    Returns ``(sent, failed)`` message counts.
+    """
+    sent = failed = 0
+    owns_connection = connection is None
+    if owns_connection:
+        connection = get_connection()
+    pending = iter(outbox)
+    try:
+        while batch := list(islice(pending, settings.INVITATION_EMAIL_BATCH_SIZE)):
+            outcomes = defaultdict(list)
+            for invitation_id, (error, attempts) in _send_batch(connection, batch).items():
+                status = InvitationDeliveryStatus.SENT if error is None else InvitationDeliveryStatus.FAILED
+                message = "" if error is None else f"{type(error).__name__}: {error}"[:255]
+                outcomes[status, attempts, message].append(invitation_id)
+            for (status, attempts, message), invitation_ids in outcomes.items():
+                _record(invitation_ids, status, attempts, message)
+                if status == InvitationDeliveryStatus.SENT:
+                    sent += len(invitation_ids)
+                else:
+                    failed += len(invitation_ids)
+    finally:
+        if owns_connection:
+            connection.close()
+    return sent, failed
+
+
+def _send_batch(connection, batch) -> dict:
+    """Map each invitation id in ``batch`` to ``(last_error_or_None, attempts)``."""
+    max_attempts = max(settings.INVITATION_EMAIL_MAX_ATTEMPTS, 1)
+    outcome = {invitation_id: (None, 0) for invitation_id, _ in batch}
+    unsent = batch
+    for attempt in range(1, max_attempts + 1):
+        retry = []
+        for invitation_id, message in unsent:
+            try:
+                # Opening explicitly keeps the connection alive across messages;
+                # it is a no-op while the connection is up.
+                connection.open()
+                connection.send_messages([message])
+                outcome[invitation_id] = (None, attempt)
+            except Exception as exc:
+                outcome[invitation_id] = (exc, attempt)
+                retry.append((invitation_id, message))
+                # Reconnect for the next message in case this one broke the connection.
+                connection.close()
+        if retry:
+            logger.warning(
+                "%s invitation email(s) failed (attempt %s/%s): %s",
+                len(retry),
+                attempt,
+                max_attempts,
+                outcome[retry[-1][0]][0],
+            )
+        unsent = retry
+        if not unsent or attempt == max_attempts:
+            break
+        time.sleep(settings.INVITATION_EMAIL_RETRY_DELAY * 2 ** (attempt - 1))
+    return outcome
+
+
+def _record(invitation_ids, status, attempts, error) -> None:
+    now = timezone.now()
+    Invitation.objects.filter(id__in=invitation_ids).update(
+        delivery_status=status,
+        delivery_attempts=F("delivery_attempts") + attempts,
+        delivered_at=now if status == InvitationDeliveryStatus.SENT else None,
+        delivery_error=error,
+        updated_at=now,
+    )
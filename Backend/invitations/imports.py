@@ -0,0 +1,179 @@
+"""
+Streaming bulk-invite imports.
+
+Uploads arrive as multipart files, which Django spools to disk once they
+outgrow ``FILE_UPLOAD_MAX_MEMORY_SIZE``; rows are then decoded, validated and
+deduplicated one at a time and written in chunks of ``INVITE_IMPORT_CHUNK_SIZE``
+through ``create_invitations()``. Each chunk commits on its own, so a large
+import neither holds one long transaction nor keeps the file in memory. Only
+the normalized addresses seen so far are kept, for deduplication. Each
+chunk's emails are handed to one InvitationEmailSender as the chunk commits;
+its queue holds at most ``INVITE_IMPORT_SEND_QUEUE_CHUNKS`` chunks, so a slow
+mail server throttles the import rather than letting messages pile up.
+"""
+
+import csv
+import io
+import json
+from itertools import chain
+
+from django.conf import settings
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.validators import validate_email
+from django.db import transaction
+from rest_framework.exceptions import ValidationError
+
+from accounts.services import normalize_email
+from invitations.delivery import InvitationEmailSender
+from invitations.services import create_invitations
+
+CSV = "csv"
+NDJSON = "ndjson"
+FORMATS = (CSV, NDJSON)
+_NDJSON_SUFFIXES = (".ndjson", ".jsonl")
+_MAX_EMAIL_LENGTH = 254
+
+
+def detect_format(upload, requested: str | None = None) -> str:
+    if requested:
+        return requested
+    name = (upload.name or "").lower()
+    content_type = getattr(upload, "content_type", "") or ""
+    if name.endswith(_NDJSON_SUFFIXES) or "ndjson" in content_type:
+        return NDJSON
+    return CSV
+
+
+class _RowError(str):
+    """A row that failed to parse; the string is the error message."""
+
+
+def _iter_csv(text):
+    reader = csv.reader(text)
+    try:
+        header = next(reader, None)
+    except csv.Error as exc:
+        raise ValidationError({"file": f"Could not read the CSV header: {exc}."})
+    if header is None:
+        return
+    columns = [cell.strip().lower() for cell in header]
+    if "email" in columns:
+        index = columns.index("email")
+    elif len(header) == 1 and "@" in header[0]:
+        # A single column of addresses without a header row.
+        index = 0
+        reader = chain([header], reader)
+    else:
+        raise ValidationError({"file": "CSV uploads need an 'email' column."})
+    row_number = 0 if index == 0 and "email" not in columns else 1
+    while True:
+        row_number += 1
+        try:
+            row = next(reader)
+        except StopIteration:
+            return
+        except csv.Error as exc:
+            # e.g. a field over csv.field_size_limit(); the reader resumes on the next line.
+            yield row_number, _RowError(f"Could not parse row: {exc}.")
+            continue
+        if not any(cell.strip() for cell in row):
+            continue
+        yield row_number, row[index] if index < len(row) else ""
+
+
+def _iter_ndjson(text):
+    for row_number, line in enumerate(text, start=1):
+        if not line.strip():
+            continue
+        try:
+            value = json.loads(line)
+        except ValueError:
+            yield row_number, _RowError("Invalid JSON.")
+            continue
+        yield row_number, value.get("email") if isinstance(value, dict) else value
+
+
+def iter_import_rows(upload, input_format: str):
+    """Yield ``(row_number, raw_value)`` pairs without reading the whole upload."""
+    upload.seek(0)
+    text = io.TextIOWrapper(upload.file, encoding="utf-8-sig", errors="replace", newline="")
+    try:
+        yield from (_iter_ndjson(text) if input_format == NDJSON else _iter_csv(text))
+    finally:
+        # Leave the underlying file open for Django's upload cleanup.
+        text.detach()
+
+
+def _row_error(raw) -> str | None:
+    if isinstance(raw, _RowError):
+        return str(raw)
+    if not isinstance(raw, str) or not raw.strip():
+        return "Missing email."
+    if len(raw.strip()) > _MAX_EMAIL_LENGTH:
+        return "Email is too long."
+    try:
+        validate_email(raw.strip())
+    except DjangoValidationError:
+        return "Enter a valid email address."
+    return None
+
+
+def import_invitations(
+    *,
+    event,
+    created_by,
+    upload,
+    input_format: str,
+    send_email: bool = True,
+    expires_in_hours: int | None = None,
+) -> dict:
+    """
+    Invite every valid, distinct address in ``upload`` to ``event``. Returns
+    row totals and up to ``INVITE_IMPORT_MAX_ERRORS`` row-level errors.
+    """
+    chunk_size = settings.INVITE_IMPORT_CHUNK_SIZE
+    max_errors = settings.INVITE_IMPORT_MAX_ERRORS
+    report = {"rows": 0, "invited": 0, "duplicates": 0, "error_count": 0, "errors": []}
+    seen: set[str] = set()
+    chunk: list[str] = []
+    sender = InvitationEmailSender(max_pending=settings.INVITE_IMPORT_SEND_QUEUE_CHUNKS)
+
+    def flush():
+        outbox = []
+        # create_invitations() is atomic, so each chunk commits on its own.
+        create_invitations(
+            event=event,
+            created_by=created_by,
+            emails=chunk,
+            expires_in_hours=expires_in_hours,
+            send_email=send_email,
+            outbox=outbox,
+        )
+        if outbox:
+            transaction.on_commit(lambda: sender.send(outbox))
+        report["invited"] += len(chunk)
+        chunk.clear()
+
+    try:
+        for row_number, raw in iter_import_rows(upload, input_format):
+            report["rows"] += 1
+            error = _row_error(raw)
+            if error is not None:
+                report["error_count"] += 1
+                if len(report["errors"]) < max_errors:
+                    value = raw[:_MAX_EMAIL_LENGTH] if isinstance(raw, str) and not isinstance(raw, _RowError) else None
+                    report["errors"].append({"row": row_number, "value": value, "error": error})
+                continue
+            email = normalize_email(raw)
+            if email in seen:
+                report["duplicates"] += 1
+                continue
+            seen.add(email)
+            chunk.append(email)
+            if len(chunk) >= chunk_size:
+                flush()
+        if chunk:
+            flush()
+    finally:
+        transaction.on_commit(sender.close)
+    return report
@@ -0,0 +1,46 @@
+from django.contrib.auth import get_user_model
+from django.core.management.base import BaseCommand
+
+from accounts.services import user_ids_by_email
+from invitations.models import Invitation, InvitationStatus
+from invitations.services import link_pending_invitations
+
+User = get_user_model()
+
+
+class Command(BaseCommand):
+    help = "Attach pending email-only invitations to the accounts registered with those emails."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--chunk-size", type=int, default=500)
+
+    def handle(self, *args, **options):
+        emails = (
+            Invitation.objects.filter(invitee_user__isnull=True, status=InvitationStatus.PENDING)
+            .exclude(invitee_email_normalized="")
+            .values_list("invitee_email_normalized", flat=True)
+            .distinct()
+            .order_by("invitee_email_normalized")
+        )
+
+        linked = skipped = 0
+        chunk = []
+        for email in emails.iterator(chunk_size=options["chunk_size"]):
+            chunk.append(email)
+            if len(chunk) >= options["chunk_size"]:
+                chunk_linked, chunk_skipped = self._link_chunk(chunk)
+                linked, skipped = linked + chunk_linked, skipped + chunk_skipped
+                chunk = []
+        if chunk:
+            chunk_linked, chunk_skipped = self._link_chunk(chunk)
+            linked, skipped = linked + chunk_linked, skipped + chunk_skipped
+
+        self.stdout.write(self.style.SUCCESS(f"Linked {linked} invitation(s)."))
+        if skipped:
+            self.stdout.write(self.style.WARNING(f"Skipped {skipped} email(s) shared by several accounts."))
+
+    def _link_chunk(self, emails):
+        matches = user_ids_by_email(emails).values()
+        unique_ids = [user_ids[0] for user_ids in matches if len(user_ids) == 1]
+        linked = sum(link_pending_invitations(user) for user in User.objects.filter(id__in=unique_ids))
+        return linked, len(matches) - len(unique_ids)
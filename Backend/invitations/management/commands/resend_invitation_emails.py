@@ -0,0 +1,27 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand
+
+from invitations.services import resend_undelivered_invitations
+
+
+class Command(BaseCommand):
+    help = "Re-issue and send pending invitations whose email failed or never left the queue."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--stale-minutes",
+            type=int,
+            default=30,
+            help="Treat invitations queued longer than this as lost.",
+        )
+        parser.add_argument("--limit", type=int, default=None)
+
+    def handle(self, *args, **options):
+        sent, failed = resend_undelivered_invitations(
+            stale_after=timedelta(minutes=options["stale_minutes"]),
+            limit=options["limit"],
+        )
+        self.stdout.write(self.style.SUCCESS(f"Sent {sent} invitation email(s)."))
+        if failed:
+            self.stdout.write(self.style.WARNING(f"{failed} invitation email(s) failed again."))
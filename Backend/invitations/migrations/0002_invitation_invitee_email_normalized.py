@@ -0,0 +1,29 @@
+# Generated by Django 6.0.2 on 2026-10-16 23:41
+
+from django.db import migrations, models
+from django.db.models.functions import Lower, Trim
+
+
+def backfill_normalized_emails(apps, schema_editor):
+    Invitation = apps.get_model("invitations", "Invitation")
+    Invitation.objects.update(invitee_email_normalized=Lower(Trim("invitee_email")))
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('invitations', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='invitation',
+            name='invitee_email_normalized',
+            field=models.CharField(blank=True, editable=False, max_length=254),
+        ),
+        migrations.RunPython(backfill_normalized_emails, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='invitation',
+            index=models.Index(fields=['invitee_email_normalized', 'event'], name='invitations_invitee_eb09a8_idx'),
+        ),
+    ]
@@ -0,0 +1,37 @@
+# Generated by Django 6.0.2 on 2026-10-17 03:40
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('invitations', '0002_invitation_invitee_email_normalized'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='invitation',
+            name='delivered_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='invitation',
+            name='delivery_attempts',
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='invitation',
+            name='delivery_error',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.AddField(
+            model_name='invitation',
+            name='delivery_status',
+            field=models.CharField(choices=[('not_sent', 'Not sent'), ('queued', 'Queued'), ('sent', 'Sent'), ('failed', 'Failed')], default='not_sent', max_length=16),
+        ),
+        migrations.AddIndex(
+            model_name='invitation',
+            index=models.Index(fields=['delivery_status', 'updated_at'], name='invitations_deliver_4e7a5f_idx'),
+        ),
+    ]
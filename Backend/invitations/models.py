@@ -4,6 +4,8 @@ from django.db.models import Q
 from django.db.models.functions import Lower
 from django.utils import timezone
 
+from accounts.services import normalize_email
+
 
 class InvitationStatus(models.TextChoices):
     PENDING = "pending", "Pending"
@@ -11,6 +13,13 @@ class InvitationStatus(models.TextChoices):
     DECLINED = "declined", "Declined"
 
 
+class InvitationDeliveryStatus(models.TextChoices):
+    NOT_SENT = "not_sent", "Not sent"
+    QUEUED = "queued", "Queued"
+    SENT = "sent", "Sent"
+    FAILED = "failed", "Failed"
+
+
 class Invitation(models.Model):
     event = models.ForeignKey(
         "events.Event",
@@ -25,6 +34,8 @@ class Invitation(models.Model):
         related_name="received_invitations",
     )
     invitee_email = models.EmailField(blank=True)
+    # Lowercased copy of invitee_email; all email lookups compare against this column.
+    invitee_email_normalized = models.CharField(max_length=254, blank=True, editable=False)
     status = models.CharField(
         max_length=16,
         choices=InvitationStatus.choices,
@@ -40,11 +51,25 @@ class Invitation(models.Model):
         blank=True,
         related_name="created_invitations",
     )
+    # Written by invitations.delivery; never part of the invite/response flow.
+    delivery_status = models.CharField(
+        max_length=16,
+        choices=InvitationDeliveryStatus.choices,
+        default=InvitationDeliveryStatus.NOT_SENT,
+    )
+    delivery_attempts = models.PositiveSmallIntegerField(default=0)
+    delivered_at = models.DateTimeField(null=True, blank=True)
+    delivery_error = models.CharField(max_length=255, blank=True)
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        indexes = [models.Index(fields=("event", "status")), models.Index(fields=("expires_at",))]
+        indexes = [
+            models.Index(fields=("event", "status")),
+            models.Index(fields=("expires_at",)),
+            models.Index(fields=("invitee_email_normalized", "event")),
+            models.Index(fields=("delivery_status", "updated_at")),
+        ]
         constraints = [
             models.CheckConstraint(
                 name="invitation_target_present",
@@ -63,6 +88,13 @@ class Invitation(models.Model):
             ),
         ]
 
+    def save(self, *args, **kwargs):
+        self.invitee_email_normalized = normalize_email(self.invitee_email)
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "invitee_email" in update_fields:
+            kwargs["update_fields"] = {*update_fields, "invitee_email_normalized"}
+        super().save(*args, **kwargs)
+
     def is_expired(self) -> bool:
         return timezone.now() > self.expires_at
 
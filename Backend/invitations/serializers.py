@@ -1,6 +1,7 @@
 from django.contrib.auth import get_user_model
 from rest_framework import serializers
 
+from invitations import imports
 from invitations.models import Invitation, InvitationStatus
 
 User = get_user_model()
@@ -25,6 +26,8 @@ class InvitationSerializer(serializers.ModelSerializer):
             "status",
             "expires_at",
             "responded_at",
+            "delivery_status",
+            "delivered_at",
             "created_at",
             "updated_at",
         )
@@ -43,6 +46,10 @@ class InviteBatchCreateSerializer(serializers.Serializer):
         allow_empty=False,
     )
     expires_in_hours = serializers.IntegerField(min_value=1, max_value=24 * 90, required=False)
+    send_email = serializers.BooleanField(
+        default=True,
+        help_text="Email each invitee a link with their token after the request commits.",
+    )
 
     def validate(self, attrs):
         if not attrs.get("emails") and not attrs.get("user_ids"):
@@ -50,6 +57,31 @@ class InviteBatchCreateSerializer(serializers.Serializer):
         return attrs
 
 
+class InviteImportSerializer(serializers.Serializer):
+    file = serializers.FileField(help_text="CSV with an 'email' column, or NDJSON with one {\"email\": ...} per line.")
+    input = serializers.ChoiceField(
+        choices=imports.FORMATS,
+        required=False,
+        help_text="Defaults to ndjson for .ndjson/.jsonl files, csv otherwise.",
+    )
+    send_email = serializers.BooleanField(default=True)
+    expires_in_hours = serializers.IntegerField(min_value=1, max_value=24 * 90, required=False)
+
+
+class InviteImportErrorSerializer(serializers.Serializer):
+    row = serializers.IntegerField()
+    value = serializers.CharField(allow_null=True)
+    error = serializers.CharField()
+
+
+class InviteImportResultSerializer(serializers.Serializer):
+    rows = serializers.IntegerField()
+    invited = serializers.IntegerField()
+    duplicates = serializers.IntegerField()
+    error_count = serializers.IntegerField()
+    errors = InviteImportErrorSerializer(many=True)
+
+
 class InviteRespondSerializer(serializers.Serializer):
     status = serializers.ChoiceField(
         choices=[InvitationStatus.ACCEPTED, InvitationStatus.DECLINED],
@@ -7,11 +7,21 @@ from datetime import timedelta
 from django.conf import settings
 from django.contrib.auth import get_user_model
 from django.db import transaction
+from django.db.models import Q
 from django.utils import timezone
 from rest_framework.exceptions import NotFound, PermissionDenied, ValidationError
 
-from events.models import Participation, RSVPStatus
-from invitations.models import Invitation, InvitationStatus
+from accounts.services import normalize_email, user_ids_by_email
+from events.cache import ACCESS_NAMESPACE, bump_event_cache_version
+from events.models import EventAccessKind, EventMembership, Participation, RSVPStatus
+from events.services import adjust_rsvp_counters, rsvp_state, sync_event_memberships
+from invitations.delivery import (
+    queue_invitation_emails,
+    render_invitation_email,
+    render_outbox,
+    send_invitation_emails,
+)
+from invitations.models import Invitation, InvitationDeliveryStatus, InvitationStatus
 
 User = get_user_model()
 
@@ -28,13 +38,30 @@ def _normalized_emails(emails: list[str]) -> list[str]:
     seen = set()
     result = []
     for email in emails:
-        normalized = email.strip().lower()
+        normalized = normalize_email(email)
         if normalized and normalized not in seen:
             seen.add(normalized)
             result.append(normalized)
     return result
 
 
+_INVITATION_REFRESH_FIELDS = (
+    "invitee_user",
+    "invitee_email",
+    "invitee_email_normalized",
+    "token_hash",
+    "expires_at",
+    "status",
+    "responded_at",
+    "created_by",
+    "delivery_status",
+    "delivered_at",
+    "delivery_error",
+    "updated_at",
+)
+_INVITATION_WRITE_BATCH_SIZE = 500
+
+
 @transaction.atomic
 def create_invitations(
     *,
@@ -43,68 +70,151 @@ def create_invitations(
     emails: list[str] | None = None,
     user_ids: list[int] | None = None,
     expires_in_hours: int | None = None,
+    send_email: bool = False,
+    outbox: list | None = None,
 ) -> list[dict]:
+    """
+    Invite users and email addresses to ``event`` and return each invitation
+    with its raw token. Existing invitations for the same user or address are
+    re-issued with a fresh token. Runs in a fixed number of statements: one
+    read of the existing invitations, then one bulk_update and one bulk_create.
+    With ``send_email``, invitation emails are sent after the transaction
+    commits (see invitations.delivery), or appended to ``outbox`` for callers
+    that send several calls' messages together.
+    """
     emails = _normalized_emails(emails or [])
     user_ids = sorted(set(user_ids or []))
     expiry_hours = expires_in_hours or settings.INVITATION_TTL_HOURS
-    expires_at = timezone.now() + timedelta(hours=expiry_hours)
+    now = timezone.now()
+    expires_at = now + timedelta(hours=expiry_hours)
 
-    created = []
-    users = User.objects.filter(id__in=user_ids)
+    users = list(User.objects.filter(id__in=user_ids).order_by("id"))
+    user_emails = {user.id: normalize_email(user.email) for user in users}
+    lookup_emails = {*emails, *user_emails.values()} - {""}
+    by_user, by_email = {}, {}
+    for invitation in Invitation.objects.filter(event=event).filter(
+        Q(invitee_user_id__in=user_emails) | Q(invitee_email_normalized__in=lookup_emails)
+    ):
+        if invitation.invitee_user_id:
+            by_user[invitation.invitee_user_id] = invitation
+        if invitation.invitee_email_normalized:
+            by_email[invitation.invitee_email_normalized] = invitation
 
-    for user in users:
+    created, to_create, to_update, seen = [], [], [], set()
+
+    def issue(invitation, user=None, email=""):
         token = generate_invitation_token()
-        token_hash = hash_invitation_token(token)
-        invitation, _ = Invitation.objects.update_or_create(
-            event=event,
-            invitee_user=user,
-            defaults={
-                "invitee_email": (user.email or "").strip().lower(),
-                "token_hash": token_hash,
-                "expires_at": expires_at,
-                "status": InvitationStatus.PENDING,
-                "responded_at": None,
-                "created_by": created_by,
-            },
+        if invitation is None:
+            invitation = Invitation(event=event, invitee_email=email)
+            to_create.append(invitation)
+        else:
+            invitation.event = event
+            to_update.append(invitation)
+        if user is not None:
+            invitation.invitee_user = user
+            invitation.invitee_email = email
+        # Bulk writes bypass Invitation.save(), which keeps this column in sync.
+        invitation.invitee_email_normalized = normalize_email(invitation.invitee_email)
+        invitation.token_hash = hash_invitation_token(token)
+        invitation.expires_at = expires_at
+        invitation.status = InvitationStatus.PENDING
+        invitation.responded_at = None
+        invitation.created_by = created_by
+        invitation.delivery_status = (
+            InvitationDeliveryStatus.QUEUED
+            if send_email and invitation.invitee_email
+            else InvitationDeliveryStatus.NOT_SENT
         )
+        invitation.delivered_at = None
+        invitation.delivery_error = ""
+        invitation.updated_at = now
+        seen.add(id(invitation))
         created.append({"invitation": invitation, "token": token})
+        return invitation
+
+    for user in users:
+        email = user_emails[user.id]
+        existing = by_user.get(user.id)
+        if existing is None:
+            # An email-only invitation to the same address is claimed, since
+            # uniq_invite_email_per_event allows only one row per address.
+            candidate = by_email.get(email)
+            if candidate is not None and candidate.invitee_user_id is None and id(candidate) not in seen:
+                existing = candidate
+        invitation = issue(existing, user=user, email=email)
+        if email:
+            by_email[email] = invitation
 
     for email in emails:
-        token = generate_invitation_token()
-        token_hash = hash_invitation_token(token)
-        invitation = Invitation.objects.filter(event=event, invitee_email=email).first()
-        if invitation:
-            invitation.token_hash = token_hash
-            invitation.expires_at = expires_at
-            invitation.status = InvitationStatus.PENDING
-            invitation.responded_at = None
-            invitation.created_by = created_by
-            invitation.save(
-                update_fields=[
-                    "token_hash",
-                    "expires_at",
-                    "status",
-                    "responded_at",
-                    "created_by",
-                    "updated_at",
-                ]
-            )
-        else:
-            invitation = Invitation.objects.create(
-                event=event,
-                invitee_user=None,
-                invitee_email=email,
-                token_hash=token_hash,
-                expires_at=expires_at,
-                status=InvitationStatus.PENDING,
-                responded_at=None,
-                created_by=created_by,
-            )
-        created.append({"invitation": invitation, "token": token})
+        existing = by_email.get(email)
+        if existing is not None and id(existing) in seen:
+            # Already re-issued for the matching user above.
+            continue
+        issue(existing, email=email)
+
+    if to_update:
+        Invitation.objects.bulk_update(
+            to_update, _INVITATION_REFRESH_FIELDS, batch_size=_INVITATION_WRITE_BATCH_SIZE
+        )
+    if to_create:
+        Invitation.objects.bulk_create(to_create, batch_size=_INVITATION_WRITE_BATCH_SIZE)
+
+    # Bulk writes skip the post_save signal that invalidates access decisions.
+    bump_event_cache_version(ACCESS_NAMESPACE, event.id)
+    affected_user_ids = {user.id for user in users}
+    for matched_ids in user_ids_by_email(emails).values():
+        affected_user_ids.update(matched_ids)
+    if affected_user_ids:
+        sync_event_memberships(event, affected_user_ids)
+    if send_email and outbox is not None:
+        outbox.extend(render_outbox(created))
+    elif send_email:
+        queue_invitation_emails(created)
 
     return created
 
 
+def resend_undelivered_invitations(*, stale_after: timedelta, limit: int | None = None) -> tuple[int, int]:
+    """
+    Re-issue pending invitations whose email failed, or is still queued after
+    ``stale_after`` (e.g. the sending process died), and send them inline.
+    Fresh tokens are needed because only their hashes are stored. Returns
+    ``(sent, failed)`` message counts.
+    """
+    now = timezone.now()
+    invitations = (
+        Invitation.objects.select_related("event", "created_by")
+        .filter(status=InvitationStatus.PENDING, expires_at__gte=now)
+        .exclude(invitee_email="")
+        .filter(
+            Q(delivery_status=InvitationDeliveryStatus.FAILED)
+            | Q(delivery_status=InvitationDeliveryStatus.QUEUED, updated_at__lt=now - stale_after)
+        )
+        .order_by("id")
+    )
+    if limit is not None:
+        invitations = invitations[:limit]
+    invitations = list(invitations)
+    if not invitations:
+        return 0, 0
+
+    outbox = []
+    for invitation in invitations:
+        token = generate_invitation_token()
+        invitation.token_hash = hash_invitation_token(token)
+        invitation.delivery_status = InvitationDeliveryStatus.QUEUED
+        invitation.delivery_error = ""
+        invitation.updated_at = now
+        outbox.append((invitation.id, render_invitation_email(invitation, token)))
+    with transaction.atomic():
+        Invitation.objects.bulk_update(
+            invitations,
+            ("token_hash", "delivery_status", "delivery_error", "updated_at"),
+            batch_size=_INVITATION_WRITE_BATCH_SIZE,
+        )
+    return send_invitation_emails(outbox)
+
+
 @transaction.atomic
 def respond_to_invitation(*, token: str, user, status: str):
     invitation = Invitation.objects.select_related("event", "invitee_user").filter(
@@ -118,9 +228,8 @@ def respond_to_invitation(*, token: str, user, status: str):
     if invitation.invitee_user_id and invitation.invitee_user_id != user.id:
         raise PermissionDenied("This invitation is not assigned to your account.")
 
-    invite_email = (invitation.invitee_email or "").strip().lower()
-    user_email = (user.email or "").strip().lower()
-    if invite_email and invite_email != user_email:
+    invite_email = invitation.invitee_email_normalized
+    if invite_email and invite_email != normalize_email(user.email):
         raise PermissionDenied("Invitation email does not match your account email.")
 
     invitation.status = status
@@ -129,10 +238,62 @@ def respond_to_invitation(*, token: str, user, status: str):
         invitation.invitee_user = user
     invitation.save(update_fields=["status", "responded_at", "invitee_user", "updated_at"])
 
-    participation, _ = Participation.objects.get_or_create(event=invitation.event, user=user)
+    participation, _ = Participation.objects.select_for_update().get_or_create(
+        event=invitation.event, user=user
+    )
+    # A new row was already counted as pending by the post_save signal.
+    before = rsvp_state(participation)
     participation.rsvp_status = (
         RSVPStatus.ACCEPTED if status == InvitationStatus.ACCEPTED else RSVPStatus.DECLINED
     )
     participation.save(update_fields=["rsvp_status", "updated_at"])
+    adjust_rsvp_counters(invitation.event_id, before, rsvp_state(participation))
 
     return invitation, participation
+
+
+@transaction.atomic
+def link_pending_invitations(user) -> int:
+    """
+    Attach pending email-only invitations addressed to ``user`` to the account
+    with a single UPDATE, so later access checks can match on invitee_user_id.
+    Returns the number of invitations linked.
+    """
+    email = normalize_email(user.email)
+    if not email:
+        return 0
+
+    pending = (
+        Invitation.objects.filter(
+            invitee_user__isnull=True,
+            invitee_email_normalized=email,
+            status=InvitationStatus.PENDING,
+        )
+        # uniq_invite_user_per_event: keep an existing per-user invitation as-is.
+        .exclude(event__invitations__invitee_user=user)
+    )
+    linked = list(pending.values_list("id", "event_id", "expires_at"))
+    if not linked:
+        return 0
+    Invitation.objects.filter(id__in=[invitation_id for invitation_id, _, _ in linked]).update(
+        invitee_user=user,
+        updated_at=timezone.now(),
+    )
+
+    # The email already granted access, so cached decisions stay valid; only
+    # accounts created after the invite are missing their membership row.
+    now = timezone.now()
+    EventMembership.objects.bulk_create(
+        [
+            EventMembership(
+                event_id=event_id,
+                user=user,
+                access_kind=EventAccessKind.INVITEE,
+                valid_until=expires_at,
+            )
+            for _, event_id, expires_at in linked
+            if expires_at >= now
+        ],
+        ignore_conflicts=True,
+    )
+    return len(linked)
@@ -1,8 +1,9 @@
 from django.urls import path
 
-from invitations.views import EventInviteCreateView, InviteRespondView
+from invitations.views import EventInviteCreateView, EventInviteImportView, InviteRespondView
 
 urlpatterns = [
     path("events/<int:pk>/invites", EventInviteCreateView.as_view(), name="event-invites"),
+    path("events/<int:pk>/invites/import", EventInviteImportView.as_view(), name="event-invites-import"),
     path("invites/<str:token>/respond", InviteRespondView.as_view(), name="invite-respond"),
 ]
@@ -1,21 +1,29 @@
-from django.shortcuts import get_object_or_404
+from django.db import transaction
+from django.utils.decorators import method_decorator
+from drf_spectacular.utils import extend_schema
 from rest_framework import generics, permissions, status
+from rest_framework.parsers import MultiPartParser
 from rest_framework.response import Response
 
-from events.models import Event
+from events.mixins import EventContextMixin
 from events.serializers import ParticipationSerializer
-from events.services import ensure_event_owner
-from invitations.serializers import InviteBatchCreateSerializer, InviteRespondSerializer, InvitationSerializer
+from invitations import imports
+from invitations.serializers import (
+    InviteBatchCreateSerializer,
+    InviteImportResultSerializer,
+    InviteImportSerializer,
+    InviteRespondSerializer,
+    InvitationSerializer,
+)
 from invitations.services import create_invitations, respond_to_invitation
 
 
-class EventInviteCreateView(generics.GenericAPIView):
+class EventInviteCreateView(EventContextMixin, generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = InviteBatchCreateSerializer
 
     def post(self, request, pk):
-        event = get_object_or_404(Event, pk=pk)
-        ensure_event_owner(event, request.user)
+        event = self.get_owned_event()
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
@@ -25,6 +33,7 @@ class EventInviteCreateView(generics.GenericAPIView):
             emails=serializer.validated_data.get("emails"),
             user_ids=serializer.validated_data.get("user_ids"),
             expires_in_hours=serializer.validated_data.get("expires_in_hours"),
+            send_email=serializer.validated_data["send_email"],
         )
         payload = [
             {
@@ -36,6 +45,38 @@ class EventInviteCreateView(generics.GenericAPIView):
         return Response({"results": payload}, status=status.HTTP_201_CREATED)
 
 
+# Chunks commit one by one instead of inside a single request transaction.
+@method_decorator(transaction.non_atomic_requests, name="dispatch")
+class EventInviteImportView(EventContextMixin, generics.GenericAPIView):
+    """
+    Owner-only bulk invite from an uploaded CSV or NDJSON file. Addresses are
+    validated, deduplicated and invited in chunks; invitation emails carry
+    the tokens, which are not returned. Rows that could not be imported are
+    listed under ``errors``.
+    """
+
+    permission_classes = [permissions.IsAuthenticated]
+    serializer_class = InviteImportSerializer
+    parser_classes = [MultiPartParser]
+
+    @extend_schema(request=InviteImportSerializer, responses={200: InviteImportResultSerializer})
+    def post(self, request, pk):
+        event = self.get_owned_event()
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        upload = serializer.validated_data["file"]
+
+        report = imports.import_invitations(
+            event=event,
+            created_by=request.user,
+            upload=upload,
+            input_format=imports.detect_format(upload, serializer.validated_data.get("input")),
+            send_email=serializer.validated_data["send_email"],
+            expires_in_hours=serializer.validated_data.get("expires_in_hours"),
+        )
+        return Response(InviteImportResultSerializer(report).data)
+
+
 class InviteRespondView(generics.GenericAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = InviteRespondSerializer
@@ -3,32 +3,33 @@ from drf_spectacular.utils import extend_schema
 from rest_framework import generics, permissions, status
 from rest_framework.response import Response
 
-from events.models import Event
-from events.services import ensure_event_access, ensure_event_owner
+from events.mixins import EventContextMixin
+from events.services import ensure_event_access
+from hive.api.conditional import ConditionalGetMixin, collection_state
 from polls.models import Poll
 from polls.serializers import PollResultsSerializer, PollSerializer, VoteInputSerializer, VoteResponseSerializer
 from polls.services import cast_vote, create_poll_with_options, get_poll_results
 
 
-class EventPollListCreateView(generics.ListCreateAPIView):
+class EventPollListCreateView(ConditionalGetMixin, EventContextMixin, generics.ListCreateAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = PollSerializer
     queryset = Poll.objects.none()
+    cursor_ordering = ("id",)
 
-    def get_event(self):
-        return get_object_or_404(Event, pk=self.kwargs["pk"])
+    def get_conditional_state(self):
+        # Options are written together with their poll and never edited alone.
+        return (collection_state(Poll.objects.filter(event=self.get_member_event())),)
 
     def get_queryset(self):
         event_id = self.kwargs.get("pk")
         if event_id is None:
             return Poll.objects.none()
-        event = self.get_event()
-        ensure_event_access(event, self.request.user)
+        event = self.get_member_event()
         return Poll.objects.filter(event=event).prefetch_related("options").order_by("id")
 
     def create(self, request, *args, **kwargs):
-        event = self.get_event()
-        ensure_event_owner(event, request.user)
+        event = self.get_owned_event()
         serializer = self.get_serializer(data=request.data)
         serializer.is_valid(raise_exception=True)
         poll_data = serializer.validated_data.copy()
@@ -0,0 +1,14 @@
+import pytest
+from django.core.cache import cache
+
+from events.custom_fields import clear_compiled_schemas
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    # Database rows are rolled back between tests but LocMemCache is not.
+    cache.clear()
+    clear_compiled_schemas()
+    yield
+    cache.clear()
+    clear_compiled_schemas()
@@ -1,14 +1,52 @@
-from datetime import timedelta
+import json
+import smtplib
+import threading
+from datetime import datetime, timedelta
+from zoneinfo import ZoneInfo
 
 import pytest
 from django.contrib.auth import get_user_model
-from django.db import IntegrityError
+from django.core import mail
+from django.core.mail.backends import locmem
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.db import IntegrityError, connection
+from django.test.utils import CaptureQueriesContext
 from django.utils import timezone
-from rest_framework.test import APIClient
-
-from events.models import Comment, CustomFieldValue, Document, Event, EventImage, Participation, Reaction, RSVPStatus
+from rest_framework.exceptions import ValidationError
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIClient, APIRequestFactory
+
+from events import recurrence
+from events.models import (
+    Comment,
+    CustomFieldDefinition,
+    CustomFieldType,
+    CustomFieldValue,
+    Document,
+    Event,
+    EventAccessKind,
+    EventImage,
+    EventMembership,
+    Participation,
+    Reaction,
+    RSVPStatus,
+)
+from events.serializers import ParticipationSerializer
+from events.services import (
+    can_user_access_event,
+    reconcile_rsvp_counters,
+    replace_contributions,
+    resolve_event_for_user,
+    save_custom_field_answers,
+)
+from events.views import EventListCreateView
+from hive.api.pagination import HiveCursorPagination, HivePagination
+from invitations import delivery
 from invitations.models import Invitation
-from polls.models import Vote, VoteSubmission
+from invitations.services import create_invitations, hash_invitation_token
+from polls.models import Poll, Vote, VoteSubmission
 
 User = get_user_model()
 
@@ -182,6 +220,467 @@ def test_participant_self_update_including_contributions_and_custom_answers():
     assert value.value == "juice"
 
 
+@pytest.mark.django_db
+def test_event_rsvp_counters_follow_participation_changes():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    alice = User.objects.create_user(username="alice", password="password123", email="alice@x.com")
+    bob = User.objects.create_user(username="bob", password="password123", email="bob@x.com")
+    owner_client = APIClient()
+    owner_client.force_authenticate(user=owner)
+    created = owner_client.post(
+        "/api/events",
+        {"location": "Garden", "starts_at": _iso(timezone.now() + timedelta(days=3))},
+        format="json",
+    )
+    assert created.data["accepted_count"] == 1
+    event_id = created.data["id"]
+    invites = owner_client.post(f"/api/events/{event_id}/invites", {"user_ids": [alice.id, bob.id]}, format="json")
+    tokens = {row["invitation"]["invitee_user"]["id"]: row["token"] for row in invites.data["results"]}
+
+    alice_client = APIClient()
+    alice_client.force_authenticate(user=alice)
+    alice_client.post(f"/api/invites/{tokens[alice.id]}/respond", {"status": "accepted"}, format="json")
+    alice_client.patch(f"/api/events/{event_id}/me", {"plus_one_count": 2}, format="json")
+    bob_client = APIClient()
+    bob_client.force_authenticate(user=bob)
+    bob_client.patch(f"/api/events/{event_id}/me", {"notes": "Maybe"}, format="json")
+
+    counts = ("accepted_count", "pending_count", "declined_count", "plus_one_total")
+    detail = owner_client.get(f"/api/events/{event_id}").data
+    assert [detail[key] for key in counts] == [2, 1, 0, 2]
+
+    alice_client.patch(f"/api/events/{event_id}/me", {"rsvp_status": "declined"}, format="json")
+    bob_client.post(f"/api/invites/{tokens[bob.id]}/respond", {"status": "accepted"}, format="json")
+    detail = owner_client.get(f"/api/events/{event_id}").data
+    assert [detail[key] for key in counts] == [2, 0, 1, 0]
+
+    Participation.objects.filter(event_id=event_id, user=bob).delete()
+    Event.objects.filter(pk=event_id).update(declined_count=7)
+    call_command("reconcile_rsvp_counters", stdout=None)
+    event = Event.objects.get(pk=event_id)
+    assert [getattr(event, key) for key in counts] == [1, 0, 1, 0]
+
+
+@pytest.mark.django_db
+def test_rsvp_counters_follow_participations_written_outside_the_services():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    guest = User.objects.create_user(username="guest", password="password123", email="guest@x.com")
+    event = Event.objects.create(owner=owner, location="Hall", starts_at=timezone.now() + timedelta(days=1))
+    counts = ("accepted_count", "pending_count", "declined_count", "plus_one_total")
+
+    participation = Participation.objects.create(
+        event=event, user=guest, rsvp_status=RSVPStatus.ACCEPTED, plus_one_count=2
+    )
+    event.refresh_from_db()
+    assert [getattr(event, key) for key in counts] == [1, 0, 0, 2]
+
+    participation.delete()
+    event.refresh_from_db()
+    assert [getattr(event, key) for key in counts] == [0, 0, 0, 0]
+    assert reconcile_rsvp_counters([event.id]) == 0
+
+
+@pytest.mark.django_db
+def test_event_detail_and_lists_answer_conditional_gets_with_304():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    guest = User.objects.create_user(username="guest", password="password123", email="guest@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    event_id = client.post(
+        "/api/events",
+        {"location": "Hall", "starts_at": _iso(timezone.now() + timedelta(days=2))},
+        format="json",
+    ).data["id"]
+
+    first = client.get(f"/api/events/{event_id}")
+    assert first.status_code == 200
+    etag = first["ETag"]
+    assert "Last-Modified" in first
+    not_modified = client.get(f"/api/events/{event_id}", HTTP_IF_NONE_MATCH=etag)
+    assert not_modified.status_code == 304
+    assert not_modified.content == b""
+
+    # A new participant only moves the RSVP counters, not updated_at.
+    Participation.objects.create(event_id=event_id, user=guest)
+    changed = client.get(f"/api/events/{event_id}", HTTP_IF_NONE_MATCH=etag)
+    assert changed.status_code == 200
+    assert changed["ETag"] != etag
+
+    participants = client.get(f"/api/events/{event_id}/participants")
+    etag = participants["ETag"]
+    assert client.get(f"/api/events/{event_id}/participants", HTTP_IF_NONE_MATCH=etag).status_code == 304
+    assert client.get(f"/api/events/{event_id}/participants?page=2", HTTP_IF_NONE_MATCH=etag).status_code != 304
+    client.patch(f"/api/events/{event_id}/me", {"allergies": "Nuts"}, format="json")
+    assert client.get(f"/api/events/{event_id}/participants", HTTP_IF_NONE_MATCH=etag).status_code == 200
+
+    stranger = User.objects.create_user(username="stranger", password="password123", email="s@x.com")
+    client.force_authenticate(user=stranger)
+    assert client.get(f"/api/events/{event_id}", HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 403
+
+
+@pytest.mark.django_db
+def test_event_detail_etag_changes_when_next_occurrence_passes(monkeypatch):
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    base = (timezone.now() + timedelta(hours=1)).replace(microsecond=0)
+    event_id = client.post(
+        "/api/events",
+        {
+            "location": "Track",
+            "starts_at": _iso(base),
+            "ends_at": _iso(base + timedelta(hours=1)),
+            "recurrence_frequency": "daily",
+            "recurrence_count": 5,
+        },
+        format="json",
+    ).data["id"]
+
+    first = client.get(f"/api/events/{event_id}")
+    assert first.data["next_occurrence"] == _iso(base)
+    assert client.get(f"/api/events/{event_id}", HTTP_IF_NONE_MATCH=first["ETag"]).status_code == 304
+
+    # Nothing is written once the first occurrence is over, but the payload changes.
+    later = base + timedelta(hours=3)
+    monkeypatch.setattr(timezone, "now", lambda: later)
+    moved_on = client.get(f"/api/events/{event_id}", HTTP_IF_NONE_MATCH=first["ETag"])
+    assert moved_on.status_code == 200
+    assert moved_on["ETag"] != first["ETag"]
+    assert moved_on.data["next_occurrence"] == _iso(base + timedelta(days=1))
+
+
+@pytest.mark.django_db
+def test_home_dashboard_is_one_request_with_bounded_queries(django_assert_num_queries):
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    guest = User.objects.create_user(username="guest", password="password123", email="guest@x.com")
+    owner_client = APIClient()
+    owner_client.force_authenticate(user=owner)
+    now = timezone.now()
+    weekly_start = now - timedelta(days=5)
+    event_ids = []
+    for title, starts_at, extra in [
+        ("Past", now - timedelta(days=3), {}),
+        ("Soon", now + timedelta(days=1), {}),
+        ("Later", now + timedelta(days=9), {}),
+        # Started before everything else, next meets between Soon and Later.
+        ("Weekly", weekly_start, {"recurrence_frequency": "weekly", "recurrence_count": 4}),
+    ]:
+        payload = {"title": title, "location": "Here", "starts_at": _iso(starts_at), **extra}
+        created = owner_client.post("/api/events", payload, format="json")
+        event_ids.append(created.data["id"])
+        owner_client.post(f"/api/events/{created.data['id']}/invites", {"emails": ["GUEST@x.com"]}, format="json")
+    soon_id = event_ids[1]
+    for question in ("Snacks?", "Music?"):
+        owner_client.post(
+            f"/api/events/{soon_id}/polls",
+            {"question": question, "options": [{"label": "Yes"}, {"label": "No"}]},
+            format="json",
+        )
+    answered = Poll.objects.get(question="Music?")
+    guest_client = APIClient()
+    guest_client.force_authenticate(user=guest)
+    guest_client.post(f"/api/polls/{answered.id}/vote", {"option_ids": [answered.options.first().id]}, format="json")
+
+    # Six SELECTs plus the ATOMIC_REQUESTS savepoint and its release.
+    with django_assert_num_queries(8):
+        response = guest_client.get("/api/me/home")
+    assert response.status_code == 200
+    assert [(e["title"], e["my_rsvp_status"]) for e in response.data["upcoming_events"]] == [
+        ("Soon", "pending"),
+        ("Weekly", None),
+        ("Later", None),
+    ]
+    assert response.data["upcoming_events"][1]["next_occurrence"] == _iso(weekly_start + timedelta(weeks=1))
+    # Voting created a participation but left the invitation itself pending.
+    assert [i["event"]["title"] for i in response.data["pending_invitations"]] == ["Soon", "Later", "Weekly"]
+    assert [(p["question"], len(p["options"])) for p in response.data["open_polls"]] == [("Snacks?", 2)]
+
+
+@pytest.mark.django_db
+def test_event_batch_fetch_returns_accessible_events_keyed_by_id(django_assert_num_queries, settings):
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    guest = User.objects.create_user(username="guest", password="password123", email="guest@x.com")
+    starts_at = timezone.now() + timedelta(days=2)
+    weekly = {"recurrence_frequency": "weekly", "recurrence_count": 4}
+    invited = Event.objects.create(owner=owner, title="Invited", location="A", starts_at=starts_at, **weekly)
+    hidden = Event.objects.create(owner=owner, title="Hidden", location="B", starts_at=starts_at)
+    own = Event.objects.create(owner=guest, title="Own", location="C", starts_at=starts_at, **weekly)
+    Invitation.objects.create(
+        event=invited,
+        invitee_email="Guest@x.com",
+        token_hash="batch-token",
+        expires_at=timezone.now() + timedelta(days=1),
+    )
+
+    client = APIClient()
+    client.force_authenticate(user=guest)
+    ids = [invited.id, hidden.id, own.id, 999, invited.id]
+    # The events and, for next_occurrence, all their overrides in one more
+    # SELECT, plus the ATOMIC_REQUESTS savepoint and its release.
+    with django_assert_num_queries(4):
+        response = client.post("/api/events/batch", {"ids": ids}, format="json")
+    assert response.status_code == 200
+    assert set(response.data["results"]) == {str(invited.id), str(own.id)}
+    assert response.data["results"][str(invited.id)]["title"] == "Invited"
+    assert response.data["results"][str(own.id)]["next_occurrence"] == _iso(starts_at)
+    assert response.data["missing"] == [hidden.id, 999]
+
+    settings.EVENT_BATCH_MAX_IDS = 2
+    assert client.post("/api/events/batch", {"ids": [1, 2, 3]}, format="json").status_code == 400
+
+
+@pytest.mark.django_db
+def test_participants_fast_path_matches_serializer_output(django_assert_num_queries):
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    event_id = client.post(
+        "/api/events",
+        {"location": "Barn", "starts_at": _iso(timezone.now() + timedelta(days=4))},
+        format="json",
+    ).data["id"]
+    client.post(
+        f"/api/events/{event_id}/custom-fields",
+        {"key": "diet", "label": "Diet", "field_type": "enum", "options": ["vegan", "any"]},
+        format="json",
+    )
+    guests = [
+        User.objects.create_user(username=f"guest{i}", password="password123", email=f"g{i}@x.com")
+        for i in range(3)
+    ]
+    client.post(f"/api/events/{event_id}/invites", {"user_ids": [g.id for g in guests]}, format="json")
+    for index, guest in enumerate(guests):
+        guest_client = APIClient()
+        guest_client.force_authenticate(user=guest)
+        payload = {"plus_one_count": index, "notes": f"note {index}"}
+        if index:
+            payload["contributions"] = [{"item_name": "Bread"}, {"item_name": "Apples", "quantity": index}]
+            payload["custom_field_answers"] = {"diet": "vegan"}
+        guest_client.patch(f"/api/events/{event_id}/me", payload, format="json")
+
+    # Savepoint, event lookup, ETag aggregates (3), COUNT, rows, contributions,
+    # answers, release: fixed regardless of the number of participants.
+    with django_assert_num_queries(10):
+        response = client.get(f"/api/events/{event_id}/participants")
+    assert response.status_code == 200
+
+    participations = (
+        Participation.objects.filter(event_id=event_id)
+        .select_related("user", "event")
+        .prefetch_related("contributions", "custom_field_values__definition")
+        .order_by("id")
+    )
+    expected = JSONRenderer().render(ParticipationSerializer(participations, many=True).data)
+    assert json.loads(response.content)["results"] == json.loads(expected)
+    assert len(response.data["results"]) == 4
+
+
+@pytest.mark.django_db
+def test_participants_export_streams_csv_and_ndjson(settings):
+    settings.PARTICIPANT_EXPORT_CHUNK_SIZE = 2
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    event_id = client.post(
+        "/api/events",
+        {"location": "Barn", "starts_at": _iso(timezone.now() + timedelta(days=4))},
+        format="json",
+    ).data["id"]
+    client.post(
+        f"/api/events/{event_id}/custom-fields",
+        {"key": "shirt_size", "label": "Shirt size", "field_type": "enum", "options": ["S", "M"]},
+        format="json",
+    )
+    guests = [
+        User.objects.create_user(username=f"guest{i}", password="password123", email=f"g{i}@x.com")
+        for i in range(3)
+    ]
+    client.post(f"/api/events/{event_id}/invites", {"user_ids": [g.id for g in guests]}, format="json")
+    guest_client = APIClient()
+    guest_client.force_authenticate(user=guests[0])
+    guest_client.patch(
+        f"/api/events/{event_id}/me",
+        {
+            "allergies": "=HYPERLINK(\"x\")",
+            "contributions": [{"item_name": "Cake", "quantity": 2}],
+            "custom_field_answers": {"shirt_size": "M"},
+        },
+        format="json",
+    )
+    for guest in guests[1:]:
+        Participation.objects.create(event_id=event_id, user=guest)
+
+    response = client.get(f"/api/events/{event_id}/participants/export")
+    assert response.status_code == 200
+    assert response.streaming
+    assert response["Content-Type"].startswith("text/csv")
+    lines = b"".join(response.streaming_content).decode().splitlines()
+    assert lines[0].endswith("contributions,shirt_size")
+    assert len(lines) == 1 + 4
+    guest_line = next(line for line in lines if ",guest0," in line)
+    assert "'=HYPERLINK" in guest_line and "2 x Cake" in guest_line and guest_line.endswith(",M")
+
+    ndjson = client.get(f"/api/events/{event_id}/participants/export", {"output": "ndjson"})
+    rows = [json.loads(line) for line in b"".join(ndjson.streaming_content).decode().splitlines()]
+    assert [row["user"]["username"] for row in rows] == ["owner", "guest0", "guest1", "guest2"]
+    assert client.get(f"/api/events/{event_id}/participants/export", {"output": "xml"}).status_code == 400
+
+    guest_client.force_authenticate(user=guests[0])
+    assert guest_client.get(f"/api/events/{event_id}/participants/export").status_code == 403
+
+
+@pytest.mark.django_db
+def test_custom_field_summary_aggregates_answers_and_is_cached():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    event_id = client.post(
+        "/api/events",
+        {"location": "Barn", "starts_at": _iso(timezone.now() + timedelta(days=4))},
+        format="json",
+    ).data["id"]
+    for definition in (
+        {"key": "diet", "label": "Diet", "field_type": "enum", "options": ["vegan", "meat"]},
+        {"key": "drives", "label": "Drives", "field_type": "bool"},
+        {"key": "age", "label": "Age", "field_type": "number"},
+    ):
+        client.post(f"/api/events/{event_id}/custom-fields", definition, format="json")
+    answers = [
+        ({"diet": "vegan", "drives": True, "age": 20}, "Nuts, Gluten"),
+        ({"diet": "vegan", "drives": False, "age": 30}, "nuts; lactose"),
+        ({"diet": "meat", "age": 40}, ""),
+    ]
+    guests = []
+    for i, (custom_field_answers, allergies) in enumerate(answers):
+        guest = User.objects.create_user(username=f"guest{i}", password="password123", email=f"g{i}@x.com")
+        client.post(f"/api/events/{event_id}/invites", {"user_ids": [guest.id]}, format="json")
+        guest_client = APIClient()
+        guest_client.force_authenticate(user=guest)
+        response = guest_client.patch(
+            f"/api/events/{event_id}/me",
+            {"allergies": allergies, "custom_field_answers": custom_field_answers},
+            format="json",
+        )
+        assert response.status_code == 200
+        guests.append(guest_client)
+
+    url = f"/api/events/{event_id}/custom-fields/summary"
+    summary = client.get(url)
+    assert summary.status_code == 200
+    assert summary.data["participant_count"] == 4
+    diet, drives, age = summary.data["fields"]
+    assert diet["counts"] == {"vegan": 2, "meat": 1}
+    assert drives["counts"] == {"true": 1, "false": 1} and drives["true_ratio"] == 0.5
+    assert age["answered"] == 3
+    assert age["numeric"]["median"] == 30 and age["numeric"]["p90"] == 38
+    assert summary.data["allergies"]["participants_with_allergies"] == 2
+    assert summary.data["allergies"]["items"][0] == {"name": "nuts", "count": 2}
+
+    with CaptureQueriesContext(connection) as queries:
+        assert client.get(url).data == summary.data
+    assert not any("events_customfieldvalue" in query["sql"] for query in queries.captured_queries)
+
+    guests[2].patch(f"/api/events/{event_id}/me", {"custom_field_answers": {"diet": "vegan"}}, format="json")
+    assert client.get(url).data["fields"][0]["counts"] == {"vegan": 3, "meat": 0}
+    assert guests[0].get(url).status_code == 403
+
+
+@pytest.mark.django_db
+def test_contribution_rollup_groups_by_normalized_name_and_caches_pages(monkeypatch):
+    monkeypatch.setattr(HiveCursorPagination, "page_size", 2)
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    event_id = client.post(
+        "/api/events",
+        {"location": "Park", "starts_at": _iso(timezone.now() + timedelta(days=2))},
+        format="json",
+    ).data["id"]
+    guest = User.objects.create_user(username="guest", password="password123", email="guest@x.com")
+    client.post(f"/api/events/{event_id}/invites", {"user_ids": [guest.id]}, format="json")
+    guest_client = APIClient()
+    guest_client.force_authenticate(user=guest)
+    client.patch(
+        f"/api/events/{event_id}/me",
+        {"contributions": [{"item_name": "Salad", "quantity": 1}, {"item_name": "Beer", "quantity": 6}]},
+        format="json",
+    )
+    guest_client.patch(
+        f"/api/events/{event_id}/me",
+        {"contributions": [{"item_name": " salad ", "quantity": 2}, {"item_name": "Chips", "quantity": 3}]},
+        format="json",
+    )
+
+    url = f"/api/events/{event_id}/contributions/rollup"
+    first = guest_client.get(url)
+    assert first.status_code == 200
+    assert [row["name_key"] for row in first.data["results"]] == ["beer", "chips"]
+    second = guest_client.get(first.data["next"])
+    (salad,) = second.data["results"]
+    assert salad["total_quantity"] == 3 and salad["item_count"] == 2
+    assert [c["username"] for c in salad["contributors"]] == ["owner", "guest"]
+
+    with CaptureQueriesContext(connection) as queries:
+        assert guest_client.get(url).data == first.data
+    assert not any("GROUP BY" in query["sql"] for query in queries.captured_queries)
+
+    guest_client.patch(
+        f"/api/events/{event_id}/me",
+        {"contributions": [{"item_name": "Beer", "quantity": 4}]},
+        format="json",
+    )
+    beer, salad = guest_client.get(url).data["results"]
+    assert beer["total_quantity"] == 10 and salad["total_quantity"] == 1
+
+
+@pytest.mark.django_db
+def test_owner_bulk_updates_participations_in_one_request(django_assert_max_num_queries):
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    event = Event.objects.create(owner=owner, location="Hall", starts_at=timezone.now() + timedelta(days=1))
+    guests = [
+        User.objects.create_user(username=f"guest{i}", password="password123", email=f"g{i}@x.com")
+        for i in range(30)
+    ]
+    participations = [Participation.objects.create(event=event, user=guest) for guest in guests]
+    other_event = Event.objects.create(owner=owner, location="Elsewhere", starts_at=timezone.now())
+    foreign = Participation.objects.create(event=other_event, user=guests[0])
+
+    updates = [
+        {"id": p.id, "rsvp_status": RSVPStatus.ACCEPTED, "plus_one_count": 1, "notes": "checked in"}
+        for p in participations
+    ]
+    updates[0] = {"id": participations[0].id, "rsvp_status": RSVPStatus.PENDING}
+    updates.append({"id": foreign.id, "rsvp_status": RSVPStatus.DECLINED})
+    with django_assert_max_num_queries(10):
+        response = client.patch(f"/api/events/{event.id}/participants", {"updates": updates}, format="json")
+    assert response.status_code == 200
+    statuses = [row["status"] for row in response.data["results"]]
+    assert statuses == ["unchanged"] + ["updated"] * 29 + ["not_found"]
+
+    event.refresh_from_db()
+    assert (event.accepted_count, event.pending_count, event.plus_one_total) == (29, 1, 29)
+    assert Participation.objects.get(id=participations[5].id).notes == "checked in"
+    assert Participation.objects.get(id=foreign.id).rsvp_status == RSVPStatus.PENDING
+
+    invalid = client.patch(
+        f"/api/events/{event.id}/participants",
+        {"updates": [{"id": participations[1].id, "rsvp_status": "maybe"}, {"id": participations[1].id}]},
+        format="json",
+    )
+    assert invalid.status_code == 400
+
+    guest_client = APIClient()
+    guest_client.force_authenticate(user=guests[1])
+    forbidden = guest_client.patch(
+        f"/api/events/{event.id}/participants",
+        {"updates": [{"id": participations[1].id, "notes": "x"}]},
+        format="json",
+    )
+    assert forbidden.status_code == 403
+
+
 @pytest.mark.django_db
 def test_poll_voting_constraints_single_vs_multiple_choice():
     owner = User.objects.create_user(username="owner", password="password123", email="owner@example.com")
@@ -326,6 +825,37 @@ def test_register_and_login():
     assert "access" in refresh.data
 
 
+@pytest.mark.django_db
+def test_registration_and_login_link_pending_email_invitations():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    event = Event.objects.create(owner=owner, location="Hall", starts_at=timezone.now() + timedelta(days=1))
+    owner_client = APIClient()
+    owner_client.force_authenticate(user=owner)
+    owner_client.post(f"/api/events/{event.id}/invites", {"emails": ["late@x.com"]}, format="json")
+
+    client = APIClient()
+    reg = client.post(
+        "/api/auth/register",
+        {"username": "late", "email": "Late@X.com", "password": "securepass123"},
+        format="json",
+    )
+    assert reg.status_code == 201
+    invitation = Invitation.objects.get(event=event)
+    assert invitation.invitee_user_id == reg.data["id"]
+    assert EventMembership.objects.filter(event=event, user_id=reg.data["id"]).exists()
+
+    other_event = Event.objects.create(owner=owner, location="Park", starts_at=timezone.now() + timedelta(days=2))
+    Invitation.objects.create(
+        event=other_event,
+        invitee_email="late@x.com",
+        token_hash="c" * 64,
+        expires_at=timezone.now() + timedelta(hours=1),
+    )
+    login = client.post("/api/auth/token", {"username": "late", "password": "securepass123"}, format="json")
+    assert login.status_code == 200
+    assert Invitation.objects.get(event=other_event).invitee_user_id == reg.data["id"]
+
+
 @pytest.mark.django_db
 def test_register_duplicate_username():
     client = APIClient()
@@ -381,6 +911,376 @@ def test_event_visible_only_to_owner_and_participants():
     assert all(e["id"] != event_id for e in stranger_list.data["results"])
 
 
+@pytest.mark.django_db
+def test_event_list_uses_membership_table_for_email_invites():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    guest = User.objects.create_user(username="guest", password="password123", email="Guest@X.com")
+
+    owner_client = APIClient()
+    owner_client.force_authenticate(user=owner)
+    guest_client = APIClient()
+    guest_client.force_authenticate(user=guest)
+
+    ev = owner_client.post(
+        "/api/events",
+        {"title": "Invite Only", "location": "Home", "starts_at": _iso(timezone.now() + timedelta(days=1))},
+        format="json",
+    )
+    event_id = ev.data["id"]
+    assert EventMembership.objects.get(event_id=event_id, user=owner).access_kind == EventAccessKind.OWNER
+
+    owner_client.post(f"/api/events/{event_id}/invites", {"emails": ["guest@x.com"]}, format="json")
+    membership = EventMembership.objects.get(event_id=event_id, user=guest)
+    assert membership.access_kind == EventAccessKind.INVITEE
+    assert membership.valid_until is not None
+    assert [e["id"] for e in guest_client.get("/api/events").data["results"]] == [event_id]
+
+    # Memberships backed by an expired invitation drop out of the list.
+    EventMembership.objects.filter(event_id=event_id, user=guest).update(
+        valid_until=timezone.now() - timedelta(minutes=1)
+    )
+    assert guest_client.get("/api/events").data["count"] == 0
+
+    Invitation.objects.filter(event_id=event_id).update(expires_at=timezone.now() - timedelta(minutes=1))
+    EventMembership.objects.all().delete()
+    call_command("backfill_event_memberships")
+    assert EventMembership.objects.filter(event_id=event_id, user=owner).exists()
+    assert not EventMembership.objects.filter(event_id=event_id, user=guest).exists()
+
+
+@pytest.mark.django_db
+def test_nested_event_views_resolve_event_and_role_in_one_query(django_assert_num_queries):
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    guest = User.objects.create_user(username="guest", password="password123", email="guest@x.com")
+    event = Event.objects.create(owner=owner, location="Hall", starts_at=timezone.now() + timedelta(days=1))
+    Participation.objects.create(event=event, user=guest, rsvp_status=RSVPStatus.ACCEPTED)
+
+    client = APIClient()
+    client.force_authenticate(user=guest)
+    # ATOMIC_REQUESTS savepoint pair, event/role resolution and the (empty) page count.
+    with django_assert_num_queries(4) as first:
+        response = client.get(f"/api/events/{event.id}/documents")
+    assert response.status_code == 200
+    assert "EXISTS" in next(q["sql"] for q in first.captured_queries if 'FROM "events_event"' in q["sql"])
+    # Repeat requests take the role from the access cache and skip the EXISTS checks.
+    with django_assert_num_queries(4) as repeat:
+        response = client.get(f"/api/events/{event.id}/documents")
+    assert response.status_code == 200
+    assert "EXISTS" not in next(q["sql"] for q in repeat.captured_queries if 'FROM "events_event"' in q["sql"])
+    assert response.wsgi_request.hive_event_role == EventAccessKind.PARTICIPANT
+
+    response = client.post(f"/api/events/{event.id}/comments", {"text": "Hi"}, format="json")
+    assert response.status_code == 201
+    assert response.wsgi_request.hive_event.id == event.id
+    assert response.wsgi_request.hive_event_role == EventAccessKind.PARTICIPANT
+
+
+@pytest.mark.django_db
+def test_access_decisions_are_cached_and_invalidated_by_signals(django_assert_num_queries):
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    guest = User.objects.create_user(username="guest", password="password123", email="guest@x.com")
+    event = Event.objects.create(owner=owner, location="Hall", starts_at=timezone.now() + timedelta(days=1))
+
+    assert can_user_access_event(event, guest) is False
+    with django_assert_num_queries(0):
+        assert can_user_access_event(event, guest) is False
+
+    invitation = Invitation.objects.create(
+        event=event,
+        invitee_email="guest@x.com",
+        token_hash="a" * 64,
+        expires_at=timezone.now() + timedelta(hours=1),
+    )
+    assert can_user_access_event(event, guest) is True
+    with django_assert_num_queries(0):
+        assert can_user_access_event(event, guest) is True
+
+    invitation.delete()
+    assert can_user_access_event(event, guest) is False
+
+    # The cached "owner" kind is dropped when the event changes hands.
+    assert resolve_event_for_user(event.id, owner).access_kind == EventAccessKind.OWNER
+    event.owner = guest
+    event.save()
+    assert resolve_event_for_user(event.id, owner).access_kind is None
+    assert resolve_event_for_user(event.id, guest).access_kind == EventAccessKind.OWNER
+
+
+@pytest.mark.django_db
+def test_rows_created_outside_the_services_get_memberships():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    guest = User.objects.create_user(username="guest", password="password123", email="guest@x.com")
+    member = User.objects.create_user(username="member", password="password123", email="member@x.com")
+    event = Event.objects.create(owner=owner, location="Hall", starts_at=timezone.now() + timedelta(days=1))
+    invitation = Invitation.objects.create(
+        event=event,
+        invitee_email="Guest@x.com",
+        token_hash="orm-token",
+        expires_at=timezone.now() + timedelta(days=1),
+    )
+    Participation.objects.create(event=event, user=member)
+
+    for user in (owner, guest, member):
+        client = APIClient()
+        client.force_authenticate(user=user)
+        assert client.get(f"/api/events/{event.id}").status_code == 200
+        assert [row["id"] for row in client.get("/api/events").data["results"]] == [event.id]
+
+    # Declining through the admin or ORM ends the invitation's access too.
+    invitation.status = "declined"
+    invitation.save()
+    client.force_authenticate(user=guest)
+    assert client.get("/api/events").data["count"] == 0
+
+
+@pytest.mark.django_db
+def test_deleting_invitations_and_participations_removes_memberships():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    guest = User.objects.create_user(username="guest", password="password123", email="guest@x.com")
+    member = User.objects.create_user(username="member", password="password123", email="member@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    event_id = client.post(
+        "/api/events",
+        {"location": "Hall", "starts_at": _iso(timezone.now() + timedelta(days=1))},
+        format="json",
+    ).data["id"]
+    client.post(f"/api/events/{event_id}/invites", {"emails": ["GUEST@x.com"]}, format="json")
+    client.post(f"/api/events/{event_id}/invites", {"user_ids": [member.id]}, format="json")
+    member_client = APIClient()
+    member_client.force_authenticate(user=member)
+    member_client.patch(f"/api/events/{event_id}/me", {"notes": "hi"}, format="json")
+    guest_client = APIClient()
+    guest_client.force_authenticate(user=guest)
+    assert guest_client.get("/api/events").data["count"] == 1
+
+    Invitation.objects.get(event_id=event_id, invitee_email="guest@x.com").delete()
+    assert guest_client.get("/api/events").data["count"] == 0
+    assert guest_client.get(f"/api/events/{event_id}").status_code == 403
+
+    Invitation.objects.filter(event_id=event_id, invitee_user=member).delete()
+    assert member_client.get("/api/events").data["count"] == 1
+    Participation.objects.get(event_id=event_id, user=member).delete()
+    assert member_client.get("/api/events").data["count"] == 0
+
+    # Cascades from the event itself must not recreate membership rows.
+    Event.objects.get(pk=event_id).delete()
+    assert not EventMembership.objects.filter(event_id=event_id).exists()
+
+
+@pytest.mark.django_db
+def test_invitation_email_lookups_use_normalized_column():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    guest = User.objects.create_user(username="guest", password="password123", email="GUEST@x.com")
+    event = Event.objects.create(owner=owner, location="Hall", starts_at=timezone.now() + timedelta(days=1))
+
+    invitation = Invitation.objects.create(
+        event=event,
+        invitee_email="Guest@X.com",
+        token_hash="b" * 64,
+        expires_at=timezone.now() + timedelta(hours=1),
+    )
+    assert invitation.invitee_email_normalized == "guest@x.com"
+    assert can_user_access_event(event, guest) is True
+
+    invitation.invitee_email = "someone-else@x.com"
+    invitation.save(update_fields=["invitee_email"])
+    invitation.refresh_from_db()
+    assert invitation.invitee_email_normalized == "someone-else@x.com"
+    assert can_user_access_event(event, guest) is False
+
+
+@pytest.mark.django_db
+def test_create_invitations_writes_in_bulk():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    guest = User.objects.create_user(username="guest", password="password123", email="Guest@x.com")
+    event = Event.objects.create(owner=owner, location="Hall", starts_at=timezone.now() + timedelta(days=1))
+
+    def invite(emails, user_ids=()):
+        with CaptureQueriesContext(connection) as queries:
+            created = create_invitations(event=event, created_by=owner, emails=emails, user_ids=list(user_ids))
+        return created, len(queries.captured_queries)
+
+    first, small = invite([f"a{i}@x.com" for i in range(5)] + ["GUEST@x.com"])
+    assert Invitation.objects.get(invitee_email_normalized="guest@x.com").invitee_user_id is None
+    assert can_user_access_event(event, guest) is True
+
+    emails = [f"a{i}@x.com" for i in range(200)] + ["guest@x.com"]
+    second, large = invite(emails, user_ids=[guest.id])
+    # SQLite splits the INSERT by its parameter limit; nothing runs per invitee.
+    assert small < large < 20
+    assert len(second) == 201
+    assert Invitation.objects.filter(event=event).count() == 201
+
+    # The guest's email-only invitation is claimed and re-issued once.
+    guest_invitation = Invitation.objects.get(event=event, invitee_user=guest)
+    assert guest_invitation.invitee_email_normalized == "guest@x.com"
+    reissued = {entry["invitation"].id: entry["token"] for entry in second}
+    old_token = first[0]["token"]
+    assert reissued[first[0]["invitation"].id] != old_token
+    assert not Invitation.objects.filter(token_hash=hash_invitation_token(old_token)).exists()
+    new_row = next(entry for entry in second if entry["invitation"].invitee_email == "a150@x.com")
+    assert Invitation.objects.get(token_hash=hash_invitation_token(new_row["token"])).id == new_row["invitation"].id
+
+
+@pytest.mark.django_db
+def test_invitation_emails_are_sent_in_batches_after_commit(settings, monkeypatch, django_capture_on_commit_callbacks):
+    settings.INVITATION_EMAIL_DELIVERY = "sync"
+    settings.INVITATION_EMAIL_BATCH_SIZE = 2
+    settings.INVITATION_EMAIL_MAX_ATTEMPTS = 2
+    settings.INVITATION_EMAIL_RETRY_DELAY = 0
+    settings.INVITATION_URL_TEMPLATE = "https://hive.test/invites/{token}"
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    event = Event.objects.create(owner=owner, title="Potluck", location="Hall", starts_at=timezone.now())
+
+    calls = []
+    send_messages = locmem.EmailBackend.send_messages
+
+    def flaky_send_messages(backend, messages):
+        recipient = messages[0].to[0]
+        calls.append(recipient)
+        if len(calls) == 2:
+            raise ConnectionError("relay hiccup")
+        if recipient == "guest3@x.com":
+            raise smtplib.SMTPRecipientsRefused({recipient: (550, b"No such user")})
+        return send_messages(backend, messages)
+
+    monkeypatch.setattr(locmem.EmailBackend, "send_messages", flaky_send_messages)
+    emails = [f"guest{i}@x.com" for i in range(5)]
+    with django_capture_on_commit_callbacks(execute=False) as callbacks:
+        response = client.post(f"/api/events/{event.id}/invites", {"emails": emails}, format="json")
+    assert response.status_code == 201
+    assert mail.outbox == []
+    assert {row["invitation"]["delivery_status"] for row in response.data["results"]} == {"queued"}
+
+    for callback in callbacks:
+        callback()
+    # Only unsent messages are retried, and a refused address fails alone.
+    assert [call[:6] for call in calls] == ["guest0", "guest1", "guest1", "guest2", "guest3", "guest3", "guest4"]
+    assert [message.to[0][:6] for message in mail.outbox] == ["guest0", "guest1", "guest2", "guest4"]
+    invitations = list(Invitation.objects.filter(event=event).order_by("id"))
+    assert [invitation.delivery_status for invitation in invitations] == ["sent", "sent", "sent", "failed", "sent"]
+    assert [invitation.delivery_attempts for invitation in invitations] == [1, 2, 1, 2, 1]
+    assert invitations[3].delivery_error.startswith("SMTPRecipientsRefused")
+
+    token = mail.outbox[0].body.split("https://hive.test/invites/")[1].split()[0]
+    assert Invitation.objects.get(token_hash=hash_invitation_token(token)).invitee_email == mail.outbox[0].to[0]
+
+    # Failed deliveries are re-issued with a fresh token by the resend command;
+    # delivered ones keep the token their recipients already have.
+    monkeypatch.undo()
+    call_command("resend_invitation_emails")
+    resent = Invitation.objects.get(id=invitations[3].id)
+    assert resent.delivery_status == "sent" and resent.delivery_attempts == 3
+    assert len(mail.outbox) == 5 and mail.outbox[-1].to == ["guest3@x.com"]
+    assert Invitation.objects.filter(token_hash=hash_invitation_token(token)).exists()
+
+
+def test_invitation_email_sender_drains_outboxes_from_one_thread(settings, monkeypatch):
+    settings.INVITATION_EMAIL_DELIVERY = "thread"
+    received, done = [], threading.Event()
+
+    def fake_send(outbox, connection=None):
+        received.append((outbox, threading.current_thread().name, connection))
+        if len(received) == 3:
+            done.set()
+
+    monkeypatch.setattr(delivery, "send_invitation_emails", fake_send)
+    sender = delivery.InvitationEmailSender(max_pending=1)
+    for outbox in (["a"], [], ["b"], ["c"]):
+        sender.send(outbox)
+    sender.close()
+    assert done.wait(timeout=5)
+    assert [outbox for outbox, _, _ in received] == [["a"], ["b"], ["c"]]
+    assert {(name, connection) for _, name, connection in received} == {("invitation-email", received[0][2])}
+
+
+@pytest.mark.django_db
+def test_invite_import_streams_csv_and_ndjson_uploads(settings, monkeypatch, django_capture_on_commit_callbacks):
+    settings.INVITE_IMPORT_CHUNK_SIZE = 2
+    settings.INVITATION_EMAIL_DELIVERY = "sync"
+    # Forces the upload onto a temporary file, as for large imports.
+    settings.FILE_UPLOAD_MAX_MEMORY_SIZE = 16
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    event = Event.objects.create(owner=owner, location="Hall", starts_at=timezone.now() + timedelta(days=1))
+    url = f"/api/events/{event.id}/invites/import"
+
+    csv_body = "name,Email\nAda,ada@x.com\nBob,not-an-email\nAda again,ADA@x.com\n\nCy,cy@x.com\nDee,dee@x.com\nEve,\n"
+    sends = []
+    send = delivery.send_invitation_emails
+
+    def record_send(outbox, connection=None):
+        sends.append((len(outbox), connection))
+        return send(outbox, connection=connection)
+
+    monkeypatch.setattr(delivery, "send_invitation_emails", record_send)
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.post(
+            url,
+            {"file": SimpleUploadedFile("guests.csv", csv_body.encode(), content_type="text/csv")},
+            format="multipart",
+        )
+    assert response.status_code == 200
+    assert {key: response.data[key] for key in ("rows", "invited", "duplicates", "error_count")} == {
+        "rows": 6,
+        "invited": 3,
+        "duplicates": 1,
+        "error_count": 2,
+    }
+    assert [(error["row"], error["error"]) for error in response.data["errors"]] == [
+        (3, "Enter a valid email address."),
+        (8, "Missing email."),
+    ]
+    assert set(Invitation.objects.filter(event=event).values_list("invitee_email", flat=True)) == {
+        "ada@x.com",
+        "cy@x.com",
+        "dee@x.com",
+    }
+    assert sorted(message.to[0] for message in mail.outbox) == ["ada@x.com", "cy@x.com", "dee@x.com"]
+    # Each chunk is sent as it commits, both over the sender's one connection.
+    assert [size for size, _ in sends] == [2, 1]
+    assert sends[0][1] is not None and sends[0][1] is sends[1][1]
+    assert set(Invitation.objects.filter(event=event).values_list("delivery_status", flat=True)) == {"sent"}
+
+    ndjson_body = '{"email": "fay@x.com"}\n"gus@x.com"\n{oops\n{"email": "cy@x.com"}\n'
+    response = client.post(
+        url,
+        {
+            "file": SimpleUploadedFile("guests.jsonl", ndjson_body.encode()),
+            "send_email": False,
+        },
+        format="multipart",
+    )
+    assert response.status_code == 200
+    assert (response.data["invited"], response.data["errors"]) == (
+        3,
+        [{"row": 3, "value": None, "error": "Invalid JSON."}],
+    )
+    assert Invitation.objects.filter(event=event).count() == 5
+
+    oversized = "email\nhal@x.com\n" + "x" * 200_000 + "\nivy@x.com\n"
+    response = client.post(
+        url,
+        {"file": SimpleUploadedFile("guests.csv", oversized.encode()), "send_email": False},
+        format="multipart",
+    )
+    assert response.status_code == 200
+    assert (response.data["rows"], response.data["invited"]) == (3, 2)
+    assert [(error["row"], error["value"]) for error in response.data["errors"]] == [(3, None)]
+    assert response.data["errors"][0]["error"].startswith("Could not parse row: field larger than field limit")
+
+    missing_column = client.post(
+        url,
+        {"file": SimpleUploadedFile("guests.csv", b"name,phone\nAda,123\n")},
+        format="multipart",
+    )
+    assert missing_column.status_code == 400
+
+
 # ---------------------------------------------------------------------------
 # Event Description Field Tests
 # ---------------------------------------------------------------------------
@@ -415,6 +1315,194 @@ def test_event_description_field():
     assert patch.data["description"] == "Updated description."
 
 
+@pytest.mark.django_db
+def test_event_search_matches_description():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    starts_at = _iso(timezone.now() + timedelta(days=1))
+    client.post(
+        "/api/events",
+        {"title": "Board games", "location": "Berlin", "description": "Bring Catan", "starts_at": starts_at},
+        format="json",
+    )
+    client.post("/api/events", {"title": "Picnic", "location": "Park", "starts_at": starts_at}, format="json")
+
+    response = client.get("/api/events", {"search": "catan"})
+    assert response.status_code == 200
+    assert [e["title"] for e in response.data["results"]] == ["Board games"]
+
+
+def test_cursor_pagination_keeps_search_rank_order(monkeypatch):
+    view = EventListCreateView()
+    queryset = Event.objects.all()
+    paginator = HivePagination()
+
+    def ordering(params):
+        return paginator.get_cursor_ordering(Request(APIRequestFactory().get("/api/events", params)), queryset, view)
+
+    monkeypatch.setattr(connection, "vendor", "postgresql")
+    assert ordering({"search": "launch", "pagination": "cursor"}) == ("-search_rank", "starts_at", "id")
+    # An explicit ?ordering= or no search term keeps the view's keyset ordering.
+    assert ordering({"search": "launch", "ordering": "-created_at"}) == view.cursor_ordering
+    assert ordering({"pagination": "cursor"}) == view.cursor_ordering
+    monkeypatch.undo()
+    # Substring search on other backends has no rank to keep.
+    assert ordering({"search": "launch"}) == view.cursor_ordering
+
+
+@pytest.mark.django_db
+def test_event_calendar_returns_overlapping_visible_events():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    stranger = User.objects.create_user(username="stranger", password="password123", email="s@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    base = timezone.now().replace(microsecond=0) + timedelta(days=10)
+    for title, starts_at, ends_at in [
+        ("Before", base - timedelta(days=3), base - timedelta(days=2)),
+        ("Spanning", base - timedelta(days=1), base + timedelta(hours=2)),
+        ("Inside", base + timedelta(days=1), None),
+        ("After", base + timedelta(days=8), None),
+    ]:
+        payload = {"title": title, "location": "Somewhere", "starts_at": _iso(starts_at)}
+        if ends_at:
+            payload["ends_at"] = _iso(ends_at)
+        client.post("/api/events", payload, format="json")
+
+    window = {"from": _iso(base), "to": _iso(base + timedelta(days=7))}
+    response = client.get("/api/events/calendar", window)
+    assert response.status_code == 200
+    assert [e["title"] for e in response.data] == ["Spanning", "Inside"]
+    assert set(response.data[0]) == {"id", "title", "location", "starts_at", "ends_at", "original_start"}
+
+    stranger_client = APIClient()
+    stranger_client.force_authenticate(user=stranger)
+    assert stranger_client.get("/api/events/calendar", window).data == []
+
+    assert client.get("/api/events/calendar", {"from": window["to"], "to": window["from"]}).status_code == 400
+    too_long = {"from": window["from"], "to": _iso(base + timedelta(days=365))}
+    assert client.get("/api/events/calendar", too_long).status_code == 400
+
+
+@pytest.mark.django_db
+def test_event_list_sparse_fieldsets_defer_unrequested_columns():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    client.post(
+        "/api/events",
+        {
+            "title": "Launch",
+            "location": "Roof",
+            "description": "x" * 5000,
+            "metadata": {"theme": "space"},
+            "starts_at": _iso(timezone.now() + timedelta(days=1)),
+        },
+        format="json",
+    )
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/api/events", {"fields": "id,title,starts_at", "pagination": "cursor"})
+    assert response.status_code == 200
+    assert list(response.data["results"][0]) == ["id", "title", "starts_at"]
+    event_query = next(q["sql"] for q in queries if 'FROM "events_event"' in q["sql"])
+    assert '"events_event"."description"' not in event_query
+    assert '"events_event"."metadata"' not in event_query
+
+    # next_occurrence is a method field; its declared sources keep deferral working.
+    with CaptureQueriesContext(connection) as queries:
+        omitted = client.get("/api/events", {"omit": "description,metadata"}).data["results"][0]
+    assert "description" not in omitted and omitted["title"] == "Launch"
+    assert omitted["next_occurrence"] is not None
+    event_query = next(q["sql"] for q in queries if q["sql"].startswith('SELECT "events_event"'))
+    assert '"events_event"."description"' not in event_query
+    assert '"events_event"."metadata"' not in event_query
+    assert '"events_event"."recurrence_frequency"' in event_query
+    assert client.get("/api/events", {"fields": "nope"}).status_code == 400
+    assert "description" in client.get("/api/events").data["results"][0]
+
+
+@pytest.mark.django_db
+def test_recurring_event_expands_lazily_with_overrides(settings):
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    base = (timezone.now() + timedelta(days=1)).replace(microsecond=0)
+    created = client.post(
+        "/api/events",
+        {
+            "title": "Meetup",
+            "location": "Cafe",
+            "starts_at": _iso(base),
+            "ends_at": _iso(base + timedelta(hours=2)),
+            "recurrence_frequency": "weekly",
+            "recurrence_count": 10,
+        },
+        format="json",
+    )
+    assert created.status_code == 201
+    event_id = created.data["id"]
+    assert Event.objects.count() == 1
+
+    overrides_url = f"/api/events/{event_id}/occurrence-overrides"
+    cancel = client.post(overrides_url, {"original_start": _iso(base + timedelta(weeks=1)), "cancelled": True}, format="json")
+    assert cancel.status_code == 201
+    moved = {
+        "original_start": _iso(base + timedelta(weeks=2)),
+        "starts_at": _iso(base + timedelta(weeks=2, days=1)),
+        "title": "Meetup (moved)",
+    }
+    assert client.post(overrides_url, moved, format="json").status_code == 201
+    off_grid = client.post(overrides_url, {"original_start": _iso(base + timedelta(days=1)), "cancelled": True}, format="json")
+    assert off_grid.status_code == 400
+
+    window = {"from": _iso(base - timedelta(hours=1)), "to": _iso(base + timedelta(weeks=3))}
+    calendar = client.get("/api/events/calendar", window).data
+    assert [(entry["title"], entry["starts_at"]) for entry in calendar] == [
+        ("Meetup", _iso(base)),
+        ("Meetup (moved)", _iso(base + timedelta(weeks=2, days=1))),
+    ]
+    assert calendar[1]["ends_at"] == _iso(base + timedelta(weeks=2, days=1, hours=2))
+    # Occurrences past recurrence_count are never produced.
+    late = {"from": _iso(base + timedelta(weeks=10)), "to": _iso(base + timedelta(weeks=12))}
+    assert client.get("/api/events/calendar", late).data == []
+
+    listed = client.get("/api/events").data["results"][0]
+    assert listed["next_occurrence"] == _iso(base)
+
+    settings.TIME_ZONE = "Europe/Berlin"
+    series = Event(
+        starts_at=datetime(2026, 3, 25, 18, 0, tzinfo=ZoneInfo("UTC")),
+        recurrence_frequency="weekly",
+        recurrence_interval=1,
+    )
+    # 19:00 Berlin time before and after the switch to summer time.
+    assert recurrence.nth_start(series, 1).astimezone(ZoneInfo("UTC")).hour == 17
+
+
+@pytest.mark.django_db
+def test_recurrence_rules_past_the_supported_date_range_are_rejected():
+    owner = User.objects.create_user(username="owner", password="password123", email="owner@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    base = {"location": "Park", "starts_at": _iso(timezone.now() + timedelta(days=1))}
+
+    for rule in (
+        {"recurrence_frequency": "monthly", "recurrence_count": 100000},
+        {"recurrence_frequency": "daily", "recurrence_count": 2000000000},
+    ):
+        response = client.post("/api/events", {**base, **rule}, format="json")
+        assert response.status_code == 400
+        assert "recurrence_count" in response.data["error"]["detail"]
+    too_sparse = {"recurrence_frequency": "monthly", "recurrence_interval": recurrence.MAX_INTERVAL + 1}
+    assert client.post("/api/events", {**base, **too_sparse}, format="json").status_code == 400
+
+    event_id = client.post("/api/events", {**base, "recurrence_frequency": "monthly"}, format="json").data["id"]
+    patched = client.patch(f"/api/events/{event_id}", {"recurrence_count": 100000}, format="json")
+    assert patched.status_code == 400
+    assert Event.objects.get(pk=event_id).recurrence_count is None
+
+
 # ---------------------------------------------------------------------------
 # Invitation Permission Tests
 # ---------------------------------------------------------------------------
@@ -523,6 +1611,31 @@ def test_comment_crud_and_replies():
     assert stranger_client.get(f"/api/events/{event.id}/comments").status_code == 403
 
 
+@pytest.mark.django_db
+def test_comment_list_cursor_pagination_skips_count():
+    owner = User.objects.create_user(username="owner", password="password123", email="o@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    event = Event.objects.create(owner=owner, location="Café", starts_at=timezone.now() + timedelta(days=1))
+    Comment.objects.bulk_create([Comment(event=event, user=owner, text=f"c{i}") for i in range(25)])
+
+    first = client.get(f"/api/events/{event.id}/comments", {"pagination": "cursor"})
+    assert first.status_code == 200
+    assert "count" not in first.data
+    assert len(first.data["results"]) == 20
+    assert first.data["previous"] is None
+
+    second = client.get(first.data["next"])
+    assert second.status_code == 200
+    assert len(second.data["results"]) == 5
+    assert second.data["next"] is None
+    seen = [c["id"] for c in first.data["results"] + second.data["results"]]
+    assert seen == sorted(seen)
+
+    # Default mode stays page-number based.
+    assert client.get(f"/api/events/{event.id}/comments").data["count"] == 25
+
+
 # ---------------------------------------------------------------------------
 # Reaction Tests
 # ---------------------------------------------------------------------------
@@ -668,6 +1781,96 @@ def test_custom_field_enum_validation():
     assert bad2.status_code == 400
 
 
+@pytest.mark.django_db
+def test_custom_field_answers_are_saved_in_one_upsert(django_assert_num_queries):
+    owner = User.objects.create_user(username="owner", password="password123", email="o@x.com")
+    event = Event.objects.create(owner=owner, location="Hall", starts_at=timezone.now() + timedelta(days=1))
+    participation = Participation.objects.create(event=event, user=owner, rsvp_status=RSVPStatus.ACCEPTED)
+    CustomFieldDefinition.objects.bulk_create(
+        [
+            CustomFieldDefinition(event=event, key=f"q{i}", label=f"Q{i}", field_type=CustomFieldType.NUMBER)
+            for i in range(20)
+        ]
+    )
+
+    # Savepoint, definitions, upsert, release; later saves reuse the compiled schema.
+    with django_assert_num_queries(4):
+        save_custom_field_answers(event, participation, {f"q{i}": i for i in range(20)})
+    with django_assert_num_queries(3):
+        save_custom_field_answers(event, participation, {"q0": 100, "q1": 101})
+
+    values = dict(participation.custom_field_values.values_list("definition__key", "value"))
+    assert len(values) == 20
+    assert (values["q0"], values["q1"], values["q2"]) == (100, 101, 2)
+
+    with pytest.raises(ValidationError) as excinfo:
+        save_custom_field_answers(event, participation, {"q0": 1, "q1": "many"})
+    assert "q1" in excinfo.value.detail
+    assert participation.custom_field_values.get(definition__key="q0").value == 100
+
+
+@pytest.mark.django_db
+def test_custom_field_schema_is_cached_per_definitions_version():
+    owner = User.objects.create_user(username="owner", password="password123", email="o@x.com")
+    client = APIClient()
+    client.force_authenticate(user=owner)
+    event = Event.objects.create(owner=owner, location="Hall", starts_at=timezone.now() + timedelta(days=1))
+    client.post(
+        f"/api/events/{event.id}/custom-fields",
+        {"key": "diet", "label": "Diet", "field_type": "enum", "options": ["vegan", "meat"]},
+        format="json",
+    )
+    event.refresh_from_db()
+    assert event.custom_fields_version == 1
+
+    url = f"/api/events/{event.id}/me"
+    assert client.patch(url, {"custom_field_answers": {"diet": "vegan"}}, format="json").status_code == 200
+    with CaptureQueriesContext(connection) as queries:
+        bad = client.patch(url, {"custom_field_answers": {"diet": "fish"}}, format="json")
+    assert bad.status_code == 400
+    assert bad.data["error"]["detail"] == {"diet": "Value is not in allowed options."}
+    assert not any("events_customfielddefinition" in query["sql"] for query in queries.captured_queries)
+
+    # A full save of a stale instance must not roll the version back.
+    stale = Event.objects.get(pk=event.pk)
+    client.post(
+        f"/api/events/{event.id}/custom-fields",
+        {"key": "drives", "label": "Drives", "field_type": "bool"},
+        format="json",
+    )
+    stale.location = "Garden"
+    stale.save()
+    event.refresh_from_db()
+    assert (event.location, event.custom_fields_version) == ("Garden", 2)
+    response = client.patch(url, {"custom_field_answers": {"drives": True}}, format="json")
+    assert response.status_code == 200
+
+
+@pytest.mark.django_db
+def test_replace_contributions_writes_only_the_difference(django_assert_num_queries):
+    owner = User.objects.create_user(username="owner", password="password123", email="o@x.com")
+    event = Event.objects.create(owner=owner, location="Hall", starts_at=timezone.now() + timedelta(days=1))
+    participation = Participation.objects.create(event=event, user=owner, rsvp_status=RSVPStatus.ACCEPTED)
+    items = [{"item_name": "Beer", "quantity": 6}, {"item_name": "Chips"}, {"item_name": "Salad", "notes": "green"}]
+    replace_contributions(event, participation, items)
+    ids = dict(participation.contributions.values_list("item_name", "id"))
+
+    # Savepoint, select, release: nothing is written.
+    with django_assert_num_queries(3):
+        replace_contributions(event, participation, items)
+
+    replace_contributions(
+        event,
+        participation,
+        [{"item_name": "beer", "quantity": 12}, {"item_name": "Salad", "notes": "green"}, {"item_name": "Cake"}],
+    )
+    rows = {item.item_name: item for item in participation.contributions.all()}
+    assert set(rows) == {"beer", "Salad", "Cake"}
+    assert rows["beer"].id == ids["Beer"] and rows["beer"].quantity == 12
+    assert rows["Salad"].id == ids["Salad"]
+    assert rows["Cake"].id not in ids.values()
+
+
 # ---------------------------------------------------------------------------
 # Poll Results Test
 # ---------------------------------------------------------------------------
@@ -729,3 +1932,15 @@ def test_contribution_list():
     resp = client.get(f"/api/events/{event.id}/contributions")
     assert resp.status_code == 200
     assert resp.data["count"] >= 1
+
+
+# ---------------------------------------------------------------------------
+# OpenAPI Schema Tests
+# ---------------------------------------------------------------------------
+
+
+def test_committed_schema_matches_the_api(tmp_path, settings):
+    # Regenerate with: python manage.py spectacular --file schema.yaml
+    generated = tmp_path / "schema.yaml"
+    call_command("spectacular", "--file", str(generated))
+    assert generated.read_text() == (settings.BASE_DIR / "schema.yaml").read_text()